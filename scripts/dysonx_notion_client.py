@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Shared Notion database query client for DysonX Notion readers.
+
+The collector, the public Signals sync, and the read-only source adapter all
+page through `databases/{id}/query` and flatten page properties into plain
+records. This module is the one implementation of that loop:
+
+- properties are decoded through a plan compiled from the property names and
+  types seen on the first page (and recompiled per property if its type
+  changes), so each value goes straight to its decoder instead of walking the
+  type chain;
+- pagination is pipelined: as soon as a response arrives the request for the
+  next cursor is sent from a background thread while the current page is
+  decoded;
+- optional server-side filters (`Published` / `Ready for Pipeline`, edit
+  watermarks) are pushed into the query payload so Notion does the filtering.
+
+Connection reuse and rate-limit pacing live in the shared transport.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+
+
+NOTION_VERSION = "2022-06-28"
+NOTION_PAGE_SIZE = 100
+
+# (url, headers, payload) -> decoded JSON response
+NotionQueryTransport = Callable[[str, dict[str, str], dict[str, Any]], dict[str, Any]]
+PropertyDecoder = Callable[[dict[str, Any]], Any]
+
+
+def notion_headers(token: str, notion_version: str = NOTION_VERSION) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+        "Notion-Version": notion_version,
+    }
+
+
+def normalize_text(value: Any) -> str:
+    if value is None:
+        return ""
+    return " ".join(str(value).split())
+
+
+def notion_plain_text(items: list[dict[str, Any]] | None) -> str:
+    if not items:
+        return ""
+    return "".join(str(item.get("plain_text") or "") for item in items)
+
+
+def _named_option(key: str) -> PropertyDecoder:
+    def decode(property_value: dict[str, Any]) -> Any:
+        selected = property_value.get(key)
+        return selected.get("name") if isinstance(selected, dict) else ""
+
+    return decode
+
+
+def _multi_select(property_value: dict[str, Any]) -> Any:
+    values = property_value.get("multi_select")
+    if not isinstance(values, list):
+        return []
+    return [str(item.get("name")) for item in values if isinstance(item, dict) and item.get("name")]
+
+
+def _date(empty: Any) -> PropertyDecoder:
+    def decode(property_value: dict[str, Any]) -> Any:
+        date_value = property_value.get("date")
+        return date_value.get("start") if isinstance(date_value, dict) else empty
+
+    return decode
+
+
+def _formula(property_value: dict[str, Any]) -> Any:
+    formula = property_value.get("formula")
+    if isinstance(formula, dict):
+        return formula.get(formula.get("type", ""), "")
+    return None
+
+
+def _unsupported(property_value: dict[str, Any]) -> Any:
+    return None
+
+
+PROPERTY_DECODERS: dict[str, PropertyDecoder] = {
+    "title": lambda property_value: notion_plain_text(property_value.get("title")),
+    "rich_text": lambda property_value: notion_plain_text(property_value.get("rich_text")),
+    "select": _named_option("select"),
+    "status": _named_option("status"),
+    "multi_select": _multi_select,
+    "url": lambda property_value: property_value.get("url") or "",
+    "number": lambda property_value: property_value.get("number"),
+    "checkbox": lambda property_value: bool(property_value.get("checkbox")),
+    "date": _date(""),
+    "formula": _formula,
+}
+
+
+class NotionPageDecoder:
+    """Flatten Notion pages into records through a compiled property plan.
+
+    `property_types` limits which Notion types are decoded (others become
+    None), `empty_date` is the value for an unset date, and `page_fields` maps
+    record keys to page-level attributes copied alongside the properties.
+    """
+
+    def __init__(
+        self,
+        error_class: type[Exception],
+        *,
+        property_types: Iterable[str] | None = None,
+        empty_date: Any = "",
+        page_fields: tuple[tuple[str, str], ...] = (("_notion_page_id", "id"),),
+    ):
+        self.error_class = error_class
+        types = PROPERTY_DECODERS if property_types is None else property_types
+        self.decoders = {property_type: PROPERTY_DECODERS[property_type] for property_type in types}
+        if "date" in self.decoders:
+            self.decoders["date"] = _date(empty_date)
+        self.page_fields = page_fields
+        self._plan: dict[str, tuple[Any, PropertyDecoder]] = {}
+
+    def compile(self, name: str, property_type: Any) -> PropertyDecoder:
+        decoder = self.decoders.get(property_type, _unsupported) if isinstance(property_type, str) else _unsupported
+        self._plan[name] = (property_type, decoder)
+        return decoder
+
+    def property_value(self, property_value: dict[str, Any]) -> Any:
+        property_type = property_value.get("type")
+        decoder = self.decoders.get(property_type, _unsupported) if isinstance(property_type, str) else _unsupported
+        return decoder(property_value)
+
+    def __call__(self, page: dict[str, Any]) -> dict[str, Any]:
+        properties = page.get("properties")
+        if not isinstance(properties, dict):
+            raise self.error_class("Notion page is missing properties")
+        plan = self._plan
+        record: dict[str, Any] = {}
+        for name, property_value in properties.items():
+            if not isinstance(property_value, dict):
+                continue
+            property_type = property_value.get("type")
+            step = plan.get(name)
+            decoder = step[1] if step is not None and step[0] == property_type else self.compile(name, property_type)
+            record[name] = decoder(property_value)
+        for record_key, page_key in self.page_fields:
+            record[record_key] = normalize_text(page.get(page_key))
+        return record
+
+
+def notion_property_value(property_value: dict[str, Any]) -> Any:
+    return PROPERTY_DECODERS.get(property_value.get("type"), _unsupported)(property_value)
+
+
+def checkbox_filter(property_name: str, checked: bool = True) -> dict[str, Any]:
+    return {"property": property_name, "checkbox": {"equals": checked}}
+
+
+def published_or_ready_filter() -> dict[str, Any]:
+    """Server-side filter for rows with `Published` or `Ready for Pipeline` checked."""
+    return {"or": [checkbox_filter("Published"), checkbox_filter("Ready for Pipeline")]}
+
+
+def edited_since_filter(edited_since: str) -> dict[str, Any] | None:
+    return {"timestamp": "last_edited_time", "last_edited_time": {"on_or_after": edited_since}} if edited_since else None
+
+
+def query_database_records(
+    transport: NotionQueryTransport,
+    token: str,
+    database_id: str,
+    decode_page: Callable[[dict[str, Any]], dict[str, Any]],
+    error_class: type[Exception],
+    *,
+    query_filter: dict[str, Any] | None = None,
+    response_label: str = "Notion query response",
+    notion_version: str = NOTION_VERSION,
+    pipelined: bool = True,
+) -> list[dict[str, Any]]:
+    """Return every decoded page of a database query, in Notion's order.
+
+    With `pipelined`, the request for page N+1 is in flight on a background
+    thread while page N is decoded. Requests stay strictly sequential, so the
+    transport sees the same payloads in the same order either way.
+    """
+    url = f"https://api.notion.com/v1/databases/{database_id}/query"
+    headers = notion_headers(token, notion_version)
+    base_payload: dict[str, Any] = {"page_size": NOTION_PAGE_SIZE}
+    if query_filter:
+        base_payload["filter"] = query_filter
+    records: list[dict[str, Any]] = []
+    executor: ThreadPoolExecutor | None = None
+    try:
+        response = transport(url, headers, dict(base_payload))
+        while True:
+            results = response.get("results")
+            if not isinstance(results, list):
+                raise error_class(f"{response_label} is missing results")
+            pending: Future[dict[str, Any]] | None = None
+            next_payload: dict[str, Any] | None = None
+            if response.get("has_more") is True:
+                cursor = response.get("next_cursor")
+                if not cursor:
+                    raise error_class(f"{response_label} is missing next_cursor")
+                next_payload = {**base_payload, "start_cursor": cursor}
+                if pipelined:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notion-query")
+                    pending = executor.submit(transport, url, headers, next_payload)
+            records.extend(decode_page(page) for page in results if isinstance(page, dict))
+            if next_payload is None:
+                return records
+            response = pending.result() if pending is not None else transport(url, headers, next_payload)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -5,27 +5,35 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import functools
 import hashlib
 import html
+import itertools
 import json
 import os
 import pathlib
 import re
 import sys
-import urllib.error
-import urllib.request
+from concurrent.futures import ProcessPoolExecutor
 from html.parser import HTMLParser
 from typing import Any, Callable
 from urllib.parse import urljoin, urlsplit
 
+from dysonx_notion_client import NotionPageDecoder, published_or_ready_filter, query_database_records
+from dysonx_notion_transport import RateLimitedNotionTransport, notion_transport_stats
 from dysonx_public_signals_contract import (
     ALLOWED_ARTIFACT_CLASSES,
     ALLOWED_SAFE_EMBEDS,
     FORBIDDEN_CONTENT_CLASSES,
     PUBLIC_SIGNAL_CONTRACT_VERSION,
     PUBLIC_SIGNAL_POLICY_VERSION,
+    RESERVED_SIGNAL_SLUGS,
     build_artifact_entry,
     public_seo_base_url,
+    signals_page_number_from_public_path,
+    signals_page_public_path,
+    sitemap_shard_number_from_public_path,
+    sitemap_shard_public_path,
 )
 from dysonx_public_signals_topic_policy import (
     has_core_public_topic as topic_has_core_public_topic,
@@ -41,6 +49,10 @@ NOTION_VERSION = "2022-06-28"
 DEFAULT_OUTPUT_ROOT = pathlib.Path(".")
 PUBLIC_SAFE_SOURCE_NOTE = "Source attribution retained in Notion launch metadata; external source URL omitted for this V1 public sample."
 DEFAULT_SIGNALS_INDEX_LIMIT = 30
+DEFAULT_SIGNALS_PAGE_SIZE = 30
+# sitemaps.org limits for one sitemap file: 50,000 URLs and 50 MB uncompressed.
+SITEMAP_SHARD_URL_LIMIT = 50_000
+SITEMAP_SHARD_BYTE_LIMIT = 50 * 1024 * 1024
 DEFAULT_RSS_ITEM_LIMIT = 30
 DEFAULT_JSON_FEED_ITEM_LIMIT = 30
 PUBLIC_OUTPUT_MIN_QUALITY = 80
@@ -90,104 +102,45 @@ def escape(value: Any, *, quote: bool = False) -> str:
     return html.escape(normalize_text(value), quote=quote)
 
 
-def notion_plain_text(items: list[dict[str, Any]] | None) -> str:
-    if not items:
-        return ""
-    return "".join(str(item.get("plain_text") or "") for item in items)
+PUBLIC_SYNC_PAGE_DECODER = NotionPageDecoder(NotionPublicSignalsSyncError)
 
 
 def notion_property_value(property_value: dict[str, Any]) -> Any:
-    property_type = property_value.get("type")
-    if property_type == "title":
-        return notion_plain_text(property_value.get("title"))
-    if property_type == "rich_text":
-        return notion_plain_text(property_value.get("rich_text"))
-    if property_type == "select":
-        selected = property_value.get("select")
-        return selected.get("name") if isinstance(selected, dict) else ""
-    if property_type == "status":
-        selected = property_value.get("status")
-        return selected.get("name") if isinstance(selected, dict) else ""
-    if property_type == "multi_select":
-        values = property_value.get("multi_select")
-        if not isinstance(values, list):
-            return []
-        return [str(item.get("name")) for item in values if isinstance(item, dict) and item.get("name")]
-    if property_type == "url":
-        return property_value.get("url") or ""
-    if property_type == "number":
-        return property_value.get("number")
-    if property_type == "checkbox":
-        return bool(property_value.get("checkbox"))
-    if property_type == "date":
-        date_value = property_value.get("date")
-        return date_value.get("start") if isinstance(date_value, dict) else ""
-    if property_type == "formula":
-        formula = property_value.get("formula")
-        if isinstance(formula, dict):
-            return formula.get(formula.get("type", ""), "")
-    return None
+    return PUBLIC_SYNC_PAGE_DECODER.property_value(property_value)
 
 
 def notion_page_to_record(page: dict[str, Any]) -> dict[str, Any]:
-    properties = page.get("properties")
-    if not isinstance(properties, dict):
-        raise NotionPublicSignalsSyncError("Notion page is missing properties")
-    record = {
-        field_name: notion_property_value(property_value)
-        for field_name, property_value in properties.items()
-        if isinstance(property_value, dict)
-    }
-    record["_notion_page_id"] = normalize_text(page.get("id"))
-    return record
-
-
-def urllib_notion_transport(url: str, headers: dict[str, str], payload: dict[str, Any]) -> dict[str, Any]:
-    request = urllib.request.Request(
-        url,
-        data=json.dumps(payload).encode("utf-8"),
-        headers=headers,
-        method="POST",
+    return PUBLIC_SYNC_PAGE_DECODER(page)
+
+
+urllib_notion_transport = RateLimitedNotionTransport(error_class=NotionPublicSignalsSyncError, error_prefix="Notion query failed")
+
+
+def query_notion_records(
+    token: str,
+    database_id: str,
+    transport: NotionTransport = urllib_notion_transport,
+    query_filter: dict[str, Any] | None = None,
+) -> list[dict[str, Any]]:
+    return query_database_records(
+        transport,
+        token,
+        database_id,
+        PUBLIC_SYNC_PAGE_DECODER,
+        NotionPublicSignalsSyncError,
+        query_filter=query_filter,
+        response_label="Notion response",
+        notion_version=NOTION_VERSION,
     )
-    try:
-        with urllib.request.urlopen(request, timeout=30) as response:
-            response_body = response.read().decode("utf-8")
-    except urllib.error.URLError as exc:
-        raise NotionPublicSignalsSyncError(f"Notion query failed: {exc}") from exc
-    data = json.loads(response_body)
-    if not isinstance(data, dict):
-        raise NotionPublicSignalsSyncError("Notion query returned a non-object response")
-    return data
-
-
-def query_notion_records(token: str, database_id: str, transport: NotionTransport = urllib_notion_transport) -> list[dict[str, Any]]:
-    url = f"https://api.notion.com/v1/databases/{database_id}/query"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "Notion-Version": NOTION_VERSION,
-    }
-    payload: dict[str, Any] = {"page_size": 100}
-    records: list[dict[str, Any]] = []
-    while True:
-        response = transport(url, headers, payload)
-        results = response.get("results")
-        if not isinstance(results, list):
-            raise NotionPublicSignalsSyncError("Notion response is missing results")
-        records.extend(notion_page_to_record(page) for page in results if isinstance(page, dict))
-        if response.get("has_more") is not True:
-            return records
-        cursor = response.get("next_cursor")
-        if not cursor:
-            raise NotionPublicSignalsSyncError("Notion response is missing next_cursor")
-        payload = {"page_size": 100, "start_cursor": cursor}
 
 
 def field(record: dict[str, Any], *names: str) -> Any:
-    lowered = {key.lower(): value for key, value in record.items()}
+    lowered: dict[str, Any] | None = None
     for name in names:
         if name in record:
             return record[name]
+        if lowered is None:
+            lowered = {key.lower(): value for key, value in record.items()}
         value = lowered.get(name.lower())
         if value is not None:
             return value
@@ -281,9 +234,9 @@ def has_core_public_topic(record: dict[str, Any]) -> bool:
     return topic_has_core_public_topic(record)
 
 
-def eligibility_blockers(record: dict[str, Any]) -> list[str]:
+def eligibility_blockers(record: dict[str, Any], topic_decision: dict[str, Any] | None = None) -> list[str]:
     blockers: list[str] = []
-    topic_decision = public_topic_decision(record)
+    topic_decision = topic_decision or public_topic_decision(record)
     if source_priority(record) not in PUBLIC_OUTPUT_ALLOWED_PRIORITIES:
         blockers.append("source_priority_below_high")
     if attribution_status(record) != "Complete":
@@ -300,6 +253,8 @@ def eligibility_blockers(record: dict[str, Any]) -> list[str]:
         blockers.append("missing_core_public_topic")
     if not signal_title(record):
         blockers.append("missing_signal_title")
+    if signal_slug(record) in RESERVED_SIGNAL_SLUGS:
+        blockers.append("reserved_public_slug")
     if not signal_summary(record):
         blockers.append("missing_summary")
     if not source_url(record) or not is_safe_source_url(source_url(record)):
@@ -335,10 +290,12 @@ def build_sync_report(
     orphan_pages_detected: int = 0,
     orphan_pages_reconciled: int = 0,
     orphan_pages_removed: int = 0,
+    blockers: list[list[str]] | None = None,
 ) -> dict[str, Any]:
+    if blockers is None:
+        blockers = [eligibility_blockers(record) for record in records]
     blocked: list[dict[str, Any]] = []
-    for record in records:
-        reasons = eligibility_blockers(record)
+    for record, reasons in zip(records, blockers):
         if reasons:
             blocked.append(
                 {
@@ -442,15 +399,8 @@ class ExistingSignalParser(HTMLParser):
             self._after_summary_heading = False
 
 
-def previous_manifest_slugs(signals_root: pathlib.Path) -> set[str] | None:
-    manifest_path = signals_root / "public_launch_manifest.json"
-    if not manifest_path.exists():
-        return None
-    try:
-        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError):
-        return None
-    launched = manifest.get("launched")
+def manifest_slugs(manifest: dict[str, Any] | None) -> set[str] | None:
+    launched = manifest.get("launched") if manifest else None
     if not isinstance(launched, list):
         return None
     return {
@@ -460,17 +410,17 @@ def previous_manifest_slugs(signals_root: pathlib.Path) -> set[str] | None:
     }
 
 
-def parse_existing_signal_page(page: pathlib.Path, declared: bool) -> dict[str, Any]:
+def previous_manifest_slugs(signals_root: pathlib.Path) -> set[str] | None:
+    return manifest_slugs(existing_manifest(signals_root))
+
+
+def existing_signal_record(page: pathlib.Path, declared: bool, title: str, summary: str) -> dict[str, Any]:
     slug = page.parent.name
-    html_text = page.read_text(encoding="utf-8", errors="ignore")
-    parser = ExistingSignalParser()
-    parser.feed(html_text)
-    title = parser.title or slug.replace("-", " ").title()
     return {
         "signal_id": f"existing_{slug.replace('-', '_')}",
         "slug": slug,
         "title": title,
-        "summary": parser.summary or "",
+        "summary": summary,
         "source_label": "existing public Signal",
         "source_url": "",
         "source_priority": "",
@@ -488,21 +438,53 @@ def parse_existing_signal_page(page: pathlib.Path, declared: bool) -> dict[str,
     }
 
 
-def existing_public_signals(output_root: pathlib.Path) -> list[dict[str, Any]]:
+def parse_existing_signal_page(page: pathlib.Path, declared: bool) -> dict[str, Any]:
+    slug = page.parent.name
+    html_text = page.read_text(encoding="utf-8", errors="ignore")
+    parser = ExistingSignalParser()
+    parser.feed(html_text)
+    return existing_signal_record(page, declared, parser.title or slug.replace("-", " ").title(), parser.summary or "")
+
+
+def manifest_entries_by_slug(manifest: dict[str, Any] | None) -> dict[str, dict[str, Any]]:
+    launched = manifest.get("launched") if manifest else None
+    if not isinstance(launched, list):
+        return {}
+    return {normalize_text(entry.get("slug")): entry for entry in launched if isinstance(entry, dict) and normalize_text(entry.get("slug"))}
+
+
+def existing_public_signals(output_root: pathlib.Path, previous_manifest: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+    """Index existing Signal pages from the launch manifest.
+
+    The manifest is authoritative for the title and summary of every page it
+    declares; HTML is parsed only for undeclared pages and for entries that
+    are missing either field.
+    """
     signals_root = output_root / "signals"
     if not signals_root.exists():
         return []
-    manifest_slugs = previous_manifest_slugs(signals_root)
+    if previous_manifest is None:
+        previous_manifest = existing_manifest(signals_root)
+    declared_slugs = manifest_slugs(previous_manifest)
+    entries = manifest_entries_by_slug(previous_manifest)
     records: list[dict[str, Any]] = []
     for page in sorted(signals_root.glob("*/index.html")):
         slug = page.parent.name
-        declared = manifest_slugs is None or slug in manifest_slugs
-        records.append(parse_existing_signal_page(page, declared))
+        if slug in RESERVED_SIGNAL_SLUGS:
+            continue
+        declared = declared_slugs is None or slug in declared_slugs
+        entry = entries.get(slug) or {}
+        title = normalize_text(entry.get("title"))
+        summary = normalize_text(entry.get("summary"))
+        if title and summary:
+            records.append(existing_signal_record(page, declared, title, summary))
+        else:
+            records.append(parse_existing_signal_page(page, declared))
     return records
 
 
-def record_from_notion(record: dict[str, Any]) -> dict[str, Any]:
-    decision = public_topic_decision(record)
+def record_from_notion(record: dict[str, Any], topic_decision: dict[str, Any] | None = None) -> dict[str, Any]:
+    decision = topic_decision or public_topic_decision(record)
     return {
         "signal_id": normalize_text(field(record, "Signal ID", "signal_id", "_notion_page_id")) or f"notion_{signal_slug(record)}",
         "slug": signal_slug(record),
@@ -572,12 +554,24 @@ def deterministic_identity_key(record: dict[str, Any]) -> tuple[str, str]:
     return (str(record.get("signal_id") or ""), str(record.get("source_url") or ""))
 
 
-def unique_records_by_slug(records: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
-    ranked = sorted(records, key=lambda record: (public_signal_sort_key(record), deterministic_identity_key(record)))
-    unique: dict[str, dict[str, Any]] = {}
-    for record in ranked:
-        unique.setdefault(record["slug"], record)
-    return unique
+def rank_public_signals(eligible: list[dict[str, Any]], preserved_existing: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Deduplicate eligible records by slug and rank them with preserved pages in one sort.
+
+    Sort keys are computed once per record. For a duplicated slug the record
+    with the lowest (sort key, identity) wins, the first one on a full tie.
+    Preserved pages sort ahead of eligible records with an equal sort key.
+    """
+    best: dict[str, tuple[tuple[Any, ...], tuple[str, str], int, dict[str, Any]]] = {}
+    for position, record in enumerate(eligible):
+        sort_key = public_signal_sort_key(record)
+        identity = deterministic_identity_key(record)
+        current = best.get(record["slug"])
+        if current is None or (sort_key, identity) < (current[0], current[1]):
+            best[record["slug"]] = (sort_key, identity, position, record)
+    decorated: list[tuple[Any, ...]] = [(public_signal_sort_key(record), 0, (), position, record) for position, record in enumerate(preserved_existing)]
+    decorated.extend((sort_key, 1, identity, position, record) for sort_key, identity, position, record in best.values())
+    decorated.sort(key=lambda item: item[:4])
+    return [item[4] for item in decorated]
 
 
 def public_absolute_url(path: str, seo_base_url: str) -> str:
@@ -704,7 +698,7 @@ def organization_json_ld(seo_base_url: str) -> str:
     )
 
 
-def render_index(records: list[dict[str, Any]], blocked_count: int, refreshed_at: str, seo_base_url: str) -> str:
+def signal_cards(records: list[dict[str, Any]]) -> str:
     items = []
     for record in records:
         tag_html = "".join(f'<span class="tag">{escape(tag)}</span>' for tag in record.get("tags", []))
@@ -719,22 +713,26 @@ def render_index(records: list[dict[str, Any]], blocked_count: int, refreshed_at
 </article>
 """
         )
+    return "".join(items)
+
+
+def render_signals_listing(title: str, canonical_path: str, body: str, seo_base_url: str) -> str:
     return f"""<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8">
   <meta name="viewport" content="width=device-width, initial-scale=1">
-  <title>DysonX Public Signals</title>
+  <title>{escape(title)}</title>
   <meta name="description" content="DysonX Public Signals track source-attributed AI and AGI intelligence from the Notion-managed content layer.">
-  <link rel="canonical" href="{escape(public_absolute_url('/signals/', seo_base_url), quote=True)}">
+  <link rel="canonical" href="{escape(public_absolute_url(canonical_path, seo_base_url), quote=True)}">
   <link rel="alternate" type="application/rss+xml" title="DysonX Public Signals RSS" href="{escape(public_absolute_url('/rss.xml', seo_base_url), quote=True)}">
   <link rel="alternate" type="application/feed+json" title="DysonX Public Signals JSON Feed" href="{escape(public_absolute_url('/feed.json', seo_base_url), quote=True)}">
-  <meta property="og:title" content="DysonX Public Signals">
+  <meta property="og:title" content="{escape(title, quote=True)}">
   <meta property="og:description" content="Source-attributed public Signals tracking AI and AGI intelligence.">
   <meta property="og:type" content="website">
-  <meta property="og:url" content="{escape(public_absolute_url('/signals/', seo_base_url), quote=True)}">
+  <meta property="og:url" content="{escape(public_absolute_url(canonical_path, seo_base_url), quote=True)}">
   <meta name="twitter:card" content="summary">
-  <meta name="twitter:title" content="DysonX Public Signals">
+  <meta name="twitter:title" content="{escape(title, quote=True)}">
   <meta name="twitter:description" content="Source-attributed public Signals tracking AI and AGI intelligence.">
   {organization_json_ld(seo_base_url)}
   <style>
@@ -752,21 +750,62 @@ def render_index(records: list[dict[str, Any]], blocked_count: int, refreshed_at
 </head>
 <body>
 <main>
-<p class="status">Published · Notion content refresh</p>
+{body}</main>
+</body>
+</html>
+"""
+
+
+def signals_page_url_path(page: int) -> str:
+    return f"/signals/page/{page}/"
+
+
+def render_index(records: list[dict[str, Any]], blocked_count: int, refreshed_at: str, seo_base_url: str, page_numbers: list[int] | None = None) -> str:
+    archive = ""
+    if page_numbers:
+        first, last = page_numbers[0], page_numbers[-1]
+        # Pages are not in date order (the first listing fills them by rank), so none is labelled newest.
+        through = f' … <a href="{signals_page_url_path(last)}">page {last}</a>' if last != first else ""
+        archive = f'<p>Browse every public Signal: <a href="{signals_page_url_path(first)}">page {first}</a>{through}.</p>\n'
+    body = f"""<p class="status">Published · Notion content refresh</p>
 <h1>DysonX Public Signals</h1>
 <div class="notice">
   DysonX public Signals are refreshed from Notion-approved, source-attributed, summary-only records. The public surface remains static, domain-agnostic, and reviewable through pull requests.
 </div>
 <p><strong>Displayed Signals:</strong> {len(records)}. <strong>Blocked Notion rows:</strong> {blocked_count}. <strong>Source mode:</strong> public-safe summaries with attribution links.</p>
 <div class="grid">
-{''.join(items)}
+{signal_cards(records)}
 </div>
 <p class="meta">Content refreshed at {escape(refreshed_at)}. Source text is not reproduced. OpenAI was not called. Source pages were not scraped.</p>
-<p><a href="/">Home</a></p>
-</main>
-</body>
-</html>
+{archive}<p><a href="/">Home</a></p>
 """
+    return render_signals_listing("DysonX Public Signals", "/signals/", body, seo_base_url)
+
+
+def render_signals_page(records: list[dict[str, Any]], page: int, previous_page: int | None, next_page: int | None, seo_base_url: str) -> str:
+    """Render one paginated Signals page.
+
+    The page depends only on its own Signals and its neighbours, never on the
+    refresh time or the total page count, so it is unchanged until its
+    membership changes.
+    """
+    links = []
+    if previous_page is not None:
+        links.append(f'<a href="{signals_page_url_path(previous_page)}">Previous page</a>')
+    links.append('<a href="/signals/">Latest Signals</a>')
+    if next_page is not None:
+        links.append(f'<a href="{signals_page_url_path(next_page)}">Next page</a>')
+    links.append('<a href="/">Home</a>')
+    body = f"""<p class="status">Published · Signals archive</p>
+<h1>DysonX Public Signals · Page {page}</h1>
+<p><strong>Signals on this page:</strong> {len(records)}. Signals keep their page once published; Signals published after a page fills go to a later page.</p>
+<div class="grid">
+{signal_cards(records)}
+</div>
+<p class="meta">Source text is not reproduced. OpenAI was not called. Source pages were not scraped.</p>
+<p>{" · ".join(links)}</p>
+"""
+    return render_signals_listing(f"DysonX Public Signals · Page {page}", signals_page_url_path(page), body, seo_base_url)
 
 
 def assert_public_safe(text: str, label: str) -> None:
@@ -776,39 +815,119 @@ def assert_public_safe(text: str, label: str) -> None:
         raise NotionPublicSignalsSyncError(f"{label} contains forbidden public terms: {', '.join(matches)}")
 
 
+def write_signal_page(record: dict[str, Any], refreshed_at: str, seo_base_url: str, page_path: pathlib.Path) -> int:
+    page_html = render_signal_page(record, refreshed_at, seo_base_url)
+    assert_public_safe(page_html, f"Signal page {record['slug']}")
+    page_path.parent.mkdir(parents=True, exist_ok=True)
+    return write_if_changed(page_path, page_html)
+
+
+def write_signal_pages(pages: list[tuple[dict[str, Any], pathlib.Path]], refreshed_at: str, seo_base_url: str, workers: int = 1) -> int:
+    """Render, safety-scan, and write Signal pages; return the total bytes written.
+
+    With more than one worker the pages fan out to a process pool. Each page
+    depends only on its own record, so the output is byte-identical to the
+    serial path whatever order the workers finish in.
+    """
+    if workers <= 1 or len(pages) < 2:
+        return sum(write_signal_page(record, refreshed_at, seo_base_url, page_path) for record, page_path in pages)
+    chunksize = max(1, len(pages) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        written = executor.map(
+            write_signal_page,
+            [record for record, _ in pages],
+            itertools.repeat(refreshed_at),
+            itertools.repeat(seo_base_url),
+            [page_path for _, page_path in pages],
+            chunksize=chunksize,
+        )
+        return sum(written)
+
+
+def material_record(record: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "signal_id": record.get("signal_id", ""),
+        "slug": record.get("slug", ""),
+        "title": record.get("title", ""),
+        "summary": record.get("summary", ""),
+        "why_this_matters": record.get("why_this_matters", ""),
+        "agi_relevance": record.get("agi_relevance", ""),
+        "source_label": record.get("source_label", ""),
+        "source_url": record.get("source_url", ""),
+        "source_priority": record.get("source_priority", ""),
+        "attribution_status": record.get("attribution_status", ""),
+        "copyright_status": record.get("copyright_status", ""),
+        "ready_for_pipeline": bool(record.get("ready_for_pipeline")),
+        "published": bool(record.get("published")),
+        "quality_hint": record.get("quality_hint", ""),
+        "risk_notes": record.get("risk_notes", ""),
+        "watch_next": record.get("watch_next", ""),
+        "tags": record.get("tags", []),
+    }
+
+
 def material_signature(records: list[dict[str, Any]], blocked_count: int) -> str:
-    material_records = [
-        {
-            "signal_id": record.get("signal_id", ""),
-            "slug": record.get("slug", ""),
-            "title": record.get("title", ""),
-            "summary": record.get("summary", ""),
-            "why_this_matters": record.get("why_this_matters", ""),
-            "agi_relevance": record.get("agi_relevance", ""),
-            "source_label": record.get("source_label", ""),
-            "source_url": record.get("source_url", ""),
-            "source_priority": record.get("source_priority", ""),
-            "attribution_status": record.get("attribution_status", ""),
-            "copyright_status": record.get("copyright_status", ""),
-            "ready_for_pipeline": bool(record.get("ready_for_pipeline")),
-            "published": bool(record.get("published")),
-            "quality_hint": record.get("quality_hint", ""),
-            "risk_notes": record.get("risk_notes", ""),
-            "watch_next": record.get("watch_next", ""),
-            "tags": record.get("tags", []),
-        }
-        for record in records
-    ]
     material = {
         "pages_launched": len(records),
         "pages_blocked": blocked_count,
-        "records": material_records,
+        "records": [material_record(record) for record in records],
     }
     payload = json.dumps(material, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
-def build_manifest(records: list[dict[str, Any]], blocked_count: int, refreshed_at: str) -> dict[str, Any]:
+TEMPLATE_PROBE_RECORD = {
+    "signal_id": "template_probe",
+    "slug": "template-probe",
+    "title": "Template probe",
+    "summary": "Template probe summary.",
+    "why_this_matters": "Template probe rationale.",
+    "agi_relevance": "High",
+    "source_label": "Template probe source",
+    "source_url": "https://example.org/template-probe",
+    "risk_notes": "Template probe risk note.",
+    "watch_next": "Template probe follow-up.",
+    "tags": ["Template"],
+}
+
+
+def signal_page_fingerprint(seo_base_url: str) -> str:
+    """Hash of a fixed probe page, so template or base URL changes invalidate every page hash."""
+    probe = render_signal_page(TEMPLATE_PROBE_RECORD, "", seo_base_url)
+    return hashlib.sha256(probe.encode("utf-8")).hexdigest()
+
+
+def record_material_hash(record: dict[str, Any], page_fingerprint: str) -> str:
+    payload = json.dumps(
+        {"page_fingerprint": page_fingerprint, "record": material_record(record)},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def previous_material_hashes(manifest: dict[str, Any] | None) -> dict[str, str]:
+    return {
+        slug: normalize_text(entry.get("material_hash"))
+        for slug, entry in manifest_entries_by_slug(manifest).items()
+        if normalize_text(entry.get("material_hash"))
+    }
+
+
+def write_if_changed(path: pathlib.Path, text: str) -> int:
+    """Write `text` only when the file's bytes differ; return the number of bytes written."""
+    data = text.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return 0
+    except OSError:
+        pass
+    path.write_bytes(data)
+    return len(data)
+
+
+def build_manifest(records: list[dict[str, Any]], blocked_count: int, refreshed_at: str, page_fingerprint: str = "") -> dict[str, Any]:
     launched = [
         {
             "signal_id": record["signal_id"],
@@ -827,6 +946,7 @@ def build_manifest(records: list[dict[str, Any]], blocked_count: int, refreshed_
             "quality_hint": record.get("quality_hint", ""),
             "ready_for_pipeline": bool(record.get("ready_for_pipeline")),
             "topic_decision": record.get("topic_decision") or public_topic_decision(record),
+            "material_hash": record_material_hash(record, page_fingerprint),
             "production_publish_performed": True,
         }
         for record in records
@@ -852,19 +972,28 @@ def build_manifest(records: list[dict[str, Any]], blocked_count: int, refreshed_
     }
 
 
-def build_artifact_manifest(records: list[dict[str, Any]], public_manifest: dict[str, Any]) -> dict[str, Any]:
+def build_artifact_manifest(
+    records: list[dict[str, Any]], public_manifest: dict[str, Any], membership_hashes: dict[str, str] | None = None
+) -> dict[str, Any]:
+    """Declare every public artifact; `membership_hashes` adds paginated pages and sitemap shards."""
     material = normalize_text(public_manifest.get("material_signature"))
+    membership_hashes = membership_hashes or {}
     artifact_paths = [
         "signals/index.html",
         "signals/public_launch_manifest.json",
         "signals/public_artifact_manifest.json",
         "robots.txt",
         "sitemap.xml",
+        "sitemap_index.xml",
         "rss.xml",
         "feed.json",
         *[f"signals/{record['slug']}/index.html" for record in records],
+        *membership_hashes,
+    ]
+    artifacts = [
+        build_artifact_entry(path, material, membership_hash=membership_hashes.get(path, ""))
+        for path in sorted(set(artifact_paths))
     ]
-    artifacts = [build_artifact_entry(path, material) for path in sorted(set(artifact_paths))]
     return {
         "contract_version": PUBLIC_SIGNAL_CONTRACT_VERSION,
         "policy_version": PUBLIC_SIGNAL_POLICY_VERSION,
@@ -886,27 +1015,242 @@ def stable_lastmod(refreshed_at: str) -> str:
 def render_robots(seo_base_url: str) -> str:
     return f"""User-agent: *
 Allow: /
-Sitemap: {seo_base_url}/sitemap.xml
+Sitemap: {seo_base_url}/sitemap_index.xml
 """
 
 
-def render_sitemap(records: list[dict[str, Any]], refreshed_at: str, seo_base_url: str) -> str:
-    lastmod = stable_lastmod(refreshed_at)
-    urls = ["/", "/signals/", *[f"/signals/{record['slug']}/" for record in records]]
-    items = "\n".join(
-        f"""  <url>
+SITEMAP_CORE_PATHS = ("/", "/signals/")
+SITEMAP_URLSET_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+SITEMAP_URLSET_FOOTER = "</urlset>\n"
+
+
+def sitemap_url_entry(path: str, lastmod: str, seo_base_url: str) -> str:
+    return f"""  <url>
     <loc>{escape(public_absolute_url(path, seo_base_url))}</loc>
     <lastmod>{escape(lastmod)}</lastmod>
-  </url>"""
-        for path in urls
+  </url>
+"""
+
+
+def render_sitemap_shard(urls: list[tuple[str, str]], seo_base_url: str) -> str:
+    return SITEMAP_URLSET_HEADER + "".join(sitemap_url_entry(path, lastmod, seo_base_url) for path, lastmod in urls) + SITEMAP_URLSET_FOOTER
+
+
+def render_sitemap_index(shards: list[tuple[int, str]], seo_base_url: str) -> str:
+    items = "".join(
+        f"""  <sitemap>
+    <loc>{escape(public_absolute_url('/' + sitemap_shard_public_path(shard), seo_base_url))}</loc>
+    <lastmod>{escape(lastmod)}</lastmod>
+  </sitemap>
+"""
+        for shard, lastmod in shards
     )
     return f"""<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-{items}
-</urlset>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+{items}</sitemapindex>
 """
 
 
+def stable_buckets(
+    slugs: list[str],
+    previous: dict[str, Any],
+    item_limit: int,
+    *,
+    weight: Callable[[str], int] | None = None,
+    weight_limit: int = 0,
+    reserved: dict[int, tuple[int, int]] | None = None,
+) -> dict[str, int]:
+    """Assign slugs to numbered buckets (Signals pages or sitemap shards) with stable boundaries.
+
+    A slug keeps its previous bucket while that bucket has room. New slugs,
+    and any that no longer fit, are appended in order to the last bucket in
+    use, opening the next one when it is full. Removing a slug only shrinks
+    its own bucket, so a sync changes the membership of as few buckets as
+    possible. `weight` and `weight_limit` bound a second size (sitemap bytes)
+    and `reserved` preloads buckets with fixed (items, weight) totals.
+    """
+    counts: dict[int, int] = {}
+    weights: dict[int, int] = {}
+    for bucket, (items, size) in (reserved or {}).items():
+        counts[bucket] = items
+        weights[bucket] = size
+    assigned: dict[str, int] = {}
+
+    def fits(bucket: int, slug: str) -> bool:
+        if counts.get(bucket, 0) >= item_limit:
+            return False
+        return weight is None or weights.get(bucket, 0) + weight(slug) <= weight_limit
+
+    def place(bucket: int, slug: str) -> None:
+        assigned[slug] = bucket
+        counts[bucket] = counts.get(bucket, 0) + 1
+        if weight is not None:
+            weights[bucket] = weights.get(bucket, 0) + weight(slug)
+
+    pending = []
+    for slug in slugs:
+        bucket = previous.get(slug)
+        if type(bucket) is int and bucket >= 1 and fits(bucket, slug):
+            place(bucket, slug)
+        else:
+            pending.append(slug)
+    last = max((bucket for bucket, count in counts.items() if count), default=1)
+    for slug in pending:
+        # An empty bucket takes the slug even if it alone exceeds the limits.
+        while counts.get(last, 0) and not fits(last, slug):
+            last += 1
+        place(last, slug)
+    return assigned
+
+
+def plan_signal_listings(
+    launched: list[dict[str, Any]],
+    previous_manifest: dict[str, Any] | None,
+    refreshed_at: str,
+    seo_base_url: str,
+    page_size: int = DEFAULT_SIGNALS_PAGE_SIZE,
+    shard_url_limit: int = SITEMAP_SHARD_URL_LIMIT,
+    shard_byte_limit: int = SITEMAP_SHARD_BYTE_LIMIT,
+) -> None:
+    """Record each launched Signal's `index_page`, `sitemap_shard`, and `lastmod` on its manifest entry.
+
+    Placements carry over from the previous manifest, and `lastmod` only
+    moves to the refresh date when the Signal's material hash changes.
+    New Signals are placed in `launched` order, which is ranked, not dated.
+    """
+    previous_entries = manifest_entries_by_slug(previous_manifest)
+    lastmod = stable_lastmod(refreshed_at)
+    slugs = [entry["slug"] for entry in launched]
+    entry_bytes = {slug: len(sitemap_url_entry(f"/signals/{slug}/", lastmod, seo_base_url).encode("utf-8")) for slug in slugs}
+    core_bytes = sum(len(sitemap_url_entry(path, lastmod, seo_base_url).encode("utf-8")) for path in SITEMAP_CORE_PATHS)
+    pages = stable_buckets(slugs, {slug: entry.get("index_page") for slug, entry in previous_entries.items()}, max(1, page_size))
+    shards = stable_buckets(
+        slugs,
+        {slug: entry.get("sitemap_shard") for slug, entry in previous_entries.items()},
+        max(len(SITEMAP_CORE_PATHS) + 1, shard_url_limit),
+        weight=entry_bytes.__getitem__,
+        weight_limit=shard_byte_limit - len(SITEMAP_URLSET_HEADER) - len(SITEMAP_URLSET_FOOTER),
+        reserved={1: (len(SITEMAP_CORE_PATHS), core_bytes)},
+    )
+    for entry in launched:
+        slug = entry["slug"]
+        previous = previous_entries.get(slug) or {}
+        previous_lastmod = normalize_text(previous.get("lastmod"))
+        entry["index_page"] = pages[slug]
+        entry["sitemap_shard"] = shards[slug]
+        entry["lastmod"] = previous_lastmod if previous_lastmod and previous.get("material_hash") == entry["material_hash"] else lastmod
+
+
+def membership_hash(membership: Any) -> str:
+    payload = json.dumps(membership, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def listing_page_fingerprint(seo_base_url: str) -> str:
+    probe = render_signals_page([{**TEMPLATE_PROBE_RECORD, "quality_hint": 90}], 1, None, None, seo_base_url)
+    return hashlib.sha256(probe.encode("utf-8")).hexdigest()
+
+
+def sitemap_fingerprint(seo_base_url: str) -> str:
+    probe = render_sitemap_shard([("/", "")], seo_base_url) + render_sitemap_index([(1, "")], seo_base_url)
+    return hashlib.sha256(probe.encode("utf-8")).hexdigest()
+
+
+def signals_page_artifacts(
+    records: list[dict[str, Any]], launched: list[dict[str, Any]], seo_base_url: str
+) -> dict[str, tuple[str, Callable[[], str]]]:
+    """Map each paginated Signals page path to its membership hash and renderer."""
+    members: dict[int, list[tuple[dict[str, Any], dict[str, Any]]]] = {}
+    for record, entry in zip(records, launched):
+        members.setdefault(entry["index_page"], []).append((record, entry))
+    numbers = sorted(members)
+    fingerprint = listing_page_fingerprint(seo_base_url)
+    artifacts: dict[str, tuple[str, Callable[[], str]]] = {}
+    for position, page in enumerate(numbers):
+        previous_page = numbers[position - 1] if position else None
+        next_page = numbers[position + 1] if position + 1 < len(numbers) else None
+        page_records = [record for record, _ in members[page]]
+        digest = membership_hash(
+            {
+                "template": fingerprint,
+                "page": page,
+                "previous": previous_page,
+                "next": next_page,
+                "signals": [[entry["slug"], entry["material_hash"]] for _, entry in members[page]],
+            }
+        )
+        artifacts[signals_page_public_path(page)] = (digest, functools.partial(render_signals_page, page_records, page, previous_page, next_page, seo_base_url))
+    return artifacts
+
+
+def sitemap_shard_urls(launched: list[dict[str, Any]], refreshed_at: str) -> dict[int, list[tuple[str, str]]]:
+    """Group sitemap URLs by shard; shard 1 (sitemap.xml) also carries the homepage and /signals/."""
+    lastmod = stable_lastmod(refreshed_at)
+    shards: dict[int, list[tuple[str, str]]] = {1: [(path, lastmod) for path in SITEMAP_CORE_PATHS]}
+    for entry in sorted(launched, key=lambda item: item["slug"]):
+        shards.setdefault(entry["sitemap_shard"], []).append((f"/signals/{entry['slug']}/", entry["lastmod"]))
+    return dict(sorted(shards.items()))
+
+
+def sitemap_shard_artifacts(shards: dict[int, list[tuple[str, str]]], seo_base_url: str) -> dict[str, tuple[str, Callable[[], str]]]:
+    fingerprint = sitemap_fingerprint(seo_base_url)
+    return {
+        sitemap_shard_public_path(shard): (
+            membership_hash({"template": fingerprint, "shard": shard, "urls": urls}),
+            functools.partial(render_sitemap_shard, urls, seo_base_url),
+        )
+        for shard, urls in shards.items()
+    }
+
+
+def write_membership_artifacts(
+    output_root: pathlib.Path, artifacts: dict[str, tuple[str, Callable[[], str]]], previous_hashes: dict[str, str]
+) -> tuple[int, int, int]:
+    """Render and write artifacts whose membership hash changed; return (rendered, skipped, bytes written)."""
+    rendered = skipped = bytes_written = 0
+    for relative_path, (digest, render) in artifacts.items():
+        path = output_root / relative_path
+        if previous_hashes.get(relative_path) == digest and path.exists():
+            skipped += 1
+            continue
+        text = render()
+        assert_public_safe(text, relative_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        bytes_written += write_if_changed(path, text)
+        rendered += 1
+    return rendered, skipped, bytes_written
+
+
+def previous_membership_hashes(artifact_manifest: dict[str, Any] | None) -> dict[str, str]:
+    artifacts = artifact_manifest.get("artifacts") if artifact_manifest else None
+    if not isinstance(artifacts, list):
+        return {}
+    return {
+        normalize_text(item.get("path")): normalize_text(item.get("membership_hash"))
+        for item in artifacts
+        if isinstance(item, dict) and normalize_text(item.get("membership_hash"))
+    }
+
+
+def remove_stale_listing_artifacts(output_root: pathlib.Path, current_paths: set[str]) -> int:
+    """Delete paginated pages and sitemap shards that no longer have any members."""
+    page_root = output_root / "signals" / "page"
+    removed = 0
+    for path in [*sorted(page_root.glob("*/index.html")), *sorted(output_root.glob("sitemap-*.xml"))]:
+        relative_path = path.relative_to(output_root).as_posix()
+        if relative_path in current_paths:
+            continue
+        if signals_page_number_from_public_path(relative_path) is None and sitemap_shard_number_from_public_path(relative_path) is None:
+            continue
+        path.unlink()
+        if path.parent != output_root and not any(path.parent.iterdir()):
+            path.parent.rmdir()
+        removed += 1
+    if page_root.is_dir() and not any(page_root.iterdir()):
+        page_root.rmdir()
+    return removed
+
+
 def render_rss(records: list[dict[str, Any]], refreshed_at: str, seo_base_url: str) -> str:
     items = []
     for record in records:
@@ -963,7 +1307,14 @@ def manifest_material_view(manifest: dict[str, Any]) -> dict[str, Any]:
 
 
 def existing_manifest(signals_root: pathlib.Path) -> dict[str, Any] | None:
-    manifest_path = signals_root / "public_launch_manifest.json"
+    return load_manifest_json(signals_root / "public_launch_manifest.json")
+
+
+def existing_artifact_manifest(signals_root: pathlib.Path) -> dict[str, Any] | None:
+    return load_manifest_json(signals_root / "public_artifact_manifest.json")
+
+
+def load_manifest_json(manifest_path: pathlib.Path) -> dict[str, Any] | None:
     if not manifest_path.exists():
         return None
     try:
@@ -973,8 +1324,14 @@ def existing_manifest(signals_root: pathlib.Path) -> dict[str, Any] | None:
     return data if isinstance(data, dict) else None
 
 
-def stable_refreshed_at(signals_root: pathlib.Path, candidate_manifest: dict[str, Any], fallback_refreshed_at: str) -> str:
-    previous_manifest = existing_manifest(signals_root)
+def stable_refreshed_at(
+    signals_root: pathlib.Path,
+    candidate_manifest: dict[str, Any],
+    fallback_refreshed_at: str,
+    previous_manifest: dict[str, Any] | None = None,
+) -> str:
+    if previous_manifest is None:
+        previous_manifest = existing_manifest(signals_root)
     if not previous_manifest:
         return fallback_refreshed_at
     previous_refreshed_at = normalize_text(previous_manifest.get("content_refreshed_at"))
@@ -993,6 +1350,10 @@ def sync_records(
     signals_index_limit: int = DEFAULT_SIGNALS_INDEX_LIMIT,
     rss_item_limit: int = DEFAULT_RSS_ITEM_LIMIT,
     json_feed_item_limit: int = DEFAULT_JSON_FEED_ITEM_LIMIT,
+    notion_transport: dict[str, Any] | None = None,
+    workers: int = 1,
+    signals_page_size: int = DEFAULT_SIGNALS_PAGE_SIZE,
+    sitemap_shard_url_limit: int = SITEMAP_SHARD_URL_LIMIT,
 ) -> dict[str, Any]:
     refreshed_at = refreshed_at or utc_now()
     signals_index_limit = max(0, signals_index_limit)
@@ -1003,13 +1364,15 @@ def sync_records(
     signals_root = output_root / "signals"
     signals_root.mkdir(parents=True, exist_ok=True)
 
-    existing = existing_public_signals(output_root)
+    previous_manifest = existing_manifest(signals_root)
+    previous_listing_hashes = previous_membership_hashes(existing_artifact_manifest(signals_root))
+    existing = existing_public_signals(output_root, previous_manifest)
     existing_slugs = [record["slug"] for record in existing]
-    eligible = [record_from_notion(record) for record in records if eligible_record(record)]
+    decisions = [public_topic_decision(record) for record in records]
+    blockers = [eligibility_blockers(record, decision) for record, decision in zip(records, decisions)]
+    eligible = [record_from_notion(record, decision) for record, decision, reasons in zip(records, decisions, blockers) if not reasons]
     blocked_count = len(records) - len(eligible)
-    eligible_by_slug = unique_records_by_slug(eligible)
-    ranked_eligible = sorted(eligible_by_slug.values(), key=public_signal_sort_key)
-    eligible_slugs = {record["slug"] for record in ranked_eligible}
+    eligible_slugs = {record["slug"] for record in eligible}
     orphan_records = [record for record in existing if not record.get("declared") and record["slug"] not in eligible_slugs]
     orphan_pages_detected = len(orphan_records)
     orphan_pages_reconciled = sum(1 for record in orphan_records if existing_record_safe(record))
@@ -1022,10 +1385,7 @@ def sync_records(
             preserved_existing.append(record)
         elif remove_existing_signal_page(record):
             orphan_pages_removed += 1
-    by_slug = {record["slug"]: record for record in preserved_existing}
-    for record in ranked_eligible:
-        by_slug[record["slug"]] = record
-    merged = sorted(by_slug.values(), key=public_signal_sort_key)
+    merged = rank_public_signals(eligible, preserved_existing)
     index_records = merged[:signals_index_limit]
     rss_records = merged[:rss_item_limit]
     feed_records = merged[:json_feed_item_limit]
@@ -1040,40 +1400,70 @@ def sync_records(
         orphan_pages_detected=orphan_pages_detected,
         orphan_pages_reconciled=orphan_pages_reconciled,
         orphan_pages_removed=orphan_pages_removed,
+        blockers=blockers,
     )
-    candidate_manifest = build_manifest(merged, blocked_count, refreshed_at)
-    refreshed_at = stable_refreshed_at(signals_root, candidate_manifest, refreshed_at)
-
-    for record in merged:
-        if record.get("existing") and not any(item["slug"] == record["slug"] for item in eligible):
+    if notion_transport is not None:
+        report["notion_transport"] = notion_transport
+    page_fingerprint = signal_page_fingerprint(seo_base_url)
+    candidate_manifest = build_manifest(merged, blocked_count, refreshed_at, page_fingerprint)
+    plan_signal_listings(candidate_manifest["launched"], previous_manifest, refreshed_at, seo_base_url, signals_page_size, sitemap_shard_url_limit)
+    refreshed_at = stable_refreshed_at(signals_root, candidate_manifest, refreshed_at, previous_manifest)
+    previous_hashes = previous_material_hashes(previous_manifest)
+    pages_skipped_unchanged = 0
+    bytes_written = 0
+
+    pages_to_render: list[tuple[dict[str, Any], pathlib.Path]] = []
+    for record, entry in zip(merged, candidate_manifest["launched"]):
+        if record["slug"] not in eligible_slugs:
             continue
-        page_html = render_signal_page(record, refreshed_at, seo_base_url)
-        assert_public_safe(page_html, f"Signal page {record['slug']}")
-        page_dir = signals_root / record["slug"]
-        page_dir.mkdir(parents=True, exist_ok=True)
-        (page_dir / "index.html").write_text(page_html, encoding="utf-8")
-
-    index_html = render_index(index_records, blocked_count, refreshed_at, seo_base_url)
+        page_path = signals_root / record["slug"] / "index.html"
+        if previous_hashes.get(record["slug"]) == entry["material_hash"] and page_path.exists():
+            pages_skipped_unchanged += 1
+            continue
+        pages_to_render.append((record, page_path))
+    bytes_written += write_signal_pages(pages_to_render, refreshed_at, seo_base_url, workers)
+    pages_rendered = len(pages_to_render)
+
+    page_artifacts = signals_page_artifacts(merged, candidate_manifest["launched"], seo_base_url)
+    shard_urls = sitemap_shard_urls(candidate_manifest["launched"], refreshed_at)
+    shard_artifacts = sitemap_shard_artifacts(shard_urls, seo_base_url)
+    index_pages_rendered, index_pages_skipped_unchanged, page_bytes = write_membership_artifacts(output_root, page_artifacts, previous_listing_hashes)
+    sitemap_shards_rendered, sitemap_shards_skipped_unchanged, shard_bytes = write_membership_artifacts(output_root, shard_artifacts, previous_listing_hashes)
+    bytes_written += page_bytes + shard_bytes
+    remove_stale_listing_artifacts(output_root, {*page_artifacts, *shard_artifacts})
+
+    page_numbers = sorted({entry["index_page"] for entry in candidate_manifest["launched"]})
+    index_html = render_index(index_records, blocked_count, refreshed_at, seo_base_url, page_numbers)
     assert_public_safe(index_html, "Signals index")
-    (signals_root / "index.html").write_text(index_html, encoding="utf-8")
+    bytes_written += write_if_changed(signals_root / "index.html", index_html)
 
-    manifest = build_manifest(merged, blocked_count, refreshed_at)
+    manifest = {**candidate_manifest, "content_refreshed_at": refreshed_at}
     manifest_text = json.dumps(manifest, indent=2, sort_keys=True) + "\n"
     assert_public_safe(manifest_text, "public launch manifest")
-    (signals_root / "public_launch_manifest.json").write_text(manifest_text, encoding="utf-8")
-    artifact_manifest = build_artifact_manifest(merged, manifest)
+    bytes_written += write_if_changed(signals_root / "public_launch_manifest.json", manifest_text)
+    membership_hashes = {path: digest for path, (digest, _) in {**page_artifacts, **shard_artifacts}.items()}
+    artifact_manifest = build_artifact_manifest(merged, manifest, membership_hashes)
     artifact_manifest_text = json.dumps(artifact_manifest, indent=2, sort_keys=True) + "\n"
     assert_public_safe(artifact_manifest_text, "public artifact manifest")
-    (signals_root / "public_artifact_manifest.json").write_text(artifact_manifest_text, encoding="utf-8")
+    bytes_written += write_if_changed(signals_root / "public_artifact_manifest.json", artifact_manifest_text)
     seo_outputs = {
         "robots.txt": render_robots(seo_base_url),
-        "sitemap.xml": render_sitemap(merged, refreshed_at, seo_base_url),
+        "sitemap_index.xml": render_sitemap_index([(shard, max(lastmod for _, lastmod in urls)) for shard, urls in shard_urls.items()], seo_base_url),
         "rss.xml": render_rss(rss_records, refreshed_at, seo_base_url),
         "feed.json": render_json_feed(feed_records, refreshed_at, seo_base_url),
     }
     for relative_path, text in seo_outputs.items():
         assert_public_safe(text, relative_path)
-        (output_root / relative_path).write_text(text, encoding="utf-8")
+        bytes_written += write_if_changed(output_root / relative_path, text)
+    report["pages_rendered"] = pages_rendered
+    report["pages_skipped_unchanged"] = pages_skipped_unchanged
+    report["index_pages"] = len(page_artifacts)
+    report["index_pages_rendered"] = index_pages_rendered
+    report["index_pages_skipped_unchanged"] = index_pages_skipped_unchanged
+    report["sitemap_shards"] = len(shard_artifacts)
+    report["sitemap_shards_rendered"] = sitemap_shards_rendered
+    report["sitemap_shards_skipped_unchanged"] = sitemap_shards_skipped_unchanged
+    report["bytes_written"] = bytes_written
     if output_report:
         output_report.parent.mkdir(parents=True, exist_ok=True)
         report_text = json.dumps(report, indent=2, sort_keys=True) + "\n"
@@ -1089,7 +1479,19 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--output-report", help="Optional JSON diagnostics report path.")
     parser.add_argument("--signals-index-limit", type=int, default=DEFAULT_SIGNALS_INDEX_LIMIT, help="Maximum public Signals to display on signals/index.html.")
     parser.add_argument("--rss-item-limit", type=int, default=DEFAULT_RSS_ITEM_LIMIT, help="Maximum public Signals to include in rss.xml.")
+    parser.add_argument(
+        "--signals-page-size",
+        type=int,
+        default=DEFAULT_SIGNALS_PAGE_SIZE,
+        help="Maximum public Signals per signals/page/N/ page; pages keep their Signals across syncs.",
+    )
     parser.add_argument("--json-feed-item-limit", type=int, default=DEFAULT_JSON_FEED_ITEM_LIMIT, help="Maximum public Signals to include in feed.json.")
+    parser.add_argument(
+        "--published-only",
+        action="store_true",
+        help="Ask Notion for rows with Published or Ready for Pipeline checked only; other rows are treated as absent.",
+    )
+    parser.add_argument("--workers", type=int, default=1, help="Processes used to render, safety-scan, and write Signal pages.")
     parser.add_argument("--max-public-signals", type=int, help="Deprecated compatibility alias for --signals-index-limit; it no longer caps total public inventory.")
     return parser.parse_args(argv)
 
@@ -1106,6 +1508,7 @@ def load_fixture_records(path: pathlib.Path) -> list[dict[str, Any]]:
 def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv)
     try:
+        notion_transport = None
         if args.fixture_json:
             records = load_fixture_records(pathlib.Path(args.fixture_json))
         else:
@@ -1115,7 +1518,9 @@ def main(argv: list[str] | None = None) -> int:
             if missing:
                 raise NotionPublicSignalsSyncError(f"Missing required environment variables: {', '.join(missing)}")
             assert token is not None and database_id is not None
-            records = query_notion_records(token, database_id)
+            query_filter = published_or_ready_filter() if args.published_only else None
+            records = query_notion_records(token, database_id, query_filter=query_filter)
+            notion_transport = notion_transport_stats(urllib_notion_transport)
         signals_index_limit = args.signals_index_limit
         if args.max_public_signals is not None:
             signals_index_limit = args.max_public_signals
@@ -1126,6 +1531,9 @@ def main(argv: list[str] | None = None) -> int:
             signals_index_limit=signals_index_limit,
             rss_item_limit=args.rss_item_limit,
             json_feed_item_limit=args.json_feed_item_limit,
+            notion_transport=notion_transport,
+            workers=args.workers,
+            signals_page_size=args.signals_page_size,
         )
     except (OSError, json.JSONDecodeError, NotionPublicSignalsSyncError) as exc:
         print(f"[notion-public-signals-sync] failed: {exc}", file=sys.stderr)
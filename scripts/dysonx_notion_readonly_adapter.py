@@ -8,13 +8,12 @@ updates, creates, deletes, runs collectors, calls LLM APIs, or publishes pages.
 
 from __future__ import annotations
 
-import json
 import pathlib
 import os
-import urllib.error
-import urllib.request
 from typing import Any, Callable, Protocol
 
+from dysonx_notion_client import NotionPageDecoder, query_database_records
+from dysonx_notion_transport import RateLimitedNotionTransport
 from dysonx_source_config_loader import load_source_records_from_fixture
 
 
@@ -46,69 +45,24 @@ class NotionReadOnlyFetchError(RuntimeError):
 NotionTransport = Callable[[str, dict[str, str], dict[str, Any]], dict[str, Any]]
 
 
-def _plain_text(items: list[dict[str, Any]] | None) -> str:
-    if not items:
-        return ""
-    return "".join(str(item.get("plain_text") or "") for item in items)
-
-
-def _notion_property_value(property_value: dict[str, Any]) -> Any:
-    property_type = property_value.get("type")
-    if property_type == "title":
-        return _plain_text(property_value.get("title"))
-    if property_type == "rich_text":
-        return _plain_text(property_value.get("rich_text"))
-    if property_type == "select":
-        selected = property_value.get("select")
-        return selected.get("name") if isinstance(selected, dict) else ""
-    if property_type == "multi_select":
-        values = property_value.get("multi_select")
-        if not isinstance(values, list):
-            return []
-        return [str(item.get("name")) for item in values if isinstance(item, dict) and item.get("name")]
-    if property_type == "url":
-        return property_value.get("url") or ""
-    if property_type == "number":
-        return property_value.get("number")
-    if property_type == "checkbox":
-        return bool(property_value.get("checkbox"))
-    if property_type == "date":
-        date_value = property_value.get("date")
-        return date_value.get("start") if isinstance(date_value, dict) else None
-    return None
+# Source rows predate status/formula decoding and keep unset dates as None.
+READ_ONLY_PAGE_DECODER = NotionPageDecoder(
+    NotionReadOnlyFetchError,
+    property_types=("title", "rich_text", "select", "multi_select", "url", "number", "checkbox", "date"),
+    empty_date=None,
+)
 
 
 def notion_page_to_source_record(page: dict[str, Any]) -> dict[str, Any]:
-    properties = page.get("properties")
-    if not isinstance(properties, dict):
-        raise NotionReadOnlyFetchError("Notion page is missing properties")
-
-    record = {
-        field_name: _notion_property_value(property_value)
-        for field_name, property_value in properties.items()
-        if isinstance(property_value, dict)
-    }
-    record["_notion_page_id"] = str(page.get("id") or "")
-    return record
-
-
-def urllib_notion_transport(url: str, headers: dict[str, str], payload: dict[str, Any]) -> dict[str, Any]:
-    request = urllib.request.Request(
-        url,
-        data=json.dumps(payload).encode("utf-8"),
-        headers=headers,
-        method="POST",
-    )
-    try:
-        with urllib.request.urlopen(request, timeout=30) as response:
-            response_body = response.read().decode("utf-8")
-    except urllib.error.URLError as exc:
-        raise NotionReadOnlyFetchError(f"Notion read-only query failed: {exc}") from exc
-
-    data = json.loads(response_body)
-    if not isinstance(data, dict):
-        raise NotionReadOnlyFetchError("Notion read-only query returned a non-object response")
-    return data
+    return READ_ONLY_PAGE_DECODER(page)
+
+
+# Read-only queries always POST to the database query endpoint, so the shared
+# transport is called with (url, headers, payload) only.
+urllib_notion_transport = RateLimitedNotionTransport(
+    error_class=NotionReadOnlyFetchError,
+    error_prefix="Notion read-only query failed",
+)
 
 
 class NotionReadOnlySourceClient:
@@ -153,30 +107,15 @@ class NotionReadOnlySourceClient:
         assert self.token is not None
         assert self.database_id is not None
 
-        url = f"https://api.notion.com/v1/databases/{self.database_id}/query"
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-            "Notion-Version": self.NOTION_VERSION,
-        }
-        records: list[dict[str, Any]] = []
-        payload: dict[str, Any] = {"page_size": 100}
-
-        while True:
-            response = self.transport(url, headers, payload)
-            results = response.get("results")
-            if not isinstance(results, list):
-                raise NotionReadOnlyFetchError("Notion read-only query response is missing results")
-            records.extend(notion_page_to_source_record(page) for page in results if isinstance(page, dict))
-
-            if response.get("has_more") is not True:
-                break
-            next_cursor = response.get("next_cursor")
-            if not next_cursor:
-                raise NotionReadOnlyFetchError("Notion read-only query response is missing next_cursor")
-            payload = {"page_size": 100, "start_cursor": next_cursor}
-
-        return records
+        return query_database_records(
+            self.transport,
+            self.token,
+            self.database_id,
+            READ_ONLY_PAGE_DECODER,
+            NotionReadOnlyFetchError,
+            response_label="Notion read-only query response",
+            notion_version=self.NOTION_VERSION,
+        )
 
 
 def list_source_records(adapter: ReadOnlyNotionSourceAdapter) -> list[dict[str, Any]]:
@@ -25,6 +25,7 @@ from dysonx_notion_readonly_adapter import (
     ReadOnlyNotionSourceAdapter,
 )
 from dysonx_notion_source_schema import validate_notion_source_record
+from dysonx_notion_transport import notion_transport_stats
 from dysonx_source_config_loader import notion_record_to_source
 from dysonx_source_sync_storage import STORE_VERSION, write_source_sync_store
 
@@ -144,6 +145,9 @@ def sync_sources(
         "llm_outputs_stored": False,
         "publish_packages_stored": False,
     }
+    transport_stats = notion_transport_stats(getattr(adapter, "transport", None))
+    if transport_stats is not None:
+        report["notion_transport"] = transport_stats
     write_json(report_path, report)
     return report
 
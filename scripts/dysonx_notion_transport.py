@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""Shared rate-limit-aware Notion HTTP transport for DysonX Notion clients.
+
+Notion allows roughly three requests per second per integration and answers
+bursts with HTTP 429 and a `Retry-After` header. This transport paces every
+request through a process-wide token bucket, retries 429, 5xx, and connection
+failures with jittered exponential backoff, honours `Retry-After`, and keeps
+per-run counters. Writes (`POST /v1/pages`, `PATCH`) are only replayed when
+Notion cannot have applied them: on 429, on 503 with `Retry-After`, or when
+the request failed before it was sent. Requests reuse keep-alive connections
+from a pool shared by all threads instead of opening a new TLS session for
+every call. It is a drop-in callable for the existing `transport`
+injection points of the collector, the public Signals sync, and the read-only
+source adapter.
+"""
+
+from __future__ import annotations
+
+import email.utils
+import http.client
+import json
+import random
+import select
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass, field
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+
+NOTION_REQUESTS_PER_SECOND = 3.0
+NOTION_BURST = 3
+NOTION_MAX_RETRIES = 5
+NOTION_BASE_BACKOFF_SECONDS = 1.0
+NOTION_MAX_BACKOFF_SECONDS = 30.0
+NOTION_TIMEOUT_SECONDS = 30
+KEEP_ALIVE_MAX_IDLE_PER_HOST = 8
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+# Notion's database query and search endpoints are read-only POSTs.
+READ_ONLY_POST_SUFFIXES = ("/query", "/search")
+
+
+class NotionTransportError(RuntimeError):
+    """Raised when a Notion request fails after retries; clients may substitute their own error class."""
+
+
+class NotionRequestNotSent(OSError):
+    """Raised by an `HttpSend` when the request failed before any of it reached the server."""
+
+
+def replay_safe(method: str, url: str) -> bool:
+    """Return whether replaying the request cannot apply a change twice."""
+    method = method.upper()
+    if method in IDEMPOTENT_METHODS:
+        return True
+    return method == "POST" and urlsplit(url).path.rstrip("/").endswith(READ_ONLY_POST_SUFFIXES)
+
+
+# (url, headers, body, method, timeout) -> (status, response headers, response body)
+HttpSend = Callable[[str, dict[str, str], bytes | None, str, float], tuple[int, dict[str, str], bytes]]
+
+
+def urllib_send(url: str, headers: dict[str, str], data: bytes | None, method: str, timeout: float) -> tuple[int, dict[str, str], bytes]:
+    request = urllib.request.Request(url, data=data, headers=headers, method=method)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status, {key.lower(): value for key, value in response.headers.items()}, response.read()
+    except urllib.error.HTTPError as exc:
+        return exc.code, {key.lower(): value for key, value in exc.headers.items()}, exc.read()
+    except urllib.error.URLError as exc:
+        if isinstance(exc.reason, (ConnectionRefusedError, socket.gaierror)):
+            raise NotionRequestNotSent(str(exc)) from exc
+        raise
+
+
+def connection_dropped(connection: http.client.HTTPConnection) -> bool:
+    """Return whether an idle connection was closed by the server (its socket is readable or gone)."""
+    sock = connection.sock
+    if sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+class KeepAliveSend:
+    """HttpSend that keeps idle persistent connections in a pool shared by all threads.
+
+    A request checks out an idle connection for its host, or opens a new one, and checks it back in
+    afterwards, so connections outlive the short-lived worker threads that used them and `close`
+    reaches every one of them. Idle connections the server already closed are dropped at checkout.
+    A reused connection that fails before any response arrived (`RemoteDisconnected`, a reset, or a
+    broken pipe) is replaced and the request sent once more, but only when it is safe to replay;
+    every other failure surfaces as an `OSError` for the transport's retry policy.
+    """
+
+    STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+    def __init__(self, max_idle_per_host: int = KEEP_ALIVE_MAX_IDLE_PER_HOST) -> None:
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def checkout(self, key: tuple[str, str]) -> http.client.HTTPConnection | None:
+        dropped = []
+        connection = None
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle and connection is None:
+                candidate = idle.pop()
+                if connection_dropped(candidate):
+                    dropped.append(candidate)
+                else:
+                    connection = candidate
+        for candidate in dropped:
+            candidate.close()
+        return connection
+
+    def checkin(self, key: tuple[str, str], connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def idle_connections(self) -> int:
+        with self._lock:
+            return sum(len(idle) for idle in self._idle.values())
+
+    def close(self) -> None:
+        with self._lock:
+            connections = [connection for idle in self._idle.values() for connection in idle]
+            self._idle.clear()
+        for connection in connections:
+            connection.close()
+
+    def __call__(self, url: str, headers: dict[str, str], data: bytes | None, method: str, timeout: float) -> tuple[int, dict[str, str], bytes]:
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        for attempt in range(2):
+            connection = self.checkout(key)
+            reused = connection is not None
+            if connection is None:
+                connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+                connection = connection_class(parts.netloc, timeout=timeout)
+                try:
+                    connection.connect()
+                except OSError as exc:
+                    connection.close()
+                    raise NotionRequestNotSent(f"{type(exc).__name__}: {exc}") from exc
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            try:
+                connection.request(method, target, body=data, headers=headers)
+                response = connection.getresponse()
+            except self.STALE_CONNECTION_ERRORS as exc:
+                connection.close()
+                if reused and attempt == 0 and replay_safe(method, url):
+                    continue
+                raise OSError(f"{type(exc).__name__}: {exc}") from exc
+            except (http.client.HTTPException, OSError) as exc:
+                connection.close()
+                raise OSError(f"{type(exc).__name__}: {exc}") from exc
+            try:
+                body = response.read()
+            except (http.client.HTTPException, OSError) as exc:
+                connection.close()
+                raise OSError(f"{type(exc).__name__}: {exc}") from exc
+            if response.will_close:
+                connection.close()
+            else:
+                self.checkin(key, connection)
+            return response.status, {name.lower(): value for name, value in response.getheaders()}, body
+        raise OSError("Notion connection could not be established")
+
+
+class TokenBucket:
+    """Thread-safe token bucket; `acquire` blocks until a token is available and returns the seconds waited."""
+
+    def __init__(
+        self,
+        rate: float = NOTION_REQUESTS_PER_SECOND,
+        capacity: int = NOTION_BURST,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = float(self.capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+
+DEFAULT_NOTION_RATE_LIMITER = TokenBucket()
+
+
+@dataclass
+class NotionTransportStats:
+    requests: int = 0
+    retries: int = 0
+    rate_limited_responses: int = 0
+    server_error_responses: int = 0
+    connection_errors: int = 0
+    throttle_wait_seconds: float = 0.0
+    backoff_wait_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, **counters: float) -> None:
+        with self._lock:
+            for name, value in counters.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "rate_limited_responses": self.rate_limited_responses,
+                "server_error_responses": self.server_error_responses,
+                "connection_errors": self.connection_errors,
+                "throttle_wait_seconds": round(self.throttle_wait_seconds, 3),
+                "backoff_wait_seconds": round(self.backoff_wait_seconds, 3),
+            }
+
+
+def retry_after_seconds(value: str | None, now: Callable[[], float] = time.time) -> float | None:
+    """Parse a `Retry-After` header given as delay seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - now())
+
+
+class RateLimitedNotionTransport:
+    """Callable Notion transport with token-bucket pacing and retry/backoff on 429, 5xx, and connection errors.
+
+    Reads and database queries get the full retry policy. Other writes are retried only on 429, on 503
+    with `Retry-After`, and on `NotionRequestNotSent`; a timeout or 5xx after a create was sent is
+    reported instead of replayed, so a row Notion already accepted is not written twice.
+    """
+
+    def __init__(
+        self,
+        *,
+        error_class: type[Exception] = NotionTransportError,
+        error_prefix: str = "Notion request failed",
+        limiter: TokenBucket | None = None,
+        max_retries: int = NOTION_MAX_RETRIES,
+        base_backoff_seconds: float = NOTION_BASE_BACKOFF_SECONDS,
+        max_backoff_seconds: float = NOTION_MAX_BACKOFF_SECONDS,
+        timeout: float = NOTION_TIMEOUT_SECONDS,
+        send: HttpSend | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[], float] = random.random,
+    ):
+        self.error_class = error_class
+        self.error_prefix = error_prefix
+        self.limiter = limiter or DEFAULT_NOTION_RATE_LIMITER
+        self.max_retries = max_retries
+        self.base_backoff_seconds = base_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.timeout = timeout
+        self.send = send or KeepAliveSend()
+        self.sleep = sleep
+        self.jitter = jitter
+        self.stats = NotionTransportStats()
+
+    def reset_stats(self) -> None:
+        self.stats = NotionTransportStats()
+
+    def backoff_seconds(self, attempt: int, retry_after: float | None) -> float:
+        if retry_after is not None:
+            return retry_after
+        ceiling = min(self.max_backoff_seconds, self.base_backoff_seconds * (2**attempt))
+        return ceiling / 2 + self.jitter() * ceiling / 2
+
+    def __call__(self, url: str, headers: dict[str, str], payload: dict[str, Any] | None = None, method: str | None = None) -> dict[str, Any]:
+        method = method or ("POST" if payload is not None else "GET")
+        data = json.dumps(payload).encode("utf-8") if payload is not None else None
+        safe = replay_safe(method, url)
+        failure = ""
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.stats.add(retries=1)
+            self.stats.add(requests=1, throttle_wait_seconds=self.limiter.acquire())
+            retry_after: float | None = None
+            try:
+                status, response_headers, body = self.send(url, headers, data, method, self.timeout)
+            except NotionRequestNotSent as exc:
+                self.stats.add(connection_errors=1)
+                failure = str(exc)
+            except (urllib.error.URLError, OSError) as exc:
+                self.stats.add(connection_errors=1)
+                failure = str(exc)
+                if not safe:
+                    raise self.error_class(f"{self.error_prefix}: {failure} ({method} not retried; it may have been applied)") from exc
+            else:
+                if status < 400:
+                    return self.decode(body)
+                failure = f"HTTP Error {status}: {body[:300].decode('utf-8', errors='ignore')}"
+                if status not in RETRYABLE_STATUSES:
+                    raise self.error_class(f"{self.error_prefix}: {failure}")
+                retry_after = retry_after_seconds(response_headers.get("retry-after"))
+                if status == 429:
+                    self.stats.add(rate_limited_responses=1)
+                else:
+                    self.stats.add(server_error_responses=1)
+                    if not safe and (status != 503 or retry_after is None):
+                        raise self.error_class(f"{self.error_prefix}: {failure} ({method} not retried; it may have been applied)")
+            if attempt < self.max_retries:
+                wait = self.backoff_seconds(attempt, retry_after)
+                self.stats.add(backoff_wait_seconds=wait)
+                self.sleep(wait)
+        raise self.error_class(f"{self.error_prefix} after {self.max_retries + 1} attempts: {failure}")
+
+    def decode(self, body: bytes) -> dict[str, Any]:
+        if not body:
+            return {}
+        try:
+            data = json.loads(body.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise self.error_class(f"{self.error_prefix}: invalid JSON response: {exc}") from exc
+        if not isinstance(data, dict):
+            raise self.error_class(f"{self.error_prefix}: Notion returned a non-object response")
+        return data
+
+
+def notion_transport_stats(transport: Any) -> dict[str, Any] | None:
+    """Return per-run counters when `transport` is a rate-limited Notion transport."""
+    if isinstance(transport, RateLimitedNotionTransport):
+        return transport.stats.as_dict()
+    return None
@@ -23,6 +23,9 @@ from dysonx_public_signals_contract import (
     ARTIFACT_RSS_XML,
     ARTIFACT_SIGNAL_HTML,
     ARTIFACT_SIGNALS_INDEX_HTML,
+    ARTIFACT_SIGNALS_PAGE_HTML,
+    ARTIFACT_SITEMAP_INDEX_XML,
+    ARTIFACT_SITEMAP_SHARD_XML,
     ARTIFACT_SITEMAP_XML,
     PUBLIC_SIGNAL_CONTRACT_VERSION,
     artifact_class_for_path,
@@ -31,6 +34,7 @@ from dysonx_public_signals_contract import (
     normalize_public_path,
     public_seo_base_url,
     signal_slug_from_public_path,
+    sitemap_shard_number_from_public_path,
 )
 from dysonx_public_signals_topic_policy import (
     has_core_public_topic as topic_has_core_public_topic,
@@ -67,6 +71,7 @@ ARTIFACT_MANIFEST_ALLOWED_ENTRY_FIELDS = {
     "contract_version",
     "generated_from_public_signal_manifest",
     "material_signature",
+    "membership_hash",
     "path",
     "policy_version",
     "slug",
@@ -197,6 +202,7 @@ def validate_json_ld_script(script: dict[str, Any], artifact_class: str, label:
     allowed_types = {
         ARTIFACT_SIGNAL_HTML: {"TechArticle", "Article"},
         ARTIFACT_SIGNALS_INDEX_HTML: {"Organization"},
+        ARTIFACT_SIGNALS_PAGE_HTML: {"Organization"},
     }.get(artifact_class, set())
     if not allowed_types:
         raise AutoMergeGateError(f"{label} is not allowed to contain JSON-LD")
@@ -256,13 +262,13 @@ def check_html_file(path: pathlib.Path, root: pathlib.Path, artifact_class: str,
 
 def validate_robots(path: pathlib.Path, seo_base_url: str) -> None:
     text = path.read_text(encoding="utf-8")
-    expected = f"User-agent: *\nAllow: /\nSitemap: {seo_base_url}/sitemap.xml\n"
+    expected = f"User-agent: *\nAllow: /\nSitemap: {seo_base_url}/sitemap_index.xml\n"
     fail_if_forbidden_text(text, str(path))
     if text != expected:
-        raise AutoMergeGateError("robots.txt must only allow crawling and point to the production sitemap")
+        raise AutoMergeGateError("robots.txt must only allow crawling and point to the production sitemap index")
 
 
-def validate_sitemap(path: pathlib.Path, launched_slugs: set[str], seo_base_url: str) -> None:
+def validate_sitemap(path: pathlib.Path, launched_slugs: set[str], seo_base_url: str, *, require_core: bool = True) -> None:
     text = path.read_text(encoding="utf-8")
     fail_if_forbidden_text(text, str(path))
     root = ET.fromstring(text)
@@ -279,8 +285,34 @@ def validate_sitemap(path: pathlib.Path, launched_slugs: set[str], seo_base_url:
             raise AutoMergeGateError(f"sitemap lastmod must be stable YYYY-MM-DD: {lastmod}")
         found_urls.add(loc)
     required = {f"{seo_base_url}/", f"{seo_base_url}/signals/"}
-    if not required.issubset(found_urls):
+    if require_core and not required.issubset(found_urls):
         raise AutoMergeGateError("sitemap must include homepage and /signals/")
+    if not require_core and found_urls.intersection(required):
+        raise AutoMergeGateError("sitemap shards must only list Signal pages")
+
+
+def validate_sitemap_index(path: pathlib.Path, root: pathlib.Path, seo_base_url: str) -> None:
+    text = path.read_text(encoding="utf-8")
+    fail_if_forbidden_text(text, str(path))
+    root_node = ET.fromstring(text)
+    namespace = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+    if root_node.tag != "{http://www.sitemaps.org/schemas/sitemap/0.9}sitemapindex":
+        raise AutoMergeGateError("sitemap_index.xml must be a sitemapindex document")
+    found_shards: set[int] = set()
+    for sitemap_node in root_node.findall("sm:sitemap", namespace):
+        loc = (sitemap_node.findtext("sm:loc", default="", namespaces=namespace) or "").strip()
+        lastmod = (sitemap_node.findtext("sm:lastmod", default="", namespaces=namespace) or "").strip()
+        prefix = f"{seo_base_url}/"
+        shard = sitemap_shard_number_from_public_path(loc[len(prefix):]) if loc.startswith(prefix) else None
+        if shard is None:
+            raise AutoMergeGateError(f"sitemap index contains non-canonical sitemap URL: {loc}")
+        if not (root / loc[len(prefix):]).exists():
+            raise AutoMergeGateError(f"sitemap index points to a missing sitemap: {loc}")
+        if not re.fullmatch(r"\d{4}-\d{2}-\d{2}", lastmod):
+            raise AutoMergeGateError(f"sitemap index lastmod must be stable YYYY-MM-DD: {lastmod}")
+        found_shards.add(shard)
+    if 1 not in found_shards:
+        raise AutoMergeGateError("sitemap index must include sitemap.xml")
 
 
 def validate_rss(path: pathlib.Path, entries: dict[str, dict[str, Any]], seo_base_url: str) -> None:
@@ -458,11 +490,19 @@ def artifact_entries_by_path(artifact_manifest: dict[str, Any]) -> dict[str, dic
     return entries
 
 
-def validate_changed_files_declared(changed_files: list[str], artifact_entries: dict[str, dict[str, Any]]) -> None:
+# Listing pages and sitemap shards that no longer hold any Signal are deleted by the sync.
+REMOVABLE_ARTIFACT_CLASSES = {ARTIFACT_SIGNALS_PAGE_HTML, ARTIFACT_SITEMAP_SHARD_XML}
+
+
+def is_removed_listing_artifact(path: str, root: pathlib.Path, artifact_entries: dict[str, dict[str, Any]]) -> bool:
+    return path not in artifact_entries and not (root / path).exists() and artifact_class_for_path(path) in REMOVABLE_ARTIFACT_CLASSES
+
+
+def validate_changed_files_declared(changed_files: list[str], artifact_entries: dict[str, dict[str, Any]], root: pathlib.Path) -> None:
     for changed_file in changed_files:
         if not is_allowed_changed_file(changed_file):
             raise AutoMergeGateError(f"changed file is outside allowed public Signals paths: {changed_file}")
-        if changed_file not in artifact_entries:
+        if changed_file not in artifact_entries and not is_removed_listing_artifact(changed_file, root, artifact_entries):
             raise AutoMergeGateError(f"changed public artifact is not declared: {changed_file}")
 
 
@@ -470,12 +510,16 @@ def validate_public_artifact(path: str, root: pathlib.Path, artifact_class: str,
     full_path = root / path
     if not full_path.exists():
         raise AutoMergeGateError(f"changed public artifact is missing: {path}")
-    if artifact_class in {ARTIFACT_SIGNAL_HTML, ARTIFACT_SIGNALS_INDEX_HTML}:
+    if artifact_class in {ARTIFACT_SIGNAL_HTML, ARTIFACT_SIGNALS_INDEX_HTML, ARTIFACT_SIGNALS_PAGE_HTML}:
         check_html_file(full_path, root, artifact_class, seo_base_url)
     elif artifact_class == ARTIFACT_ROBOTS_TXT:
         validate_robots(full_path, seo_base_url)
     elif artifact_class == ARTIFACT_SITEMAP_XML:
         validate_sitemap(full_path, set(entries), seo_base_url)
+    elif artifact_class == ARTIFACT_SITEMAP_SHARD_XML:
+        validate_sitemap(full_path, set(entries), seo_base_url, require_core=False)
+    elif artifact_class == ARTIFACT_SITEMAP_INDEX_XML:
+        validate_sitemap_index(full_path, root, seo_base_url)
     elif artifact_class == ARTIFACT_RSS_XML:
         validate_rss(full_path, entries, seo_base_url)
     elif artifact_class == ARTIFACT_JSON_FEED:
@@ -501,7 +545,7 @@ def run_gate(args: argparse.Namespace) -> None:
     artifact_entries = artifact_entries_by_path(artifact_manifest)
 
     changed_files = load_changed_files(args.changed_files_json)
-    validate_changed_files_declared(changed_files, artifact_entries)
+    validate_changed_files_declared(changed_files, artifact_entries, root)
 
     entries = launched_by_slug(manifest)
     slugs_to_check = changed_signal_slugs(changed_files, manifest)
@@ -521,7 +565,7 @@ def run_gate(args: argparse.Namespace) -> None:
             require_safe_summary_only=args.require_safe_summary_only,
         )
 
-    paths_to_check = set(changed_files)
+    paths_to_check = {path for path in changed_files if not is_removed_listing_artifact(path, root, artifact_entries)}
     if not changed_files:
         paths_to_check = {
             "signals/index.html",
@@ -529,6 +573,7 @@ def run_gate(args: argparse.Namespace) -> None:
             "signals/public_artifact_manifest.json",
             "robots.txt",
             "sitemap.xml",
+            "sitemap_index.xml",
             "rss.xml",
             "feed.json",
             *[f"signals/{slug}/index.html" for slug in slugs_to_check],
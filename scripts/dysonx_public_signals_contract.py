@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import pathlib
+import re
 from typing import Any
 
 
@@ -13,20 +14,26 @@ CNAME_FILE = "CNAME"
 
 ARTIFACT_SIGNAL_HTML = "signal_html"
 ARTIFACT_SIGNALS_INDEX_HTML = "signals_index_html"
+ARTIFACT_SIGNALS_PAGE_HTML = "signals_page_html"
 ARTIFACT_PUBLIC_LAUNCH_MANIFEST = "public_launch_manifest"
 ARTIFACT_PUBLIC_ARTIFACT_MANIFEST = "public_artifact_manifest"
 ARTIFACT_ROBOTS_TXT = "robots_txt"
 ARTIFACT_SITEMAP_XML = "sitemap_xml"
+ARTIFACT_SITEMAP_INDEX_XML = "sitemap_index_xml"
+ARTIFACT_SITEMAP_SHARD_XML = "sitemap_shard_xml"
 ARTIFACT_RSS_XML = "rss_xml"
 ARTIFACT_JSON_FEED = "json_feed"
 
 ALLOWED_ARTIFACT_CLASSES = {
     ARTIFACT_SIGNAL_HTML,
     ARTIFACT_SIGNALS_INDEX_HTML,
+    ARTIFACT_SIGNALS_PAGE_HTML,
     ARTIFACT_PUBLIC_LAUNCH_MANIFEST,
     ARTIFACT_PUBLIC_ARTIFACT_MANIFEST,
     ARTIFACT_ROBOTS_TXT,
     ARTIFACT_SITEMAP_XML,
+    ARTIFACT_SITEMAP_INDEX_XML,
+    ARTIFACT_SITEMAP_SHARD_XML,
     ARTIFACT_RSS_XML,
     ARTIFACT_JSON_FEED,
 }
@@ -50,10 +57,19 @@ FORBIDDEN_CONTENT_CLASSES = {
 ROOT_ARTIFACT_CLASSES = {
     "robots.txt": ARTIFACT_ROBOTS_TXT,
     "sitemap.xml": ARTIFACT_SITEMAP_XML,
+    "sitemap_index.xml": ARTIFACT_SITEMAP_INDEX_XML,
     "rss.xml": ARTIFACT_RSS_XML,
     "feed.json": ARTIFACT_JSON_FEED,
 }
 
+# `signals/index.html` and the `signals/page/` tree are not Signal pages.
+RESERVED_SIGNAL_SLUGS = {"index", "page"}
+
+# Paginated Signals pages live at signals/page/<N>/index.html and sitemap
+# shards after the first (which keeps the sitemap.xml path) at sitemap-<N>.xml.
+SIGNALS_PAGE_PATH_PATTERN = re.compile(r"signals/page/([1-9][0-9]*)/index\.html")
+SITEMAP_SHARD_PATH_PATTERN = re.compile(r"sitemap-([2-9]|[1-9][0-9]+)\.xml")
+
 SIGNALS_ARTIFACT_CLASSES = {
     "signals/index.html": ARTIFACT_SIGNALS_INDEX_HTML,
     "signals/public_launch_manifest.json": ARTIFACT_PUBLIC_LAUNCH_MANIFEST,
@@ -80,9 +96,30 @@ def public_seo_base_url(root: pathlib.Path | str = ".") -> str:
     return f"https://{public_domain_from_cname(root)}"
 
 
+def signals_page_public_path(page: int) -> str:
+    return f"signals/page/{page}/index.html"
+
+
+def signals_page_number_from_public_path(path: str | pathlib.PurePath) -> int | None:
+    match = SIGNALS_PAGE_PATH_PATTERN.fullmatch(normalize_public_path(path))
+    return int(match.group(1)) if match else None
+
+
+def sitemap_shard_public_path(shard: int) -> str:
+    return "sitemap.xml" if shard == 1 else f"sitemap-{shard}.xml"
+
+
+def sitemap_shard_number_from_public_path(path: str | pathlib.PurePath) -> int | None:
+    normalized = normalize_public_path(path)
+    if normalized == "sitemap.xml":
+        return 1
+    match = SITEMAP_SHARD_PATH_PATTERN.fullmatch(normalized)
+    return int(match.group(1)) if match else None
+
+
 def signal_slug_from_public_path(path: str | pathlib.PurePath) -> str | None:
     parts = pathlib.PurePosixPath(normalize_public_path(path)).parts
-    if len(parts) == 3 and parts[0] == "signals" and parts[2] == "index.html" and parts[1] != "index":
+    if len(parts) == 3 and parts[0] == "signals" and parts[2] == "index.html" and parts[1] not in RESERVED_SIGNAL_SLUGS:
         return parts[1]
     return None
 
@@ -95,13 +132,17 @@ def artifact_class_for_path(path: str | pathlib.PurePath) -> str | None:
         return SIGNALS_ARTIFACT_CLASSES[normalized]
     if signal_slug_from_public_path(normalized):
         return ARTIFACT_SIGNAL_HTML
+    if signals_page_number_from_public_path(normalized):
+        return ARTIFACT_SIGNALS_PAGE_HTML
+    if SITEMAP_SHARD_PATH_PATTERN.fullmatch(normalized):
+        return ARTIFACT_SITEMAP_SHARD_XML
     return None
 
 
 def allowed_embeds_for_artifact_class(artifact_class: str) -> list[str]:
     if artifact_class == ARTIFACT_SIGNAL_HTML:
         return [SAFE_EMBED_JSON_LD_ARTICLE]
-    if artifact_class == ARTIFACT_SIGNALS_INDEX_HTML:
+    if artifact_class in {ARTIFACT_SIGNALS_INDEX_HTML, ARTIFACT_SIGNALS_PAGE_HTML}:
         return [SAFE_EMBED_JSON_LD_ORGANIZATION]
     return []
 
@@ -116,7 +157,7 @@ def artifact_slug(path: str | pathlib.PurePath, artifact_class: str) -> str | No
     return None
 
 
-def build_artifact_entry(path: str, material_signature: str, *, generated: bool = True) -> dict[str, Any]:
+def build_artifact_entry(path: str, material_signature: str, *, generated: bool = True, membership_hash: str = "") -> dict[str, Any]:
     artifact_class = artifact_class_for_path(path)
     if artifact_class not in ALLOWED_ARTIFACT_CLASSES:
         raise ValueError(f"unsupported public artifact path: {path}")
@@ -132,4 +173,6 @@ def build_artifact_entry(path: str, material_signature: str, *, generated: bool
     slug = artifact_slug(path, artifact_class)
     if slug:
         entry["slug"] = slug
+    if membership_hash:
+        entry["membership_hash"] = membership_hash
     return entry
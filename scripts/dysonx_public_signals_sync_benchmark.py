@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""DysonX public Signals sync benchmark.
+
+Times the public Signals sync on synthetic Notion-shaped records so scaling
+can be checked as the inventory grows. The core suite runs the in-memory part
+of `sync_records` (eligibility, ranking, manifest, page and sitemap shard
+placement, sitemap shards and feeds) and, for
+sizes up to `--legacy-max-records`, the previous ranking and page-selection
+code, which re-sorted three times and scanned every eligible record per page.
+The sync suite runs `sync_records` end to end into a temporary output root,
+optionally with `--workers` rendering processes. It never touches the network,
+Notion, or OpenAI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+import tempfile
+from time import perf_counter
+from typing import Any
+
+import dysonx_notion_public_signals_sync as sync
+
+
+REFRESHED_AT = "2026-06-27T00:00:00Z"
+SEO_BASE_URL = "https://example.com"
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+
+def benchmark_records(record_count: int) -> list[dict[str, Any]]:
+    records = []
+    for index in range(record_count):
+        records.append(
+            {
+                "Signal ID": f"sig_bench_{index:06d}",
+                "Signal Title": f"Benchmark AI agent evaluation Signal {index:06d}",
+                # Every tenth slug repeats so duplicate selection is exercised.
+                "Slug": f"benchmark-signal-{index - index % 10 if index % 10 == 9 else index:06d}",
+                "Summary": f"Summary-only benchmark Signal {index:06d} about AI agent evaluation benchmarks.",
+                "Why This Matters": "Agent evaluation results affect how far agentic systems can be trusted.",
+                "AGI Relevance": ("Medium", "High", "Critical")[index % 3],
+                "Source URL": f"https://example.org/benchmark/{index:06d}",
+                "Source Label": "Benchmark Research Source",
+                "Source Priority": ("High", "Critical", "Medium")[index % 3],
+                "Ready for Pipeline": index % 2 == 0,
+                "Published": index % 4 != 1,
+                "Attribution Status": "Complete",
+                "Copyright Status": "Safe Summary Only",
+                "Quality Hint": 80 + index % 16,
+                "Published Date": f"2026-06-{1 + index % 28:02d}T00:00:00Z",
+                "Tags": ["Agents", "Evaluation"],
+            }
+        )
+    return records
+
+
+def legacy_rank(eligible: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    ranked = sorted(eligible, key=lambda record: (sync.public_signal_sort_key(record), sync.deterministic_identity_key(record)))
+    unique: dict[str, dict[str, Any]] = {}
+    for record in ranked:
+        unique.setdefault(record["slug"], record)
+    ranked_eligible = sorted(unique.values(), key=sync.public_signal_sort_key)
+    merged = sorted({record["slug"]: record for record in ranked_eligible}.values(), key=sync.public_signal_sort_key)
+    # The page loop checked membership by scanning every eligible record.
+    for record in merged:
+        any(item["slug"] == record["slug"] for item in eligible)
+    return merged
+
+
+def run_core(records: list[dict[str, Any]], legacy: bool = False) -> list[dict[str, Any]]:
+    decisions = [sync.public_topic_decision(record) for record in records]
+    blockers = [sync.eligibility_blockers(record, decision) for record, decision in zip(records, decisions)]
+    eligible = [sync.record_from_notion(record, decision) for record, decision, reasons in zip(records, decisions, blockers) if not reasons]
+    merged = legacy_rank(eligible) if legacy else sync.rank_public_signals(eligible, [])
+    manifest = sync.build_manifest(merged, len(records) - len(eligible), REFRESHED_AT, sync.signal_page_fingerprint(SEO_BASE_URL))
+    sync.plan_signal_listings(manifest["launched"], None, REFRESHED_AT, SEO_BASE_URL)
+    sync.build_artifact_manifest(merged, manifest)
+    sync.build_sync_report(records, [], eligible, blockers=blockers)
+    for _, render in sync.sitemap_shard_artifacts(sync.sitemap_shard_urls(manifest["launched"], REFRESHED_AT), SEO_BASE_URL).values():
+        render()
+    sync.render_rss(merged[: sync.DEFAULT_RSS_ITEM_LIMIT], REFRESHED_AT, SEO_BASE_URL)
+    sync.render_json_feed(merged[: sync.DEFAULT_JSON_FEED_ITEM_LIMIT], REFRESHED_AT, SEO_BASE_URL)
+    return merged
+
+
+def timed(function: Any, *args: Any, **kwargs: Any) -> tuple[float, Any]:
+    started = perf_counter()
+    result = function(*args, **kwargs)
+    return perf_counter() - started, result
+
+
+def scaling_summary(runs: list[dict[str, Any]], seconds_key: str) -> float:
+    """Per-record time at the largest size divided by the smallest; about 1 means linear."""
+    timed_runs = [run for run in runs if run.get(seconds_key)]
+    if len(timed_runs) < 2:
+        return 0.0
+    first, last = timed_runs[0], timed_runs[-1]
+    return round((last[seconds_key] / last["records"]) / (first[seconds_key] / first["records"]), 2)
+
+
+def run_core_benchmark(sizes: tuple[int, ...] = DEFAULT_SIZES, legacy_max_records: int = 5_000) -> dict[str, Any]:
+    runs = []
+    for size in sizes:
+        records = benchmark_records(size)
+        core_seconds, merged = timed(run_core, records)
+        run: dict[str, Any] = {
+            "records": size,
+            "published_total": len(merged),
+            "core_seconds": round(core_seconds, 4),
+            "core_microseconds_per_record": round(core_seconds / size * 1_000_000, 2),
+        }
+        if size <= legacy_max_records:
+            legacy_seconds, legacy_merged = timed(run_core, records, legacy=True)
+            run["legacy_core_seconds"] = round(legacy_seconds, 4)
+            run["rankings_identical"] = [record["slug"] for record in legacy_merged] == [record["slug"] for record in merged]
+        runs.append(run)
+    return {
+        "benchmark": "public_signals_sync_core",
+        "runs": runs,
+        "core_scaling_per_record": scaling_summary(runs, "core_seconds"),
+        "legacy_scaling_per_record": scaling_summary(runs, "legacy_core_seconds"),
+    }
+
+
+def run_sync_benchmark(sizes: tuple[int, ...] = DEFAULT_SIZES[:2], workers: int = 1) -> dict[str, Any]:
+    runs = []
+    for size in sizes:
+        records = benchmark_records(size)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_root = pathlib.Path(temp_dir)
+            (output_root / "CNAME").write_text("example.com\n", encoding="utf-8")
+            report_path = output_root / "tmp" / "report.json"
+            first_seconds, _ = timed(sync.sync_records, records, output_root, refreshed_at=REFRESHED_AT, output_report=report_path, workers=workers)
+            rerun_seconds, _ = timed(
+                sync.sync_records, records, output_root, refreshed_at="2026-06-28T00:00:00Z", output_report=report_path, workers=workers
+            )
+            rerun_report = json.loads(report_path.read_text(encoding="utf-8"))
+        runs.append(
+            {
+                "records": size,
+                "first_sync_seconds": round(first_seconds, 4),
+                "unchanged_rerun_seconds": round(rerun_seconds, 4),
+                "unchanged_rerun_bytes_written": rerun_report["bytes_written"],
+            }
+        )
+    return {
+        "benchmark": "public_signals_sync_end_to_end",
+        "workers": workers,
+        "runs": runs,
+        "first_sync_scaling_per_record": scaling_summary(runs, "first_sync_seconds"),
+        "unchanged_rerun_scaling_per_record": scaling_summary(runs, "unchanged_rerun_seconds"),
+    }
+
+
+def parse_sizes(value: str) -> tuple[int, ...]:
+    try:
+        sizes = tuple(sorted({int(item) for item in value.split(",") if item.strip()}))
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid sizes: {value}") from exc
+    if not sizes or sizes[0] <= 0:
+        raise argparse.ArgumentTypeError("sizes must be positive integers")
+    return sizes
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the DysonX public Signals sync on synthetic records.")
+    parser.add_argument("--suite", choices=("core", "sync"), default="core", help="Benchmark to run.")
+    parser.add_argument("--sizes", type=parse_sizes, help="Comma-separated record counts (core default 1000,10000,100000; sync default 1000,10000).")
+    parser.add_argument("--workers", type=int, default=1, help="Page rendering processes for the sync suite.")
+    parser.add_argument("--legacy-max-records", type=int, default=5_000, help="Largest size the quadratic legacy core is timed at.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    try:
+        if args.suite == "sync":
+            report = run_sync_benchmark(args.sizes or DEFAULT_SIZES[:2], args.workers)
+        else:
+            report = run_core_benchmark(args.sizes or DEFAULT_SIZES, args.legacy_max_records)
+    except (OSError, sync.NotionPublicSignalsSyncError) as exc:
+        print(f"[public-signals-sync-benchmark] failed: {exc}", file=sys.stderr)
+        return 2
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -113,10 +113,12 @@ def normalize_text(value: Any) -> str:
 
 
 def field(record: dict[str, Any], *names: str) -> Any:
-    lowered = {key.lower(): value for key, value in record.items()}
+    lowered: dict[str, Any] | None = None
     for name in names:
         if name in record:
             return record[name]
+        if lowered is None:
+            lowered = {key.lower(): value for key, value in record.items()}
         value = lowered.get(name.lower())
         if value is not None:
             return value
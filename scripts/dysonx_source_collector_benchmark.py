@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""DysonX Source Collector V1 benchmark.
+
+Replays the offline Source Collector fixtures through `build_candidates` with a
+simulated per-fetch latency so serial and concurrent collection can be compared
+on wall-clock time. The classifier suite times `candidate_from_item` per item
+against the previous substring-scanning classifier. It never touches the
+network, Notion, or OpenAI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+import time
+from time import perf_counter
+from typing import Any
+
+import dysonx_source_collector_v1 as collector
+
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+FIXTURES = ROOT / "tests" / "fixtures" / "source_collector_v1"
+FEED_FIXTURES = (FIXTURES / "rss_feed_sample.xml", FIXTURES / "arxiv_feed_sample.xml")
+
+
+def benchmark_source_records(source_count: int) -> tuple[list[dict[str, Any]], dict[str, pathlib.Path]]:
+    records: list[dict[str, Any]] = []
+    fetch_map: dict[str, pathlib.Path] = {}
+    for index in range(source_count):
+        url = f"https://bench-{index:04d}.example.org/rss.xml"
+        records.append(
+            {
+                "_notion_page_id": f"bench_source_{index:04d}",
+                "Name": f"Benchmark AI Feed {index:04d}",
+                "URL": url,
+                "Source Type": "RSS",
+                "Platform": "RSS",
+                "Priority": "High",
+                "Authority Score": 90,
+                "Enabled": True,
+            }
+        )
+        fetch_map[url] = FEED_FIXTURES[index % len(FEED_FIXTURES)]
+    return records, fetch_map
+
+
+def delayed_fixture_fetcher(mapping: dict[str, pathlib.Path], latency_seconds: float) -> collector.FetchTransport:
+    fixture_fetch = collector.fixture_fetcher(mapping)
+
+    def fetch(url: str) -> str:
+        time.sleep(latency_seconds)
+        return fixture_fetch(url)
+
+    return fetch
+
+
+def timed_build(
+    records: list[dict[str, Any]], fetch: collector.FetchTransport, max_concurrency: int
+) -> tuple[float, dict[str, Any]]:
+    started = perf_counter()
+    result = collector.build_candidates(records, [], fetch=fetch, max_concurrency=max_concurrency)
+    return perf_counter() - started, result
+
+
+def run_fetch_benchmark(source_count: int = 32, latency_seconds: float = 0.05, max_concurrency: int = 8) -> dict[str, Any]:
+    records, fetch_map = benchmark_source_records(source_count)
+    fetch = delayed_fixture_fetcher(fetch_map, latency_seconds)
+    serial_seconds, serial_result = timed_build(records, fetch, 1)
+    concurrent_seconds, concurrent_result = timed_build(records, fetch, max_concurrency)
+    return {
+        "benchmark": "source_collector_concurrent_fetch",
+        "source_count": source_count,
+        "latency_seconds": latency_seconds,
+        "max_concurrency": max_concurrency,
+        "serial_seconds": round(serial_seconds, 4),
+        "concurrent_seconds": round(concurrent_seconds, 4),
+        "speedup": round(serial_seconds / concurrent_seconds, 2) if concurrent_seconds else 0.0,
+        "reports_identical": json.dumps(serial_result, sort_keys=True) == json.dumps(concurrent_result, sort_keys=True),
+    }
+
+
+# The substring classifier before it moved to one word-boundary token scan, kept as the benchmark baseline.
+LEGACY_AI_RELEVANCE_KEYWORDS = (
+    "ai",
+    "agi",
+    "agent",
+    "agents",
+    "agentic",
+    "model",
+    "models",
+    "evaluation",
+    "eval",
+    "compute",
+    "safety",
+    "policy",
+    "alignment",
+    "robotics",
+    "multimodal",
+    "inference",
+    "benchmark",
+    "foundation model",
+)
+
+
+def legacy_ai_relevance_text(item: collector.SourceItem) -> str:
+    text = f"{item.title} {item.summary} {item.source_type}".lower()
+    matches = [keyword for keyword in LEGACY_AI_RELEVANCE_KEYWORDS if keyword in text]
+    if not matches:
+        return "Low"
+    if any(keyword in matches for keyword in ("agi", "agent", "agents", "agentic", "evaluation", "compute", "safety", "policy")):
+        return "High"
+    return "Medium"
+
+
+def legacy_category_for(item: collector.SourceItem) -> str:
+    text = f"{item.title} {item.summary}".lower()
+    if "policy" in text or "government" in item.source_type.lower():
+        return "Policy"
+    if "safety" in text or "alignment" in text:
+        return "Safety"
+    if "arxiv" in item.source_type.lower() or "research" in text or "paper" in text:
+        return "Research"
+    if "agent" in text:
+        return "Research"
+    if "compute" in text or "inference" in text:
+        return "Compute"
+    return "Market Signal"
+
+
+def legacy_candidate_from_item(item: collector.SourceItem) -> dict[str, Any]:
+    source_url = collector.absolute_http_url(item.link)
+    attribution_complete = item.attribution_complete and bool(source_url)
+    score = min(95, max(45, item.authority_score))
+    if legacy_ai_relevance_text(item) == "Low":
+        score -= 20
+    if not item.attribution_complete or not item.link:
+        score -= 25
+    if len(item.summary) > 280:
+        score -= 10
+    if item.priority == "Critical":
+        score += 3
+    candidate = {
+        "Signal Title": item.title,
+        "Slug": collector.slugify(item.title),
+        "Source Name": item.source_name,
+        "Source URL": source_url,
+        "Source Priority": item.priority,
+        "Published Date": item.published_date,
+        "Category": legacy_category_for(item),
+        "AGI Relevance": legacy_ai_relevance_text(item),
+        "Summary": collector.safe_summary_only(item),
+        "Why It Matters": f"This source is a monitored DysonX {item.priority.lower()}-priority signal for {legacy_category_for(item).lower()} tracking.",
+        "Evidence": f"Metadata collected from {item.source_name}; no source-page body was copied.",
+        "Risk / Safety Notes": "Rule-based V1 candidate. Requires Owner review unless all auto-publish gates pass.",
+        "Attribution Status": collector.ATTRIBUTION_STATUS if attribution_complete else "Missing",
+        "Copyright Status": collector.COPYRIGHT_STATUS,
+        "Quality Hint": max(0, min(100, score)),
+        "Status": "Needs Owner Review",
+        "Ready for Pipeline": False,
+        "Published": False,
+        "Collector Version": "source_collector_v1",
+    }
+    if (
+        item.priority == "Critical"
+        and item.authority_score >= 85
+        and item.attribution_complete
+        and bool(collector.absolute_http_url(item.link))
+        and len(candidate["Summary"]) <= 260
+        and candidate["AGI Relevance"] != "Low"
+        and candidate["Quality Hint"] >= 92
+        and "raw" not in json.dumps(candidate).lower()
+    ):
+        candidate["Ready for Pipeline"] = True
+        candidate["Published"] = True
+        candidate["Status"] = "Ready for Quality Audit"
+    elif candidate["AGI Relevance"] == "Low":
+        candidate["Status"] = "Needs More Sources"
+    return candidate
+
+
+def benchmark_items(item_count: int) -> list[collector.SourceItem]:
+    topics = (
+        ("Frontier agent evaluation benchmark", "Agents are scored on long-horizon evaluation tasks with compute budgets."),
+        ("Alignment research update", "A research paper on model alignment and safety evaluations for multimodal systems."),
+        ("Government AI policy consultation", "Regulators publish a policy consultation on foundation model oversight."),
+        ("Inference cluster expansion", "New inference capacity for robotics workloads comes online."),
+        ("Quarterly company update", "Office operations and hiring news with no direct technical relevance."),
+    )
+    items = []
+    for index in range(item_count):
+        title, summary = topics[index % len(topics)]
+        items.append(
+            collector.SourceItem(
+                title=f"{title} {index}",
+                link=f"https://bench.example.org/items/{index}",
+                published_date="2026-06-27T08:00:00Z",
+                summary=summary,
+                source_name="Benchmark AI Feed",
+                source_url="https://bench.example.org/rss.xml",
+                source_type=("arXiv", "RSS", "Government", "Official Website")[index % 4],
+                priority=("Critical", "High", "Medium")[index % 3],
+                authority_score=95,
+                attribution_complete=True,
+            )
+        )
+    return items
+
+
+def time_per_item_microseconds(build: Any, items: list[collector.SourceItem], repeats: int) -> float:
+    started = perf_counter()
+    for _ in range(repeats):
+        for item in items:
+            build(item)
+    return (perf_counter() - started) / (repeats * len(items)) * 1_000_000
+
+
+def run_classifier_benchmark(item_count: int = 500, repeats: int = 5) -> dict[str, Any]:
+    items = benchmark_items(item_count)
+    before = time_per_item_microseconds(legacy_candidate_from_item, items, repeats)
+    after = time_per_item_microseconds(collector.candidate_from_item, items, repeats)
+    return {
+        "benchmark": "source_collector_candidate_classifier",
+        "item_count": item_count,
+        "repeats": repeats,
+        "before_microseconds_per_item": round(before, 2),
+        "after_microseconds_per_item": round(after, 2),
+        "speedup": round(before / after, 2) if after else 0.0,
+        "candidates_identical": [legacy_candidate_from_item(item) for item in items] == [collector.candidate_from_item(item) for item in items],
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark DysonX Source Collector V1 against offline fixtures.")
+    parser.add_argument("--suite", choices=("fetch", "classifier"), default="fetch", help="Benchmark to run.")
+    parser.add_argument("--items", type=int, default=500, help="Number of synthetic items for the classifier suite.")
+    parser.add_argument("--sources", type=int, default=32, help="Number of synthetic fixture-backed sources.")
+    parser.add_argument("--latency-seconds", type=float, default=0.05, help="Simulated latency per fetch.")
+    parser.add_argument("--max-concurrency", type=int, default=8, help="Concurrency used for the parallel run.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    try:
+        if args.suite == "classifier":
+            report = run_classifier_benchmark(args.items)
+        else:
+            report = run_fetch_benchmark(args.sources, args.latency_seconds, args.max_concurrency)
+    except (OSError, collector.SourceCollectorError) as exc:
+        print(f"[source-collector-benchmark] failed: {exc}", file=sys.stderr)
+        return 2
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
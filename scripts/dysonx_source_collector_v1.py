@@ -8,7 +8,9 @@ and writes safe candidate Signals into DysonX Signal Intake.
 from __future__ import annotations
 
 import argparse
+import contextvars
 import datetime as dt
+import functools
 import email.utils
 import hashlib
 import http.client
@@ -17,15 +19,28 @@ import json
 import os
 import pathlib
 import re
+import signal
 import sys
+import threading
+import time
 import urllib.error
 import urllib.parse
 import urllib.request
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass, asdict
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, replace
 from html.parser import HTMLParser
 from typing import Any, Callable
 
+from dysonx_notion_client import NotionPageDecoder, edited_since_filter, query_database_records
+from dysonx_notion_transport import RateLimitedNotionTransport, notion_transport_stats
+
+try:
+    from lxml import etree as LXML_ETREE
+except ImportError:  # lxml is optional; the stdlib pull parser is the fallback.
+    LXML_ETREE = None
+
 
 NOTION_TOKEN_ENV = "NOTION_TOKEN"
 SOURCES_DATABASE_ENV = "DYSONX_NOTION_SOURCES_DATABASE_ID"
@@ -38,6 +53,82 @@ ATTRIBUTION_STATUS = "Complete"
 OPENAI_CALL_PERFORMED = False
 SOURCE_PAGE_BODY_SCRAPING_PERFORMED = False
 PUBLIC_STATIC_FILES_WRITTEN = False
+DEFAULT_MAX_CONCURRENCY = 1
+FEED_ENTRY_LIMIT = 20
+FEED_PARSE_CHUNK_SIZE = 64 * 1024
+HTTP_CACHE_VERSION = "collector_http_cache_v1"
+HTTP_CACHE_FILENAME = "http_cache.json"
+DEDUPE_INDEX_VERSION = "collector_dedupe_index_v3"
+DEDUPE_INDEX_FILENAME = "dedupe_index.json"
+ENDPOINT_HEALTH_VERSION = "collector_endpoint_health_v1"
+ENDPOINT_HEALTH_FILENAME = "endpoint_health.json"
+WATERMARKS_VERSION = "collector_feed_watermarks_v1"
+WATERMARKS_FILENAME = "feed_watermarks.json"
+ARXIV_OFFSETS_VERSION = "collector_arxiv_offsets_v1"
+ARXIV_OFFSETS_FILENAME = "arxiv_offsets.json"
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+ARXIV_PAGE_SIZE = 100
+ARXIV_MAX_PAGES_PER_RUN = 5
+ARXIV_CATEGORIES_PER_QUERY = 10
+# arXiv asks API clients to leave about three seconds between requests.
+ARXIV_REQUEST_INTERVAL_SECONDS = 3.0
+ARXIV_CATEGORY_PATH = re.compile(r"^/(?:rss|atom|list)/([a-z][a-z.+-]*[a-z])(?:/.*)?$", re.IGNORECASE)
+ARXIV_ID_PATTERN = re.compile(r"/abs/([^?#]+?)(?:v\d+)?$")
+SCHEDULE_VERSION = "collector_source_schedule_v1"
+SCHEDULE_FILENAME = "source_schedule.json"
+SCHEDULE_EWMA_ALPHA = 0.3
+SCHEDULE_TARGET_ITEMS_PER_FETCH = 1.0
+SCHEDULE_BOUND_FACTOR = 4
+SCHEDULE_MIN_INTERVAL_HOURS = 1.0
+SCHEDULE_MAX_INTERVAL_HOURS = 24.0 * 14
+PRIORITY_RANK = {"Critical": 0, "High": 1, "Medium": 2}
+DAEMON_TICK_SECONDS = 300
+DAEMON_MIN_SLEEP_SECONDS = 30
+DAEMON_SOURCE_FULL_REFRESH_SECONDS = 3600
+PRIMARY_REPROBE_BASE_HOURS = 6
+PRIMARY_REPROBE_MAX_HOURS = 24 * 7
+NEAR_DUPLICATE_PERMUTATIONS = 32
+NEAR_DUPLICATE_BAND_ROWS = 2
+NEAR_DUPLICATE_THRESHOLD = 0.6
+NEAR_DUPLICATE_MAX_ENTRIES = 50_000
+MINHASH_PRIME = (1 << 61) - 1
+FETCH_MAX_BYTES = 2_000_000
+FETCH_TIMEOUT_SECONDS = 30
+FETCH_MAX_REDIRECTS = 5
+HTML_HEAD_CHUNK_SIZE = 16_384
+HTML_HEAD_END = re.compile(rb"</head\s*>", re.IGNORECASE)
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+FEED_LINK_TYPES = frozenset({"application/rss+xml", "application/atom+xml"})
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 2
+DEFAULT_HOST_MIN_INTERVAL_SECONDS = 1.0
+CIRCUITS_VERSION = "collector_host_circuits_v1"
+CIRCUITS_FILENAME = "host_circuits.json"
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_OPEN_BASE_HOURS = 6
+CIRCUIT_OPEN_MAX_HOURS = 24 * 7
+SHARD_REPORT_VERSION = "collector_shard_report_v1"
+SHARD_STATE_VERSION = "collector_shard_state_v1"
+LATENCY_VERSION = "collector_source_latency_v1"
+LATENCY_FILENAME = "source_latency.json"
+LATENCY_SAMPLES = 20
+LATENCY_TIMEOUT_FACTOR = 2.0
+MIN_SOURCE_TIMEOUT_SECONDS = 5.0
+NOTION_WRITE_WORKERS = 3
+SOURCE_STATUS_WRITE_WORKERS = 2
+SOURCE_STATUS_REFRESH_HOURS = 24
+SOURCE_STATUS_ERROR_LIMIT = 1800
+FETCH_USER_AGENT = "DysonXSourceCollectorV1/1.0 (+https://github.com/enxpower/media)"
+FETCH_ACCEPT = "application/rss+xml, application/atom+xml, application/xml, text/xml, text/html;q=0.8, */*;q=0.5"
+
+# Same-owner metadata endpoints for stale or bot-blocked source URLs. A rule applies when every
+# condition it names matches: `hosts` (exact host, or suffix when it starts with "."),
+# `host_contains`, `path_contains`, and `name_contains` (lowercase substrings).
+OFFICIAL_METADATA_FALLBACKS: tuple[dict[str, Any], ...] = (
+    {"hosts": ("openai.com", ".openai.com"), "fallback_url": "https://openai.com/news/rss.xml"},
+    {"hosts": ("developer.nvidia.com", "developer-blogs.nvidia.com"), "fallback_url": "https://developer.nvidia.com/blog/feed/"},
+    {"name_contains": ("nvidia developer",), "fallback_url": "https://developer.nvidia.com/blog/feed/"},
+    {"host_contains": ("nvidia",), "path_contains": ("blog",), "fallback_url": "https://developer.nvidia.com/blog/feed/"},
+)
 
 AI_RELEVANCE_KEYWORDS = (
     "ai",
@@ -48,25 +139,115 @@ AI_RELEVANCE_KEYWORDS = (
     "model",
     "models",
     "evaluation",
+    "evaluations",
     "eval",
+    "evals",
     "compute",
     "safety",
     "policy",
+    "policies",
     "alignment",
     "robotics",
     "multimodal",
     "inference",
     "benchmark",
+    "benchmarks",
     "foundation model",
+    "foundation models",
 )
+AI_RELEVANCE_TERMS = frozenset(AI_RELEVANCE_KEYWORDS)
+HIGH_RELEVANCE_KEYWORDS = frozenset(
+    {"agi", "agent", "agents", "agentic", "evaluation", "evaluations", "compute", "safety", "policy", "policies"}
+)
+# Categories in precedence order: (category, title/summary terms, source type terms).
+CATEGORY_TERMS = (
+    ("Policy", frozenset({"policy", "policies"}), frozenset({"government"})),
+    ("Safety", frozenset({"safety", "alignment"}), frozenset()),
+    ("Research", frozenset({"research", "researchers", "paper", "papers", "agent", "agents", "agentic"}), frozenset({"arxiv"})),
+    ("Compute", frozenset({"compute", "inference"}), frozenset()),
+)
+RAW_CONTENT_MARKER = "raw"
+ITEM_TERMS = frozenset(
+    {
+        *AI_RELEVANCE_KEYWORDS,
+        *(term for _, text_terms, type_terms in CATEGORY_TERMS for term in (*text_terms, *type_terms)),
+        RAW_CONTENT_MARKER,
+    }
+)
+ITEM_WORD_TERMS = frozenset(term for term in ITEM_TERMS if " " not in term)
+ITEM_PHRASE_TERMS = frozenset(term for term in ITEM_TERMS if " " in term)
+ITEM_PHRASE_FIRST_WORDS = frozenset(term.split()[0] for term in ITEM_PHRASE_TERMS)
 
 
 class SourceCollectorError(RuntimeError):
     """Raised when collector input or Notion IO fails."""
 
 
+class SourceTransportError(SourceCollectorError):
+    """Raised when a source host could not be reached, timed out, or answered 429 or 5xx; only these count against its circuit."""
+
+
+def host_failure_status(status: int) -> bool:
+    return status == 429 or status >= 500
+
+
+class SourceCircuitOpen(SourceCollectorError):
+    """Raised when every endpoint of a source is on a host whose circuit breaker is open."""
+
+    def __init__(self, hosts: list[str], open_until: str):
+        super().__init__(f"circuit open for {', '.join(hosts)} until {open_until}")
+        self.hosts = hosts
+        self.open_until = open_until
+
+
+class SourceDeadlineDeferred(SourceCollectorError):
+    """Raised when a source cannot be expected to finish inside the run's remaining deadline budget."""
+
+    def __init__(self, remaining_seconds: float, expected_seconds: float):
+        super().__init__(f"deferred: {remaining_seconds:.1f}s left of the run deadline, source needs about {expected_seconds:.1f}s")
+        self.remaining_seconds = remaining_seconds
+        self.expected_seconds = expected_seconds
+
+
+class SourceNotModified(Exception):
+    """Raised by a conditional fetcher when a source has not changed since the last run."""
+
+    def __init__(self, url: str, reason: str, bytes_not_downloaded: int = 0):
+        super().__init__(f"source not modified: {url} ({reason})")
+        self.url = url
+        self.reason = reason
+        self.bytes_not_downloaded = bytes_not_downloaded
+
+
+@dataclass(frozen=True)
+class FetchResponse:
+    status: int
+    body: str
+    headers: dict[str, str]
+    wire_bytes: int = 0
+
+
+class FetchedText(str):
+    """Decoded response text that also carries its on-the-wire and decoded sizes.
+
+    `head_only` is set when an HTML download was stopped once `</head>` arrived.
+    """
+
+    wire_bytes: int
+    decoded_bytes: int
+    head_only: bool
+
+    def __new__(cls, text: str, wire_bytes: int = 0, decoded_bytes: int = 0, head_only: bool = False) -> "FetchedText":
+        value = super().__new__(cls, text)
+        value.wire_bytes = wire_bytes
+        value.decoded_bytes = decoded_bytes
+        value.head_only = head_only
+        return value
+
+
 NotionTransport = Callable[[str, dict[str, str], dict[str, Any] | None, str], dict[str, Any]]
 FetchTransport = Callable[[str], str]
+ResponseTransport = Callable[[str, dict[str, str]], FetchResponse]
 
 
 @dataclass(frozen=True)
@@ -75,6 +256,17 @@ class CollectedSourceItems:
     fetched_url: str
     fallback_used: bool = False
     fallback_reason: str = ""
+    not_modified_reason: str = ""
+    bytes_not_downloaded: int = 0
+    wire_bytes: int | None = None
+    decoded_bytes: int | None = None
+    primary_probe_skipped: bool = False
+    watermark_pruned: int = 0
+    head_only: bool = False
+    discovered_feed_url: str = ""
+    feed_promoted: bool = False
+    arxiv_batched: bool = False
+    fetch_seconds: float | None = None
 
 
 @dataclass(frozen=True)
@@ -89,6 +281,8 @@ class SourceRecord:
     enabled: bool
     fetch_frequency: str = ""
     last_fetched_at: str = ""
+    last_success_at: str = ""
+    last_error: str = ""
 
 
 @dataclass(frozen=True)
@@ -163,56 +357,18 @@ def absolute_http_url(value: str, base_url: str = "") -> str:
     return url
 
 
-def notion_plain_text(items: list[dict[str, Any]] | None) -> str:
-    if not items:
-        return ""
-    return "".join(str(item.get("plain_text") or "") for item in items)
+COLLECTOR_PAGE_DECODER = NotionPageDecoder(
+    SourceCollectorError,
+    page_fields=(("_notion_page_id", "id"), ("_last_edited_time", "last_edited_time")),
+)
 
 
 def notion_property_value(property_value: dict[str, Any]) -> Any:
-    property_type = property_value.get("type")
-    if property_type == "title":
-        return notion_plain_text(property_value.get("title"))
-    if property_type == "rich_text":
-        return notion_plain_text(property_value.get("rich_text"))
-    if property_type == "select":
-        selected = property_value.get("select")
-        return selected.get("name") if isinstance(selected, dict) else ""
-    if property_type == "status":
-        selected = property_value.get("status")
-        return selected.get("name") if isinstance(selected, dict) else ""
-    if property_type == "multi_select":
-        values = property_value.get("multi_select")
-        if not isinstance(values, list):
-            return []
-        return [str(item.get("name")) for item in values if isinstance(item, dict) and item.get("name")]
-    if property_type == "url":
-        return property_value.get("url") or ""
-    if property_type == "number":
-        return property_value.get("number")
-    if property_type == "checkbox":
-        return bool(property_value.get("checkbox"))
-    if property_type == "date":
-        date_value = property_value.get("date")
-        return date_value.get("start") if isinstance(date_value, dict) else ""
-    if property_type == "formula":
-        formula = property_value.get("formula")
-        if isinstance(formula, dict):
-            return formula.get(formula.get("type", ""), "")
-    return None
+    return COLLECTOR_PAGE_DECODER.property_value(property_value)
 
 
 def notion_page_to_record(page: dict[str, Any]) -> dict[str, Any]:
-    properties = page.get("properties")
-    if not isinstance(properties, dict):
-        raise SourceCollectorError("Notion page is missing properties")
-    record = {
-        field_name: notion_property_value(property_value)
-        for field_name, property_value in properties.items()
-        if isinstance(property_value, dict)
-    }
-    record["_notion_page_id"] = normalize_text(page.get("id"))
-    return record
+    return COLLECTOR_PAGE_DECODER(page)
 
 
 def field(record: dict[str, Any], *names: str) -> Any:
@@ -245,6 +401,8 @@ def source_from_record(record: dict[str, Any]) -> SourceRecord:
         enabled=field(record, "Enabled", "enabled") is True,
         fetch_frequency=normalize_text(field(record, "Fetch Frequency", "fetch_frequency")),
         last_fetched_at=normalize_text(field(record, "Last Fetched At", "last_fetched_at")),
+        last_success_at=normalize_text(field(record, "Last Success At", "last_success_at")),
+        last_error=normalize_text(field(record, "Last Error", "last_error")),
     )
 
 
@@ -255,9 +413,7 @@ def supported_source(source: SourceRecord) -> bool:
     return any(kind in joined for kind in SUPPORTED_SOURCE_TYPES)
 
 
-def frequency_due(source: SourceRecord, now: dt.datetime | None = None) -> bool:
-    if not source.last_fetched_at:
-        return True
+def frequency_hours(source: SourceRecord) -> int:
     frequency = source.fetch_frequency.lower()
     hours = 24
     if "hour" in frequency:
@@ -267,86 +423,797 @@ def frequency_due(source: SourceRecord, now: dt.datetime | None = None) -> bool:
         hours = 24
     elif "weekly" in frequency:
         hours = 24 * 7
+    return hours
+
+
+def frequency_due(source: SourceRecord, now: dt.datetime | None = None) -> bool:
+    if not source.last_fetched_at:
+        return True
     try:
         last = dt.datetime.fromisoformat(source.last_fetched_at.replace("Z", "+00:00"))
     except ValueError:
         return True
     now = now or dt.datetime.now(dt.timezone.utc)
-    return now - last >= dt.timedelta(hours=hours)
+    return now - last >= dt.timedelta(hours=frequency_hours(source))
+
+
+def collectable_source(source: SourceRecord) -> bool:
+    return source.enabled and source.priority in ALLOWED_PRIORITIES and bool(source.url) and supported_source(source)
 
 
 def eligible_source(source: SourceRecord) -> bool:
-    return (
-        source.enabled
-        and source.priority in ALLOWED_PRIORITIES
-        and bool(source.url)
-        and supported_source(source)
-        and frequency_due(source)
-    )
+    return collectable_source(source) and frequency_due(source)
+
+
+def iso_timestamp(moment: dt.datetime) -> str:
+    return moment.astimezone(dt.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+class FetchScheduler:
+    """Adaptive per-source fetch schedule learned from the collector's own history.
+
+    Each successful fetch updates an exponentially weighted item arrival rate (fresh items per hour)
+    and yield (share of fetches that produced a new candidate). The interval aims for about one
+    fresh item per fetch, clamped to a factor of the Notion `Fetch Frequency` either way.
+    """
+
+    def __init__(self, entries: dict[str, dict[str, Any]] | None = None, clock: Callable[[], dt.datetime] | None = None):
+        self.entries: dict[str, dict[str, Any]] = dict(entries or {})
+        self.clock = clock or (lambda: dt.datetime.now(dt.timezone.utc))
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> "FetchScheduler":
+        if not path.exists():
+            return cls()
+        data = json.loads(path.read_text(encoding="utf-8"))
+        entries = data.get("entries") if isinstance(data, dict) else None
+        if not isinstance(entries, dict):
+            raise SourceCollectorError(f"{path} is not a collector source schedule")
+        return cls({str(key): entry for key, entry in entries.items() if isinstance(entry, dict)})
+
+    def save(self, path: pathlib.Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {"schedule_version": SCHEDULE_VERSION, "entries": self.entries}
+            path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    @staticmethod
+    def interval_hours(source: SourceRecord, entry: dict[str, Any]) -> float:
+        bound = frequency_hours(source)
+        rate = entry.get("arrival_rate_per_hour")
+        if rate is None:
+            return float(bound)
+        learned = SCHEDULE_TARGET_ITEMS_PER_FETCH / rate if rate > 0 else SCHEDULE_MAX_INTERVAL_HOURS
+        low = max(SCHEDULE_MIN_INTERVAL_HOURS, bound / SCHEDULE_BOUND_FACTOR)
+        high = min(SCHEDULE_MAX_INTERVAL_HOURS, bound * SCHEDULE_BOUND_FACTOR)
+        return round(min(max(learned, low), high), 2)
+
+    def decide(self, source: SourceRecord, now: dt.datetime) -> dict[str, Any]:
+        with self._lock:
+            entry = dict(self.entries.get(source_state_key(source), {}))
+        interval = self.interval_hours(source, entry)
+        decision: dict[str, Any] = {
+            "interval_hours": interval,
+            "arrival_rate_per_hour": entry.get("arrival_rate_per_hour"),
+            "yield": entry.get("yield"),
+        }
+        try:
+            last = dt.datetime.fromisoformat(str(entry.get("last_fetched_at", "")).replace("Z", "+00:00"))
+        except ValueError:
+            due = frequency_due(source, now)
+            decision.update(due=due, reason="no_history" if due else "schedule_not_due", overdue_ratio=1.0)
+            return decision
+        next_due = last + dt.timedelta(hours=interval)
+        overdue_ratio = (now - last).total_seconds() / 3600 / interval
+        due = now >= next_due
+        decision.update(
+            due=due,
+            reason="due" if due else "schedule_not_due",
+            next_due_at=iso_timestamp(next_due),
+            overdue_ratio=round(overdue_ratio, 3),
+        )
+        return decision
+
+    def plan(self, sources: list[SourceRecord], fetch_budget: int | None = None) -> list[dict[str, Any]]:
+        """Decide which sources are due; when more are due than `fetch_budget`, keep the highest priority ones."""
+        now = self.clock()
+        decisions = [self.decide(source, now) for source in sources]
+        due = [index for index, decision in enumerate(decisions) if decision["due"]]
+
+        def rank(index: int) -> tuple[int, float, int]:
+            source_yield = decisions[index]["yield"]
+            value = decisions[index]["overdue_ratio"] * (1.0 if source_yield is None else 0.1 + source_yield)
+            return PRIORITY_RANK.get(sources[index].priority, len(PRIORITY_RANK)), -value, index
+
+        if fetch_budget is not None:
+            for index in sorted(due, key=rank)[max(fetch_budget, 0) :]:
+                decisions[index].update(due=False, reason="fetch_budget_exhausted")
+        return decisions
+
+    def observe(self, source: SourceRecord, fresh_items: int, new_candidates: int) -> None:
+        """Fold one successful fetch into the source's arrival rate and yield and reschedule it."""
+        now = self.clock()
+        key = source_state_key(source)
+        with self._lock:
+            entry = dict(self.entries.get(key, {}))
+            try:
+                last = dt.datetime.fromisoformat(str(entry.get("last_fetched_at", "")).replace("Z", "+00:00"))
+                elapsed_hours = max((now - last).total_seconds() / 3600, 0.25)
+            except ValueError:
+                elapsed_hours = float(frequency_hours(source))
+            samples = {"arrival_rate_per_hour": fresh_items / elapsed_hours, "yield": 1.0 if new_candidates else 0.0}
+            for name, sample in samples.items():
+                previous = entry.get(name)
+                value = sample if previous is None else SCHEDULE_EWMA_ALPHA * sample + (1 - SCHEDULE_EWMA_ALPHA) * previous
+                entry[name] = round(value, 4)
+            entry["fetches"] = int(entry.get("fetches") or 0) + 1
+            entry["last_fetched_at"] = iso_timestamp(now)
+            entry["next_due_at"] = iso_timestamp(now + dt.timedelta(hours=self.interval_hours(source, entry)))
+            self.entries[key] = entry
 
 
 class MetadataHTMLParser(HTMLParser):
+    """Collect title, description, canonical link, and advertised RSS/Atom feeds from an HTML head."""
+
     def __init__(self) -> None:
         super().__init__()
         self.title = ""
         self.description = ""
         self.canonical = ""
+        self.feed_urls: list[str] = []
+        self.head_closed = False
         self._in_title = False
 
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self.head_closed:
+            return
         attr_map = {key.lower(): value or "" for key, value in attrs}
-        if tag == "title":
+        if tag == "body":
+            self.head_closed = True
+        elif tag == "title":
             self._in_title = True
         elif tag == "meta":
             name = attr_map.get("name", "").lower()
             prop = attr_map.get("property", "").lower()
             if name == "description" or prop == "og:description":
                 self.description = self.description or attr_map.get("content", "")
-        elif tag == "link" and attr_map.get("rel", "").lower() == "canonical":
-            self.canonical = attr_map.get("href", "")
+        elif tag == "link":
+            rels = attr_map.get("rel", "").lower().split()
+            if "canonical" in rels:
+                self.canonical = attr_map.get("href", "")
+            elif "alternate" in rels and attr_map.get("type", "").lower().strip() in FEED_LINK_TYPES and attr_map.get("href"):
+                self.feed_urls.append(attr_map["href"])
 
     def handle_endtag(self, tag: str) -> None:
         if tag == "title":
             self._in_title = False
+        elif tag == "head":
+            self.head_closed = True
+            self._in_title = False
 
     def handle_data(self, data: str) -> None:
         if self._in_title:
             self.title += data
 
 
+class ContentDecoder:
+    """Incremental Content-Encoding decoder that stops producing output at `FETCH_MAX_BYTES`."""
+
+    def __init__(self, content_encoding: str):
+        self.encoding = content_encoding.strip().lower()
+        if self.encoding in {"", "identity"}:
+            self._wbits: list[int] = []
+        elif self.encoding in {"gzip", "x-gzip", "deflate"}:
+            # gzip and zlib-wrapped deflate are auto-detected; some servers send raw deflate instead.
+            self._wbits = [zlib.MAX_WBITS | 32] + ([-zlib.MAX_WBITS] if self.encoding == "deflate" else [])
+        else:
+            raise SourceCollectorError(f"source fetch failed: unsupported Content-Encoding {content_encoding!r}")
+        self._decompressor = zlib.decompressobj(self._wbits.pop(0)) if self._wbits else None
+        self._raw = bytearray()
+        self.decoded_bytes = 0
+
+    def decode(self, chunk: bytes) -> bytes:
+        remaining = FETCH_MAX_BYTES - self.decoded_bytes
+        if remaining <= 0:
+            return b""
+        if self._decompressor is None:
+            output = chunk[:remaining]
+        else:
+            if not self.decoded_bytes:
+                self._raw += chunk
+            output = self._decompress(chunk, remaining)
+        self.decoded_bytes += len(output)
+        return output
+
+    def _decompress(self, chunk: bytes, remaining: int) -> bytes:
+        try:
+            return self._decompressor.decompress(chunk, remaining)
+        except zlib.error as exc:
+            if self.decoded_bytes or not self._wbits:
+                raise SourceCollectorError(f"source fetch failed: could not decode {self.encoding} body: {exc}") from exc
+        # The first decoder rejected the stream before producing output; replay what arrived so far.
+        self._decompressor = zlib.decompressobj(self._wbits.pop(0))
+        return self._decompress(bytes(self._raw), remaining)
+
+
+def decode_content(raw: bytes, content_encoding: str) -> bytes:
+    return ContentDecoder(content_encoding).decode(raw)
+
+
+def is_html_response(headers: dict[str, str]) -> bool:
+    return headers.get("content-type", "").split(";", 1)[0].strip().lower() in HTML_CONTENT_TYPES
+
+
+def read_chunk(response: http.client.HTTPResponse, size: int) -> bytes:
+    """Read at most `size` bytes with a single socket read; b"" once the body is complete, which closes the response."""
+    chunk = response.read1(size)
+    if not chunk and not response.isclosed():
+        # `read1` stops at the end of a Content-Length body without marking the response closed.
+        response.read()
+    return chunk
+
+
+def read_html_head(
+    response: http.client.HTTPResponse, content_encoding: str, before_read: Callable[[], None] = lambda: None
+) -> tuple[bytes, bytes, bool]:
+    """Read an HTML response until `</head>` has been decoded; return raw bytes, decoded bytes, and whether it stopped early."""
+    decoder = ContentDecoder(content_encoding)
+    raw = bytearray()
+    decoded = bytearray()
+    while decoder.decoded_bytes < FETCH_MAX_BYTES:
+        before_read()
+        chunk = read_chunk(response, HTML_HEAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        raw += chunk
+        search_from = max(0, len(decoded) - 16)
+        decoded += decoder.decode(chunk)
+        match = HTML_HEAD_END.search(decoded, search_from)
+        if match:
+            return bytes(raw), bytes(decoded[: match.end()]), True
+    return bytes(raw), bytes(decoded), False
+
+
+def read_body(response: http.client.HTTPResponse, before_read: Callable[[], None] = lambda: None) -> bytes:
+    """Read up to `FETCH_MAX_BYTES`, calling `before_read` before every socket read."""
+    body = bytearray()
+    while len(body) < FETCH_MAX_BYTES:
+        before_read()
+        chunk = read_chunk(response, min(HTML_HEAD_CHUNK_SIZE, FETCH_MAX_BYTES - len(body)))
+        if not chunk:
+            break
+        body += chunk
+    return bytes(body)
+
+
+@dataclass(frozen=True)
+class RawResponse:
+    status: int
+    reason: str
+    headers: dict[str, str]
+    raw: bytes
+    decoded: bytes | None = None
+    head_only: bool = False
+
+
+# Per-source socket timeout set by `collect_source_outcome`; unset means the pool's own timeout.
+SOURCE_FETCH_TIMEOUT: contextvars.ContextVar[float | None] = contextvars.ContextVar("source_fetch_timeout", default=None)
+# The run's deadline while a source is fetched; no request reads past it.
+SOURCE_RUN_DEADLINE: contextvars.ContextVar["RunDeadline | None"] = contextvars.ContextVar("source_run_deadline", default=None)
+
+
+class HostConnectionPool:
+    """Keep-alive HTTP(S) connections per host, capped at `max_connections_per_host`.
+
+    Requests to one host also start at least `min_request_interval_seconds` apart.
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        timeout: float = FETCH_TIMEOUT_SECONDS,
+        min_request_interval_seconds: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if max_connections_per_host < 1:
+            raise SourceCollectorError("max_connections_per_host must be at least 1")
+        if min_request_interval_seconds < 0:
+            raise SourceCollectorError("min_request_interval_seconds must not be negative")
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.min_request_interval_seconds = min_request_interval_seconds
+        self.clock = clock
+        self.sleep = sleep
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._slots: dict[tuple[str, str], threading.BoundedSemaphore] = {}
+        self._next_request_at: dict[tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+        self.spacing_wait_seconds = 0.0
+
+    def _slot(self, key: tuple[str, str]) -> threading.BoundedSemaphore:
+        with self._lock:
+            if key not in self._slots:
+                self._slots[key] = threading.BoundedSemaphore(self.max_connections_per_host)
+            return self._slots[key]
+
+    def _wait_for_turn(self, key: tuple[str, str]) -> None:
+        if self.min_request_interval_seconds <= 0:
+            return
+        with self._lock:
+            now = self.clock()
+            start = max(now, self._next_request_at.get(key, now))
+            self._next_request_at[key] = start + self.min_request_interval_seconds
+            self.spacing_wait_seconds += start - now
+        if start > now:
+            self.sleep(start - now)
+
+    def _checkout(self, key: tuple[str, str]) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+            self.connections_opened += 1
+        scheme, netloc = key
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return connection_class(netloc, timeout=self.timeout), False
+
+    def _checkin(self, key: tuple[str, str], connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._idle.setdefault(key, []).append(connection)
+
+    def close(self) -> None:
+        with self._lock:
+            connections = [connection for idle in self._idle.values() for connection in idle]
+            self._idle.clear()
+        for connection in connections:
+            connection.close()
+
+    def _request_once(self, url: str, headers: dict[str, str]) -> RawResponse:
+        parsed = urllib.parse.urlsplit(url)
+        if parsed.scheme not in {"http", "https"} or not parsed.netloc:
+            raise SourceCollectorError(f"source fetch failed: unsupported URL {url!r}")
+        key = (parsed.scheme, parsed.netloc.lower())
+        target = urllib.parse.urlunsplit(("", "", parsed.path or "/", parsed.query, ""))
+        with self._slot(key):
+            self._wait_for_turn(key)
+            timeout = SOURCE_FETCH_TIMEOUT.get() or self.timeout
+            # The socket timeout bounds each read; this bounds the whole request, so a server that drips
+            # bytes just faster than the timeout cannot hold it past `timeout` or the run's deadline.
+            expires_at = time.monotonic() + timeout
+            run_deadline = SOURCE_RUN_DEADLINE.get()
+            for attempt in range(2):
+                connection, reused = self._checkout(key)
+                connection.timeout = timeout
+
+                def before_read(connection: http.client.HTTPConnection = connection) -> None:
+                    left = expires_at - time.monotonic()
+                    if run_deadline is not None:
+                        left = min(left, run_deadline.remaining())
+                    if left <= 0:
+                        raise TimeoutError(f"source fetch exceeded its {timeout:g}s time budget")
+                    if connection.sock is not None:
+                        connection.sock.settimeout(min(timeout, left))
+
+                try:
+                    before_read()
+                    connection.request("GET", target, headers=headers)
+                    before_read()
+                    response = connection.getresponse()
+                    response_headers = {key_.lower(): value for key_, value in response.getheaders()}
+                    if 200 <= response.status < 300 and is_html_response(response_headers):
+                        # Metadata comes from the head only; stop downloading once it has closed.
+                        raw, decoded, head_only = read_html_head(response, response_headers.get("content-encoding", ""), before_read)
+                    else:
+                        raw, decoded, head_only = read_body(response, before_read), None, False
+                except (http.client.HTTPException, OSError) as exc:
+                    connection.close()
+                    # A keep-alive connection the server already closed fails on reuse; retry once on a fresh one.
+                    # A timeout is not retried: the request already used its time.
+                    if reused and attempt == 0 and not isinstance(exc, TimeoutError):
+                        continue
+                    raise SourceTransportError(f"source fetch failed: {exc}") from exc
+                if response.isclosed() and not response.will_close:
+                    self._checkin(key, connection)
+                else:
+                    connection.close()
+                return RawResponse(response.status, response.reason, response_headers, raw, decoded, head_only)
+        raise SourceTransportError(f"source fetch failed: {url}")
+
+    def fetch_response(self, url: str, request_headers: dict[str, str] | None = None) -> FetchResponse:
+        headers = {
+            "User-Agent": FETCH_USER_AGENT,
+            "Accept": FETCH_ACCEPT,
+            "Accept-Encoding": "gzip, deflate",
+            **(request_headers or {}),
+        }
+        for _redirect in range(FETCH_MAX_REDIRECTS + 1):
+            response = self._request_once(url, headers)
+            if response.status in {301, 302, 303, 307, 308} and response.headers.get("location"):
+                url = urllib.parse.urljoin(url, response.headers["location"])
+                continue
+            if response.status == 304:
+                return FetchResponse(status=304, body="", headers=response.headers, wire_bytes=len(response.raw))
+            if response.status >= 400:
+                error_class = SourceTransportError if host_failure_status(response.status) else SourceCollectorError
+                raise error_class(f"source fetch failed: HTTP Error {response.status}: {response.reason}")
+            decoded = response.decoded
+            if decoded is None:
+                decoded = decode_content(response.raw, response.headers.get("content-encoding", ""))
+            body = decoded.decode("utf-8", errors="ignore")
+            return FetchResponse(
+                status=response.status,
+                body=FetchedText(body, wire_bytes=len(response.raw), decoded_bytes=len(decoded), head_only=response.head_only),
+                headers=response.headers,
+                wire_bytes=len(response.raw),
+            )
+        raise SourceCollectorError(f"source fetch failed: too many redirects for {url}")
+
+    def fetch_url(self, url: str) -> str:
+        return self.fetch_response(url).body
+
+
+DEFAULT_CONNECTION_POOL = HostConnectionPool()
+
+
+def fetch_url_response(url: str, request_headers: dict[str, str] | None = None) -> FetchResponse:
+    return DEFAULT_CONNECTION_POOL.fetch_response(url, request_headers)
+
+
 def fetch_url(url: str) -> str:
-    request = urllib.request.Request(
-        url,
-        headers={
-            "User-Agent": "DysonXSourceCollectorV1/1.0 (+https://github.com/enxpower/media)",
-            "Accept": "application/rss+xml, application/atom+xml, application/xml, text/xml, text/html;q=0.8, */*;q=0.5",
-        },
-    )
-    try:
-        with urllib.request.urlopen(request, timeout=30) as response:
-            return response.read(2_000_000).decode("utf-8", errors="ignore")
-    except (urllib.error.URLError, http.client.HTTPException, OSError, TimeoutError) as exc:
-        raise SourceCollectorError(f"source fetch failed: {exc}") from exc
+    return fetch_url_response(url).body
+
+
+def body_sha256(body: str) -> str:
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+class HttpValidatorCache:
+    """Per-URL ETag / Last-Modified / body-hash validators persisted between runs."""
+
+    def __init__(self, entries: dict[str, dict[str, Any]] | None = None):
+        self.entries: dict[str, dict[str, Any]] = dict(entries or {})
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> "HttpValidatorCache":
+        if not path.exists():
+            return cls()
+        data = json.loads(path.read_text(encoding="utf-8"))
+        entries = data.get("entries") if isinstance(data, dict) else None
+        if not isinstance(entries, dict):
+            raise SourceCollectorError(f"{path} is not a collector HTTP cache")
+        return cls({str(url): entry for url, entry in entries.items() if isinstance(entry, dict)})
+
+    def save(self, path: pathlib.Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {"cache_version": HTTP_CACHE_VERSION, "entries": self.entries}
+            path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    def request_headers(self, url: str) -> dict[str, str]:
+        with self._lock:
+            entry = self.entries.get(url, {})
+        headers: dict[str, str] = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = str(entry["etag"])
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = str(entry["last_modified"])
+        return headers
+
+    def cached_length(self, url: str) -> int:
+        with self._lock:
+            return int(self.entries.get(url, {}).get("content_length") or 0)
+
+    def record(self, url: str, response: FetchResponse) -> bool:
+        """Store validators for a 200 response and return whether the body changed."""
+        digest = body_sha256(response.body)
+        with self._lock:
+            previous = self.entries.get(url, {})
+            self.entries[url] = {
+                "etag": response.headers.get("etag", ""),
+                "last_modified": response.headers.get("last-modified", ""),
+                "body_sha256": digest,
+                "content_length": len(response.body.encode("utf-8")),
+                "checked_at": utc_now(),
+            }
+        return previous.get("body_sha256") != digest
+
+
+def plain_response_fetcher(fetch: FetchTransport) -> ResponseTransport:
+    """Adapt a body-only fetcher, such as a fixture fetcher, to the response interface."""
+
+    def fetch_response(url: str, request_headers: dict[str, str]) -> FetchResponse:
+        return FetchResponse(status=200, body=fetch(url), headers={})
+
+    return fetch_response
+
+
+def conditional_fetcher(cache: HttpValidatorCache, fetch_response: ResponseTransport = fetch_url_response) -> FetchTransport:
+    """Return a fetcher that sends cached validators and raises SourceNotModified on 304 or an identical body."""
+
+    def fetch(url: str) -> str:
+        response = fetch_response(url, cache.request_headers(url))
+        if response.status == 304:
+            raise SourceNotModified(url, "http_304", bytes_not_downloaded=cache.cached_length(url))
+        if not cache.record(url, response):
+            raise SourceNotModified(url, "identical_body")
+        return response.body
+
+    return fetch
+
+
+def fallback_rule_matches(rule: dict[str, Any], host: str, path: str, name: str) -> bool:
+    checks = {
+        "hosts": lambda value: host.endswith(value) if value.startswith(".") else host == value,
+        "host_contains": lambda value: value in host,
+        "path_contains": lambda value: value in path,
+        "name_contains": lambda value: value in name,
+    }
+    conditions = [(key, rule[key]) for key in checks if rule.get(key)]
+    return bool(conditions) and all(any(checks[key](value) for value in values) for key, values in conditions)
 
 
-def official_metadata_fallback_urls(source: SourceRecord) -> list[str]:
+def official_metadata_fallback_urls(
+    source: SourceRecord, registry: tuple[dict[str, Any], ...] = OFFICIAL_METADATA_FALLBACKS
+) -> list[str]:
     """Return same-owner metadata endpoints for stale or bot-blocked source URLs."""
     parsed = urllib.parse.urlparse(source.url)
     host = parsed.netloc.lower()
     path = parsed.path.lower()
     name = source.name.lower()
-    fallbacks: list[str] = []
-    if host == "openai.com" or host.endswith(".openai.com"):
-        fallbacks.append("https://openai.com/news/rss.xml")
-    if host in {"developer.nvidia.com", "developer-blogs.nvidia.com"} or "nvidia developer" in name:
-        fallbacks.append("https://developer.nvidia.com/blog/feed/")
-    if "nvidia" in host and "blog" in path:
-        fallbacks.append("https://developer.nvidia.com/blog/feed/")
+    fallbacks = [rule["fallback_url"] for rule in registry if fallback_rule_matches(rule, host, path, name)]
     return [url for index, url in enumerate(fallbacks) if url and url not in fallbacks[:index] and url != source.url]
 
 
+def source_state_key(source: SourceRecord) -> str:
+    return source.notion_page_id or source.url
+
+
+class EndpointHealth:
+    """Per-source last known-good endpoint and primary URL failure streak, persisted between runs.
+
+    After the primary URL fails and a fallback succeeds, later runs try the known-good endpoint
+    first and re-probe the primary only after a delay that doubles with each consecutive failure.
+    An RSS/Atom feed advertised by an HTML source's head is promoted ahead of every other endpoint
+    until it fails once.
+    """
+
+    def __init__(self, entries: dict[str, dict[str, Any]] | None = None):
+        self.entries: dict[str, dict[str, Any]] = dict(entries or {})
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> "EndpointHealth":
+        if not path.exists():
+            return cls()
+        data = json.loads(path.read_text(encoding="utf-8"))
+        entries = data.get("entries") if isinstance(data, dict) else None
+        if not isinstance(entries, dict):
+            raise SourceCollectorError(f"{path} is not a collector endpoint health file")
+        return cls({str(key): entry for key, entry in entries.items() if isinstance(entry, dict)})
+
+    def save(self, path: pathlib.Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {"health_version": ENDPOINT_HEALTH_VERSION, "entries": self.entries}
+            path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    def endpoint_order(self, source: SourceRecord, fallbacks: list[str], now: dt.datetime | None = None) -> tuple[list[str], bool]:
+        """Return endpoints to try in order and whether the primary URL was deferred to last."""
+        with self._lock:
+            entry = dict(self.entries.get(source_state_key(source), {}))
+        endpoints, primary_deferred = self._fallback_order(source, fallbacks, entry, now)
+        feed = normalize_text(entry.get("discovered_feed_url"))
+        if feed and feed != source.url:
+            return [feed, *(url for url in endpoints if url != feed)], primary_deferred
+        return endpoints, primary_deferred
+
+    def promoted_feed(self, source: SourceRecord) -> str:
+        with self._lock:
+            return normalize_text(self.entries.get(source_state_key(source), {}).get("discovered_feed_url"))
+
+    @staticmethod
+    def _fallback_order(
+        source: SourceRecord, fallbacks: list[str], entry: dict[str, Any], now: dt.datetime | None
+    ) -> tuple[list[str], bool]:
+        preferred = normalize_text(entry.get("preferred_url"))
+        if not preferred or preferred == source.url or preferred not in fallbacks:
+            return [source.url, *fallbacks], False
+        others = [url for url in fallbacks if url != preferred]
+        now = now or dt.datetime.now(dt.timezone.utc)
+        try:
+            probe_due = now >= dt.datetime.fromisoformat(str(entry.get("next_primary_probe_at", "")).replace("Z", "+00:00"))
+        except ValueError:
+            probe_due = True
+        if probe_due:
+            return [source.url, preferred, *others], False
+        return [preferred, *others, source.url], True
+
+    def record(
+        self,
+        source: SourceRecord,
+        fetched_url: str,
+        primary_failed: bool,
+        now: dt.datetime | None = None,
+        discovered_feed: str = "",
+    ) -> None:
+        """Record a run's outcome; `fetched_url` is empty when every endpoint failed.
+
+        `discovered_feed` is the feed the fetched HTML page advertised, if any.
+        """
+        key = source_state_key(source)
+        now = now or dt.datetime.now(dt.timezone.utc)
+        with self._lock:
+            entry = dict(self.entries.get(key, {}))
+            promoted = entry.pop("discovered_feed_url", "")
+            if promoted and fetched_url == promoted:
+                entry["discovered_feed_url"] = promoted
+                self.entries[key] = entry
+                return
+            if promoted:
+                # The promoted feed failed this run; do not promote the same URL again.
+                entry["rejected_feed_url"] = promoted
+            if discovered_feed and discovered_feed != entry.get("rejected_feed_url"):
+                entry["discovered_feed_url"] = discovered_feed
+            if fetched_url == source.url:
+                entry = {name: entry[name] for name in ("discovered_feed_url", "rejected_feed_url") if name in entry}
+            elif fetched_url:
+                entry["preferred_url"] = fetched_url
+            if primary_failed:
+                failures = int(entry.get("primary_failures") or 0) + 1
+                delay_hours = min(PRIMARY_REPROBE_MAX_HOURS, PRIMARY_REPROBE_BASE_HOURS * 2 ** (failures - 1))
+                entry["primary_failures"] = failures
+                entry["next_primary_probe_at"] = (now + dt.timedelta(hours=delay_hours)).isoformat().replace("+00:00", "Z")
+            if entry:
+                self.entries[key] = entry
+            else:
+                self.entries.pop(key, None)
+
+
+def url_host(url: str) -> str:
+    return urllib.parse.urlsplit(url).netloc.lower()
+
+
+class HostCircuitBreaker:
+    """Per-host circuit breaker persisted between runs.
+
+    A host's circuit opens after `failure_threshold` consecutive host-level failures. While open, its
+    URLs are not fetched. Once the open period ends, one more attempt is allowed: success closes the
+    circuit, and failure reopens it for twice as long, up to `CIRCUIT_OPEN_MAX_HOURS`.
+    """
+
+    def __init__(self, entries: dict[str, dict[str, Any]] | None = None, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD):
+        if failure_threshold < 1:
+            raise SourceCollectorError("circuit failure threshold must be at least 1")
+        self.entries: dict[str, dict[str, Any]] = dict(entries or {})
+        self.failure_threshold = failure_threshold
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: pathlib.Path, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD) -> "HostCircuitBreaker":
+        if not path.exists():
+            return cls(failure_threshold=failure_threshold)
+        data = json.loads(path.read_text(encoding="utf-8"))
+        entries = data.get("entries") if isinstance(data, dict) else None
+        if not isinstance(entries, dict):
+            raise SourceCollectorError(f"{path} is not a collector host circuit file")
+        return cls({str(key): entry for key, entry in entries.items() if isinstance(entry, dict)}, failure_threshold)
+
+    def save(self, path: pathlib.Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {"circuits_version": CIRCUITS_VERSION, "entries": self.entries}
+            path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    def open_until(self, url: str, now: dt.datetime | None = None) -> str:
+        """Return when the URL's host circuit closes again, or "" when the URL may be fetched."""
+        return self.host_open_until(url_host(url), now)
+
+    def host_open_until(self, host: str, now: dt.datetime | None = None) -> str:
+        with self._lock:
+            entry = self.entries.get(host, {})
+        until = normalize_text(entry.get("open_until"))
+        if not until:
+            return ""
+        try:
+            closed = (now or dt.datetime.now(dt.timezone.utc)) >= dt.datetime.fromisoformat(until.replace("Z", "+00:00"))
+        except ValueError:
+            closed = True
+        return "" if closed else until
+
+    def record_success(self, url: str) -> None:
+        with self._lock:
+            self.entries.pop(url_host(url), None)
+
+    def record_failure(self, url: str, error: Exception, now: dt.datetime | None = None) -> None:
+        """Count a host-level failure: a connection error, timeout, 429, or 5xx (`SourceTransportError`)."""
+        host = url_host(url)
+        now = now or dt.datetime.now(dt.timezone.utc)
+        with self._lock:
+            entry = dict(self.entries.get(host, {}))
+            failures = int(entry.get("consecutive_failures") or 0) + 1
+            entry["consecutive_failures"] = failures
+            entry["last_error"] = str(error)[:300]
+            if failures >= self.failure_threshold:
+                opens = int(entry.get("times_opened") or 0) + 1
+                hours = min(CIRCUIT_OPEN_MAX_HOURS, CIRCUIT_OPEN_BASE_HOURS * 2 ** (opens - 1))
+                entry["times_opened"] = opens
+                entry["open_until"] = (now + dt.timedelta(hours=hours)).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+            self.entries[host] = entry
+
+    def open_hosts(self, now: dt.datetime | None = None) -> list[str]:
+        with self._lock:
+            hosts = sorted(self.entries)
+        return [host for host in hosts if self.host_open_until(host, now)]
+
+
+class RunDeadline:
+    """A global wall-clock budget for one collection run."""
+
+    def __init__(self, seconds: float, clock: Callable[[], float] = time.monotonic):
+        if seconds <= 0:
+            raise SourceCollectorError("deadline must be positive")
+        self.seconds = seconds
+        self.clock = clock
+        self.expires_at = clock() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - self.clock())
+
+
+class SourceLatency:
+    """Recent successful fetch durations per source, used to size per-source timeouts and deadline deferrals."""
+
+    def __init__(self, entries: dict[str, dict[str, Any]] | None = None):
+        self.entries: dict[str, dict[str, Any]] = dict(entries or {})
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> "SourceLatency":
+        if not path.exists():
+            return cls()
+        data = json.loads(path.read_text(encoding="utf-8"))
+        entries = data.get("entries") if isinstance(data, dict) else None
+        if not isinstance(entries, dict):
+            raise SourceCollectorError(f"{path} is not a collector source latency file")
+        return cls({str(key): entry for key, entry in entries.items() if isinstance(entry, dict)})
+
+    def save(self, path: pathlib.Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {"latency_version": LATENCY_VERSION, "entries": self.entries}
+            path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    def p95(self, source: SourceRecord) -> float | None:
+        """Return the 95th percentile of the source's recent durations (nearest rank), or None without history."""
+        with self._lock:
+            samples = sorted(float(value) for value in self.entries.get(source_state_key(source), {}).get("samples", []))
+        if not samples:
+            return None
+        return samples[max(0, -(-len(samples) * 95 // 100) - 1)]
+
+    def timeout_for(self, source: SourceRecord) -> float:
+        """Socket timeout for the source: twice its p95, between `MIN_SOURCE_TIMEOUT_SECONDS` and `FETCH_TIMEOUT_SECONDS`."""
+        p95 = self.p95(source)
+        if p95 is None:
+            return float(FETCH_TIMEOUT_SECONDS)
+        return round(min(float(FETCH_TIMEOUT_SECONDS), max(MIN_SOURCE_TIMEOUT_SECONDS, p95 * LATENCY_TIMEOUT_FACTOR)), 3)
+
+    def record(self, source: SourceRecord, seconds: float) -> None:
+        key = source_state_key(source)
+        with self._lock:
+            samples = list(self.entries.get(key, {}).get("samples", []))
+            samples.append(round(seconds, 3))
+            self.entries[key] = {"samples": samples[-LATENCY_SAMPLES:]}
+
+
 def xml_text(element: ET.Element, names: tuple[str, ...]) -> str:
     for child in list(element):
+        if not isinstance(child.tag, str):
+            continue
         local = child.tag.rsplit("}", 1)[-1].lower()
         if local in names and child.text:
             return normalize_text(child.text)
@@ -355,6 +1222,8 @@ def xml_text(element: ET.Element, names: tuple[str, ...]) -> str:
 
 def xml_link(element: ET.Element) -> str:
     for child in list(element):
+        if not isinstance(child.tag, str):
+            continue
         local = child.tag.rsplit("}", 1)[-1].lower()
         if local == "link":
             href = child.attrib.get("href")
@@ -365,16 +1234,139 @@ def xml_link(element: ET.Element) -> str:
     return ""
 
 
-def parse_feed_items(xml_text_value: str, source: SourceRecord) -> list[SourceItem]:
+def feed_pull_parser() -> Any:
+    if LXML_ETREE is not None:
+        return LXML_ETREE.XMLPullParser(events=("end",))
+    return ET.XMLPullParser(events=("end",))
+
+
+def feed_parse_errors() -> tuple[type[Exception], ...]:
+    if LXML_ETREE is not None:
+        return (ET.ParseError, LXML_ETREE.XMLSyntaxError)
+    return (ET.ParseError,)
+
+
+def release_feed_entry(entry: Any) -> None:
+    """Drop a processed entry, and with lxml its already-processed siblings, from the partial tree."""
+    entry.clear()
+    if LXML_ETREE is not None and isinstance(entry, LXML_ETREE._Element):
+        parent = entry.getparent()
+        while parent is not None and entry.getprevious() is not None:
+            del parent[0]
+
+
+def is_feed_entry(element: Any) -> bool:
+    return isinstance(element.tag, str) and element.tag.rsplit("}", 1)[-1].lower() in {"item", "entry"}
+
+
+def feed_end_events(data: bytes) -> Any:
+    parser = feed_pull_parser()
+    for offset in range(0, len(data), FEED_PARSE_CHUNK_SIZE):
+        parser.feed(data[offset : offset + FEED_PARSE_CHUNK_SIZE])
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+
+def iter_feed_entries(xml_text_value: str | bytes, limit: int = FEED_ENTRY_LIMIT) -> Any:
+    """Yield up to `limit` feed entries, feeding the parser incrementally and stopping early."""
+    data = xml_text_value.encode("utf-8") if isinstance(xml_text_value, str) else xml_text_value
+    seen = 0
     try:
-        root = ET.fromstring(xml_text_value)
-    except ET.ParseError as exc:
+        for _event, element in feed_end_events(data):
+            if not is_feed_entry(element):
+                continue
+            yield element
+            release_feed_entry(element)
+            seen += 1
+            if seen >= limit:
+                return
+    except feed_parse_errors() as exc:
         raise SourceCollectorError(f"feed parse failed: {exc}") from exc
-    entries = [item for item in root.iter() if item.tag.rsplit("}", 1)[-1].lower() in {"item", "entry"}]
+
+
+def watermark_date(value: str) -> str:
+    """Normalize an RFC 822 or ISO 8601 feed date to a comparable UTC timestamp, or "" when unparseable."""
+    parsed = parse_date(value)
+    try:
+        moment = dt.datetime.fromisoformat(parsed.replace("Z", "+00:00"))
+    except ValueError:
+        return ""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=dt.timezone.utc)
+    return moment.astimezone(dt.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+class FeedWatermark:
+    """One source's watermark from the last run, plus what this run's feed scan has seen and pruned."""
+
+    def __init__(self, published: str = "", keys: frozenset[str] = frozenset()):
+        self.published = published
+        self.keys = keys
+        self.seen_published = ""
+        self.seen_keys: list[str] = []
+        self.pruned = 0
+
+    def covers(self, key: str, published: str) -> bool:
+        """Return whether an entry is at or below the watermark: already seen, or older than the newest date seen."""
+        if key:
+            self.seen_keys.append(key)
+        self.seen_published = max(self.seen_published, published)
+        if (key and key in self.keys) or (published and self.published and published < self.published):
+            self.pruned += 1
+            return True
+        return False
+
+
+class FeedWatermarks:
+    """Per-source feed watermarks (newest published date and the GUID/link keys of the last scan), persisted between runs."""
+
+    def __init__(self, entries: dict[str, dict[str, Any]] | None = None):
+        self.entries: dict[str, dict[str, Any]] = dict(entries or {})
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> "FeedWatermarks":
+        if not path.exists():
+            return cls()
+        data = json.loads(path.read_text(encoding="utf-8"))
+        entries = data.get("entries") if isinstance(data, dict) else None
+        if not isinstance(entries, dict):
+            raise SourceCollectorError(f"{path} is not a collector feed watermark file")
+        return cls({str(key): entry for key, entry in entries.items() if isinstance(entry, dict)})
+
+    def save(self, path: pathlib.Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {"watermarks_version": WATERMARKS_VERSION, "entries": self.entries}
+            path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    def get(self, source: SourceRecord) -> FeedWatermark:
+        with self._lock:
+            entry = self.entries.get(source_state_key(source), {})
+        return FeedWatermark(published=normalize_text(entry.get("published")), keys=frozenset(entry.get("keys") or ()))
+
+    def update(self, source: SourceRecord, watermark: FeedWatermark) -> None:
+        if not watermark.seen_keys:
+            return
+        with self._lock:
+            self.entries[source_state_key(source)] = {
+                "published": max(watermark.published, watermark.seen_published),
+                "keys": sorted(set(watermark.seen_keys)),
+            }
+
+
+def parse_feed_items(
+    xml_text_value: str | bytes, source: SourceRecord, limit: int = FEED_ENTRY_LIMIT, watermark: FeedWatermark | None = None
+) -> list[SourceItem]:
     items: list[SourceItem] = []
-    for entry in entries[:20]:
-        title = xml_text(entry, ("title",))
+    for entry in iter_feed_entries(xml_text_value, limit=limit):
         link = absolute_http_url(xml_link(entry), source.url)
+        if watermark is not None:
+            key = xml_text(entry, ("guid", "id")) or link
+            if watermark.covers(key, watermark_date(xml_text(entry, ("pubdate", "published", "updated", "date")))):
+                continue
+        title = xml_text(entry, ("title",))
         summary = xml_text(entry, ("description", "summary", "subtitle", "content"))
         published = xml_text(entry, ("pubdate", "published", "updated", "date"))
         if title and link:
@@ -395,9 +1387,27 @@ def parse_feed_items(xml_text_value: str, source: SourceRecord) -> list[SourceIt
     return items
 
 
-def parse_page_metadata(page_html: str, source: SourceRecord) -> list[SourceItem]:
+def parse_page_head(page_html: str) -> MetadataHTMLParser:
+    """Feed the page to the metadata parser in chunks, stopping once the head has closed."""
     parser = MetadataHTMLParser()
-    parser.feed(page_html)
+    for offset in range(0, len(page_html), HTML_HEAD_CHUNK_SIZE):
+        parser.feed(page_html[offset : offset + HTML_HEAD_CHUNK_SIZE])
+        if parser.head_closed:
+            break
+    return parser
+
+
+def discovered_feed_url(parser: MetadataHTMLParser, page_url: str) -> str:
+    """Return the first RSS/Atom feed the page head advertises, as an absolute URL other than the page itself."""
+    for href in parser.feed_urls:
+        url = absolute_http_url(href, page_url)
+        if url and url != page_url:
+            return url
+    return ""
+
+
+def parse_page_metadata(page_html: str, source: SourceRecord, parser: MetadataHTMLParser | None = None) -> list[SourceItem]:
+    parser = parser or parse_page_head(page_html)
     title = normalize_text(parser.title) or source.name
     link = absolute_http_url(parser.canonical or source.url, source.url)
     summary = short_summary(parser.description or title)
@@ -417,77 +1427,514 @@ def parse_page_metadata(page_html: str, source: SourceRecord) -> list[SourceItem
     ]
 
 
-def collect_source_items_from_url(source: SourceRecord, url: str, fetch: FetchTransport = fetch_url) -> list[SourceItem]:
+def collect_from_url(
+    source: SourceRecord, url: str, fetch: FetchTransport = fetch_url, watermark: FeedWatermark | None = None
+) -> CollectedSourceItems:
     try:
         content = fetch(url)
+    except urllib.error.HTTPError as exc:
+        error_class = SourceTransportError if host_failure_status(exc.code) else SourceCollectorError
+        raise error_class(f"source fetch failed: {exc}") from exc
     except (urllib.error.URLError, http.client.HTTPException, OSError, TimeoutError) as exc:
-        raise SourceCollectorError(f"source fetch failed: {exc}") from exc
-    source = SourceRecord(
-        notion_page_id=source.notion_page_id,
-        name=source.name,
-        url=url,
-        source_type=source.source_type,
-        platform=source.platform,
-        priority=source.priority,
-        authority_score=source.authority_score,
-        enabled=source.enabled,
-        fetch_frequency=source.fetch_frequency,
-        last_fetched_at=source.last_fetched_at,
-    )
+        raise SourceTransportError(f"source fetch failed: {exc}") from exc
+    source = replace(source, url=url)
     source_kind = f"{source.source_type} {source.platform}".lower()
+    feed_url = ""
     if "<rss" in content[:500].lower() or "<feed" in content[:500].lower() or any(token in source_kind for token in ("rss", "atom", "feed", "arxiv")):
-        return parse_feed_items(content, source)
-    return parse_page_metadata(content, source)
+        items = parse_feed_items(content, source, watermark=watermark)
+    else:
+        head = parse_page_head(content)
+        items = parse_page_metadata(content, source, head)
+        feed_url = discovered_feed_url(head, url)
+    pruned = watermark.pruned if watermark is not None else 0
+    if isinstance(content, FetchedText):
+        return CollectedSourceItems(
+            items=items,
+            fetched_url=url,
+            wire_bytes=content.wire_bytes,
+            decoded_bytes=content.decoded_bytes,
+            watermark_pruned=pruned,
+            head_only=content.head_only,
+            discovered_feed_url=feed_url,
+        )
+    return CollectedSourceItems(items=items, fetched_url=url, watermark_pruned=pruned, discovered_feed_url=feed_url)
+
+
+def collect_source_items_from_url(source: SourceRecord, url: str, fetch: FetchTransport = fetch_url) -> list[SourceItem]:
+    return collect_from_url(source, url, fetch=fetch).items
 
 
-def collect_source_items(source: SourceRecord, fetch: FetchTransport = fetch_url) -> CollectedSourceItems:
+def collect_source_items(
+    source: SourceRecord,
+    fetch: FetchTransport = fetch_url,
+    endpoint_health: EndpointHealth | None = None,
+    watermarks: FeedWatermarks | None = None,
+    circuits: HostCircuitBreaker | None = None,
+) -> CollectedSourceItems:
+    """Collect from the primary URL, then official fallbacks; with `endpoint_health`, the last known-good endpoint leads.
+
+    With `watermarks`, feed entries already seen by an earlier run are pruned before any item is built.
+    A feed advertised by the source's HTML head is promoted ahead of the page on later runs.
+    With `circuits`, endpoints on hosts with an open circuit are not fetched, and failures and successes are recorded per host.
+    """
+    fallbacks = official_metadata_fallback_urls(source)
+    if endpoint_health is not None:
+        endpoints, primary_deferred = endpoint_health.endpoint_order(source, fallbacks)
+        promoted_feed = endpoint_health.promoted_feed(source)
+    else:
+        endpoints, primary_deferred = [source.url, *fallbacks], False
+        promoted_feed = ""
+    errors: list[tuple[str, SourceCollectorError]] = []
+    open_circuits: dict[str, str] = {}
+    for url in endpoints:
+        until = circuits.open_until(url) if circuits is not None else ""
+        if until:
+            open_circuits[url_host(url)] = until
+            continue
+        watermark = watermarks.get(source) if watermarks is not None else None
+        try:
+            collected = collect_from_url(source, url, fetch=fetch, watermark=watermark)
+        except SourceNotModified as not_modified:
+            collected = CollectedSourceItems(
+                items=[],
+                fetched_url=url,
+                not_modified_reason=not_modified.reason,
+                bytes_not_downloaded=not_modified.bytes_not_downloaded,
+            )
+        except SourceCollectorError as exc:
+            # Only an unreachable or overloaded host trips its circuit; a 404 or an unparseable body is the
+            # source's own problem and is tracked per source by `endpoint_health`.
+            if circuits is not None and isinstance(exc, SourceTransportError):
+                circuits.record_failure(url, exc)
+            errors.append((url, exc))
+            continue
+        if circuits is not None:
+            circuits.record_success(url)
+        primary_error = next((error for failed_url, error in errors if failed_url == source.url), None)
+        if watermarks is not None and watermark is not None:
+            watermarks.update(source, watermark)
+        if endpoint_health is not None:
+            endpoint_health.record(source, url, primary_error is not None, discovered_feed=collected.discovered_feed_url)
+        if url == promoted_feed:
+            return replace(collected, feed_promoted=True)
+        if url == source.url:
+            return collected
+        if primary_error is not None:
+            fallback_reason = f"{primary_error}; retried official metadata endpoint"
+        else:
+            fallback_reason = "primary URL re-probe not due; used last known-good endpoint"
+        return replace(collected, fallback_used=True, fallback_reason=fallback_reason, primary_probe_skipped=primary_deferred)
+    if not errors:
+        raise SourceCircuitOpen(sorted(open_circuits), max(open_circuits.values()))
+    if endpoint_health is not None:
+        endpoint_health.record(source, "", any(failed_url == source.url for failed_url, _ in errors))
+    first_url, first_error = errors[0]
+    if len(errors) == 1:
+        raise first_error
+    fallback_errors = [f"{url}: {error}" for url, error in errors[1:]]
+    raise SourceCollectorError(f"{first_error}; fallback fetch failed: {'; '.join(fallback_errors)}") from first_error
+
+
+def collect_source_outcome(
+    source: SourceRecord,
+    fetch: FetchTransport = fetch_url,
+    endpoint_health: EndpointHealth | None = None,
+    watermarks: FeedWatermarks | None = None,
+    circuits: HostCircuitBreaker | None = None,
+    latency: SourceLatency | None = None,
+    deadline: RunDeadline | None = None,
+) -> CollectedSourceItems | SourceCollectorError:
+    """Collect one source, returning its error instead of raising.
+
+    With `latency`, the socket timeout follows the source's recent p95 and the duration is recorded.
+    With `deadline`, a source whose p95 (or `MIN_SOURCE_TIMEOUT_SECONDS` without history) no longer
+    fits in the remaining budget is deferred, and no timeout exceeds that budget.
+    """
+    timeout = latency.timeout_for(source) if latency is not None else float(FETCH_TIMEOUT_SECONDS)
+    clock = deadline.clock if deadline is not None else time.monotonic
+    if deadline is not None:
+        remaining = deadline.remaining()
+        expected = (latency.p95(source) if latency is not None else None) or MIN_SOURCE_TIMEOUT_SECONDS
+        if remaining < expected:
+            return SourceDeadlineDeferred(round(remaining, 3), expected)
+        timeout = min(timeout, remaining)
+    token = SOURCE_FETCH_TIMEOUT.set(timeout)
+    deadline_token = SOURCE_RUN_DEADLINE.set(deadline)
+    started = clock()
     try:
-        return CollectedSourceItems(items=collect_source_items_from_url(source, source.url, fetch=fetch), fetched_url=source.url)
-    except SourceCollectorError as primary_error:
-        fallback_errors: list[str] = []
-        for fallback_url in official_metadata_fallback_urls(source):
+        collected = collect_source_items(source, fetch=fetch, endpoint_health=endpoint_health, watermarks=watermarks, circuits=circuits)
+    except SourceCollectorError as exc:
+        return exc
+    finally:
+        SOURCE_RUN_DEADLINE.reset(deadline_token)
+        SOURCE_FETCH_TIMEOUT.reset(token)
+    if latency is None:
+        return collected
+    elapsed = clock() - started
+    latency.record(source, elapsed)
+    return replace(collected, fetch_seconds=round(elapsed, 3))
+
+
+def host_interleaved_order(sources: list[SourceRecord]) -> list[int]:
+    """Return source indices round-robin across hosts, so consecutive fetches go to different hosts."""
+    lanes: dict[str, list[int]] = {}
+    for index, source in enumerate(sources):
+        lanes.setdefault(url_host(source.url), []).append(index)
+    order: list[int] = []
+    for rank in range(max((len(lane) for lane in lanes.values()), default=0)):
+        order.extend(lane[rank] for lane in lanes.values() if rank < len(lane))
+    return order
+
+
+def collect_sources(
+    sources: list[SourceRecord],
+    fetch: FetchTransport = fetch_url,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    endpoint_health: EndpointHealth | None = None,
+    watermarks: FeedWatermarks | None = None,
+    circuits: HostCircuitBreaker | None = None,
+    latency: SourceLatency | None = None,
+    deadline: RunDeadline | None = None,
+) -> list[CollectedSourceItems | SourceCollectorError]:
+    """Collect sources with bounded concurrency, interleaving hosts, and return outcomes in input order."""
+    if max_concurrency < 1:
+        raise SourceCollectorError("max_concurrency must be at least 1")
+
+    def outcome(source: SourceRecord) -> CollectedSourceItems | SourceCollectorError:
+        return collect_source_outcome(
+            source,
+            fetch=fetch,
+            endpoint_health=endpoint_health,
+            watermarks=watermarks,
+            circuits=circuits,
+            latency=latency,
+            deadline=deadline,
+        )
+
+    order = host_interleaved_order(sources)
+    if max_concurrency == 1 or len(sources) <= 1:
+        fetched = [outcome(sources[index]) for index in order]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(sources))) as executor:
+            fetched = list(executor.map(outcome, [sources[index] for index in order]))
+    by_index = dict(zip(order, fetched))
+    return [by_index[index] for index in range(len(sources))]
+
+
+def arxiv_categories(source: SourceRecord) -> list[str]:
+    """Return the arXiv categories of a category feed or listing URL such as `https://export.arxiv.org/rss/cs.AI+cs.LG`."""
+    parsed = urllib.parse.urlparse(source.url)
+    host = parsed.netloc.lower()
+    if host != "arxiv.org" and not host.endswith(".arxiv.org"):
+        return []
+    match = ARXIV_CATEGORY_PATH.match(parsed.path)
+    if not match:
+        return []
+    return [category for category in match.group(1).split("+") if category]
+
+
+def arxiv_query_url(search_query: str, start: int, page_size: int = ARXIV_PAGE_SIZE) -> str:
+    parameters = {
+        "search_query": search_query,
+        "sortBy": "submittedDate",
+        "sortOrder": "descending",
+        "start": start,
+        "max_results": page_size,
+    }
+    return f"{ARXIV_API_URL}?{urllib.parse.urlencode(parameters)}"
+
+
+@dataclass(frozen=True)
+class ArxivEntry:
+    arxiv_id: str
+    title: str
+    summary: str
+    published: str
+    categories: tuple[str, ...]
+
+
+def parse_arxiv_entries(xml_text_value: str | bytes, limit: int = ARXIV_PAGE_SIZE) -> list[ArxivEntry]:
+    """Parse one export-API page; categories list the primary category first."""
+    entries: list[ArxivEntry] = []
+    for entry in iter_feed_entries(xml_text_value, limit=limit):
+        match = ARXIV_ID_PATTERN.search(xml_text(entry, ("id",)))
+        primary = ""
+        categories: list[str] = []
+        for child in list(entry):
+            if not isinstance(child.tag, str):
+                continue
+            local = child.tag.rsplit("}", 1)[-1].lower()
+            term = normalize_text(child.attrib.get("term"))
+            if local == "primary_category" and term:
+                primary = term
+            elif local == "category" and term:
+                categories.append(term)
+        entries.append(
+            ArxivEntry(
+                arxiv_id=match.group(1) if match else "",
+                title=xml_text(entry, ("title",)),
+                summary=xml_text(entry, ("summary",)),
+                published=xml_text(entry, ("published",)),
+                categories=tuple(dict.fromkeys([primary, *categories] if primary else categories)),
+            )
+        )
+    return entries
+
+
+class ArxivBatch:
+    """Collect every arXiv category source through a few batched export-API queries.
+
+    Categories are merged into `search_query=cat:A OR cat:B ...` queries sorted newest first and
+    paged with `start` offsets. Per query, the newest submission date of the last completed sweep
+    is kept; a sweep stops at the first older entry. A sweep that runs out of pages before reaching
+    it saves its offset, and the next run resumes there. Papers are deduplicated by arXiv ID and
+    credited to the first source, in source order, listing their primary or a cross-listed category.
+    """
+
+    def __init__(
+        self,
+        entries: dict[str, dict[str, Any]] | None = None,
+        page_size: int = ARXIV_PAGE_SIZE,
+        max_pages: int = ARXIV_MAX_PAGES_PER_RUN,
+        request_interval_seconds: float = ARXIV_REQUEST_INTERVAL_SECONDS,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.entries: dict[str, dict[str, Any]] = dict(entries or {})
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.request_interval_seconds = request_interval_seconds
+        self.sleep = sleep
+        self._requests = 0
+
+    @classmethod
+    def load(cls, path: pathlib.Path, **options: Any) -> "ArxivBatch":
+        if not path.exists():
+            return cls(**options)
+        data = json.loads(path.read_text(encoding="utf-8"))
+        entries = data.get("entries") if isinstance(data, dict) else None
+        if not isinstance(entries, dict):
+            raise SourceCollectorError(f"{path} is not a collector arXiv offsets file")
+        return cls({str(key): entry for key, entry in entries.items() if isinstance(entry, dict)}, **options)
+
+    def save(self, path: pathlib.Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"offsets_version": ARXIV_OFFSETS_VERSION, "entries": self.entries}
+        path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    def page_fits(self, deadline: RunDeadline | None) -> bool:
+        """Whether the polite wait plus one page request still fits in the run's remaining budget."""
+        wait = self.request_interval_seconds if self._requests else 0.0
+        return deadline is None or deadline.remaining() >= wait + MIN_SOURCE_TIMEOUT_SECONDS
+
+    def fetch_page(self, url: str, fetch: FetchTransport, deadline: RunDeadline | None = None) -> str:
+        if self._requests and self.request_interval_seconds > 0:
+            self.sleep(self.request_interval_seconds)
+        self._requests += 1
+        token = SOURCE_FETCH_TIMEOUT.set(min(float(FETCH_TIMEOUT_SECONDS), deadline.remaining()) if deadline is not None else None)
+        deadline_token = SOURCE_RUN_DEADLINE.set(deadline)
+        try:
+            return fetch(url)
+        except (urllib.error.URLError, http.client.HTTPException, OSError, TimeoutError) as exc:
+            raise SourceCollectorError(f"arXiv query failed: {exc}") from exc
+        finally:
+            SOURCE_RUN_DEADLINE.reset(deadline_token)
+            SOURCE_FETCH_TIMEOUT.reset(token)
+
+    def query(
+        self, search_query: str, fetch: FetchTransport, report: dict[str, Any], deadline: RunDeadline | None = None
+    ) -> tuple[list[ArxivEntry], str]:
+        """Page through one query from its saved offset; return new entries and the first page URL.
+
+        When `deadline` leaves no room for the next page, the sweep stops there and its offset is saved.
+        """
+        entry = dict(self.entries.get(search_query, {}))
+        watermark = normalize_text(entry.get("newest_published"))
+        start = int(entry.get("next_start") or 0)
+        sweep_newest = normalize_text(entry.get("sweep_newest")) if start else ""
+        if start:
+            report["resumed_queries"] += 1
+        collected: list[ArxivEntry] = []
+        first_url = ""
+        caught_up = False
+        for _page in range(self.max_pages):
+            if not self.page_fits(deadline):
+                if not first_url:
+                    raise SourceDeadlineDeferred(round(deadline.remaining(), 3), MIN_SOURCE_TIMEOUT_SECONDS)
+                report["pages_deferred_deadline"] += 1
+                break
+            url = arxiv_query_url(search_query, start, self.page_size)
+            first_url = first_url or url
             try:
-                return CollectedSourceItems(
-                    items=collect_source_items_from_url(source, fallback_url, fetch=fetch),
-                    fetched_url=fallback_url,
-                    fallback_used=True,
-                    fallback_reason=f"{primary_error}; retried official metadata endpoint",
+                page = parse_arxiv_entries(self.fetch_page(url, fetch, deadline), self.page_size)
+            except SourceNotModified:
+                caught_up = True
+                break
+            report["requests"] += 1
+            report["entries_seen"] += len(page)
+            for item in page:
+                published = watermark_date(item.published)
+                sweep_newest = max(sweep_newest, published)
+                if watermark and published and published < watermark:
+                    caught_up = True
+                    report["watermark_pruned"] += 1
+                    continue
+                collected.append(item)
+            start += len(page)
+            if caught_up or len(page) < self.page_size:
+                caught_up = True
+                break
+        if caught_up or not watermark:
+            # A completed sweep (or a first run, which has nothing to resume towards) restarts from the newest entry next time.
+            self.entries[search_query] = {"newest_published": max(watermark, sweep_newest), "next_start": 0}
+        else:
+            self.entries[search_query] = {"newest_published": watermark, "next_start": start, "sweep_newest": sweep_newest}
+        return collected, first_url
+
+    def collect(
+        self, sources: list[SourceRecord], fetch: FetchTransport, deadline: RunDeadline | None = None
+    ) -> tuple[list[CollectedSourceItems | SourceCollectorError], dict[str, Any]]:
+        """Collect arXiv category sources, returning outcomes in input order and a batch report."""
+        self._requests = 0
+        owners: dict[str, list[int]] = {}
+        spellings: dict[str, str] = {}
+        for index, source in enumerate(sources):
+            for category in arxiv_categories(source):
+                owners.setdefault(category.lower(), []).append(index)
+                spellings.setdefault(category.lower(), category)
+        report = {
+            "sources_batched": len(sources),
+            "categories": len(owners),
+            "queries": 0,
+            "requests": 0,
+            "resumed_queries": 0,
+            "entries_seen": 0,
+            "watermark_pruned": 0,
+            "duplicate_arxiv_ids_skipped": 0,
+            "pages_deferred_deadline": 0,
+        }
+        items: list[list[SourceItem]] = [[] for _ in sources]
+        fetched_urls = [""] * len(sources)
+        errors: list[SourceCollectorError | None] = [None] * len(sources)
+        seen_ids: set[str] = set()
+        categories = sorted(owners)
+        for offset in range(0, len(categories), ARXIV_CATEGORIES_PER_QUERY):
+            chunk = categories[offset : offset + ARXIV_CATEGORIES_PER_QUERY]
+            members = sorted({index for category in chunk for index in owners[category]})
+            report["queries"] += 1
+            try:
+                entries, url = self.query(" OR ".join(f"cat:{spellings[category]}" for category in chunk), fetch, report, deadline)
+            except SourceCollectorError as exc:
+                for index in members:
+                    errors[index] = errors[index] or exc
+                continue
+            for index in members:
+                fetched_urls[index] = fetched_urls[index] or url
+            for entry in entries:
+                if entry.arxiv_id in seen_ids:
+                    report["duplicate_arxiv_ids_skipped"] += 1
+                    continue
+                owner = next((owners[category.lower()][0] for category in entry.categories if category.lower() in owners), None)
+                if owner is None or not entry.arxiv_id or not entry.title:
+                    continue
+                seen_ids.add(entry.arxiv_id)
+                source = sources[owner]
+                items[owner].append(
+                    SourceItem(
+                        title=entry.title,
+                        link=f"https://arxiv.org/abs/{entry.arxiv_id}",
+                        published_date=parse_date(entry.published),
+                        summary=short_summary(entry.summary or entry.title),
+                        source_name=source.name,
+                        source_url=source.url,
+                        source_type=source.source_type or source.platform,
+                        priority=source.priority,
+                        authority_score=source.authority_score,
+                        attribution_complete=True,
+                    )
                 )
-            except SourceCollectorError as fallback_error:
-                fallback_errors.append(f"{fallback_url}: {fallback_error}")
-        if fallback_errors:
-            raise SourceCollectorError(f"{primary_error}; fallback fetch failed: {'; '.join(fallback_errors)}") from primary_error
-        raise
+        outcomes: list[CollectedSourceItems | SourceCollectorError] = [
+            error if error is not None else CollectedSourceItems(items=source_items, fetched_url=url, arxiv_batched=True)
+            for error, source_items, url in zip(errors, items, fetched_urls)
+        ]
+        return outcomes, report
+
+
+class WordSeparatorTable(dict):
+    """`str.translate` table mapping every non-alphanumeric character to a space, filled lazily."""
+
+    def __missing__(self, codepoint: int) -> str:
+        character = chr(codepoint)
+        value = character if character.isalnum() else " "
+        self[codepoint] = value
+        return value
+
+
+WORD_SEPARATORS = WordSeparatorTable()
+
+
+def word_tokens(value: str) -> list[str]:
+    return value.lower().translate(WORD_SEPARATORS).split()
+
+
+def matched_terms(value: str) -> frozenset[str]:
+    """Return the classifier terms in `value` as whole words, so "ai" never matches inside "said"."""
+    words = word_tokens(value)
+    terms = ITEM_WORD_TERMS.intersection(words)
+    if ITEM_PHRASE_FIRST_WORDS.isdisjoint(words):
+        return terms
+    return terms.union(phrase for phrase in map(" ".join, zip(words, words[1:])) if phrase in ITEM_PHRASE_TERMS)
+
+
+@functools.lru_cache(maxsize=256)
+def source_type_terms(source_type: str) -> frozenset[str]:
+    # Sources share a handful of type labels, so their terms are matched once per label.
+    return matched_terms(source_type)
+
+
+@dataclass(frozen=True)
+class ItemFeatures:
+    """Every classifier feature of a source item, computed by one scan of its text."""
+
+    relevance: str
+    category: str
+    quality_hint: int
+    has_raw_marker: bool
+    keywords: frozenset[str]
+
+
+def item_features(item: SourceItem) -> ItemFeatures:
+    text_terms = matched_terms(f"{item.title} {item.summary}")
+    type_terms = source_type_terms(item.source_type)
+    # The remaining candidate text only matters for the raw-content marker; tokenize it only when the substring occurs.
+    other_text = f"{item.source_name} {item.link} {item.published_date}"
+    has_raw_marker = RAW_CONTENT_MARKER in text_terms or RAW_CONTENT_MARKER in type_terms or (
+        RAW_CONTENT_MARKER in other_text.lower() and RAW_CONTENT_MARKER in word_tokens(other_text)
+    )
+    keywords = AI_RELEVANCE_TERMS & (text_terms | type_terms)
+    if not keywords:
+        relevance = "Low"
+    elif not HIGH_RELEVANCE_KEYWORDS.isdisjoint(keywords):
+        relevance = "High"
+    else:
+        relevance = "Medium"
+    category = next(
+        (name for name, terms, types in CATEGORY_TERMS if not (terms.isdisjoint(text_terms) and types.isdisjoint(type_terms))),
+        "Market Signal",
+    )
+    return ItemFeatures(relevance, category, quality_hint(item, relevance), has_raw_marker, keywords)
 
 
 def ai_relevance_text(item: SourceItem) -> str:
-    text = f"{item.title} {item.summary} {item.source_type}".lower()
-    matches = [keyword for keyword in AI_RELEVANCE_KEYWORDS if keyword in text]
-    if not matches:
-        return "Low"
-    if any(keyword in matches for keyword in ("agi", "agent", "agents", "agentic", "evaluation", "compute", "safety", "policy")):
-        return "High"
-    return "Medium"
+    return item_features(item).relevance
 
 
 def category_for(item: SourceItem) -> str:
-    text = f"{item.title} {item.summary}".lower()
-    if "policy" in text or "government" in item.source_type.lower():
-        return "Policy"
-    if "safety" in text or "alignment" in text:
-        return "Safety"
-    if "arxiv" in item.source_type.lower() or "research" in text or "paper" in text:
-        return "Research"
-    if "agent" in text:
-        return "Research"
-    if "compute" in text or "inference" in text:
-        return "Compute"
-    return "Market Signal"
-
-
-def quality_hint(item: SourceItem) -> int:
+    return item_features(item).category
+
+
+def quality_hint(item: SourceItem, relevance: str | None = None) -> int:
     score = min(95, max(45, item.authority_score))
-    if ai_relevance_text(item) == "Low":
+    if (relevance or ai_relevance_text(item)) == "Low":
         score -= 20
     if not item.attribution_complete or not item.link:
         score -= 25
@@ -502,21 +1949,23 @@ def safe_summary_only(item: SourceItem) -> str:
     return short_summary(item.summary or item.title, 240)
 
 
-def can_auto_publish(item: SourceItem, candidate: dict[str, Any]) -> bool:
+def can_auto_publish(item: SourceItem, candidate: dict[str, Any], features: ItemFeatures | None = None) -> bool:
+    features = features or item_features(item)
     return (
         item.priority == "Critical"
         and item.authority_score >= 85
         and item.attribution_complete
-        and bool(absolute_http_url(item.link))
+        and bool(candidate["Source URL"])
         and len(candidate["Summary"]) <= 260
         and candidate["Copyright Status"] == COPYRIGHT_STATUS
         and candidate["AGI Relevance"] != "Low"
         and candidate["Quality Hint"] >= 92
-        and "raw" not in json.dumps(candidate).lower()
+        and not features.has_raw_marker
     )
 
 
 def candidate_from_item(item: SourceItem) -> dict[str, Any]:
+    features = item_features(item)
     summary = safe_summary_only(item)
     source_url = absolute_http_url(item.link)
     attribution_complete = item.attribution_complete and bool(source_url)
@@ -527,21 +1976,21 @@ def candidate_from_item(item: SourceItem) -> dict[str, Any]:
         "Source URL": source_url,
         "Source Priority": item.priority,
         "Published Date": item.published_date,
-        "Category": category_for(item),
-        "AGI Relevance": ai_relevance_text(item),
+        "Category": features.category,
+        "AGI Relevance": features.relevance,
         "Summary": summary,
-        "Why It Matters": f"This source is a monitored DysonX {item.priority.lower()}-priority signal for {category_for(item).lower()} tracking.",
+        "Why It Matters": f"This source is a monitored DysonX {item.priority.lower()}-priority signal for {features.category.lower()} tracking.",
         "Evidence": f"Metadata collected from {item.source_name}; no source-page body was copied.",
         "Risk / Safety Notes": "Rule-based V1 candidate. Requires Owner review unless all auto-publish gates pass.",
         "Attribution Status": ATTRIBUTION_STATUS if attribution_complete else "Missing",
         "Copyright Status": COPYRIGHT_STATUS,
-        "Quality Hint": quality_hint(item),
+        "Quality Hint": features.quality_hint,
         "Status": "Needs Owner Review",
         "Ready for Pipeline": False,
         "Published": False,
         "Collector Version": "source_collector_v1",
     }
-    if can_auto_publish(item, candidate):
+    if can_auto_publish(item, candidate, features):
         candidate["Ready for Pipeline"] = True
         candidate["Published"] = True
         candidate["Status"] = "Ready for Quality Audit"
@@ -562,7 +2011,189 @@ def existing_keys(records: list[dict[str, Any]]) -> set[str]:
     return keys
 
 
-def skip_source_reason(source: SourceRecord) -> str:
+def minhash_coefficients(count: int) -> list[tuple[int, int]]:
+    coefficients = []
+    for index in range(count):
+        digest = hashlib.sha256(f"dysonx-minhash-{index}".encode("ascii")).digest()
+        coefficients.append((int.from_bytes(digest[:8], "big") % MINHASH_PRIME | 1, int.from_bytes(digest[8:16], "big") % MINHASH_PRIME))
+    return coefficients
+
+
+MINHASH_COEFFICIENTS = minhash_coefficients(NEAR_DUPLICATE_PERMUTATIONS)
+
+
+def text_shingles(value: str) -> set[str]:
+    words = re.findall(r"[a-z0-9]+", value.lower())
+    if len(words) < 2:
+        return set(words)
+    return {f"{first} {second}" for first, second in zip(words, words[1:])}
+
+
+def minhash_signature(record: dict[str, Any]) -> tuple[int, ...]:
+    """MinHash of title and summary word-bigram shingles; empty when the record has no text."""
+    title = normalize_text(field(record, "Signal Title", "Title", "Name"))
+    summary = normalize_text(field(record, "Summary"))
+    hashes = [zlib.crc32(shingle.encode("utf-8")) for shingle in text_shingles(f"{title} {summary}")]
+    if not hashes:
+        return ()
+    return tuple(min((a * value + b) % MINHASH_PRIME for value in hashes) & 0xFFFFFFFF for a, b in MINHASH_COEFFICIENTS)
+
+
+def near_duplicate_key(record: dict[str, Any]) -> str:
+    """Identify the Signal Intake row a record describes: its source URL, else its Notion page id, else its title."""
+    url = normalize_text(field(record, "Source URL", "source_url"))
+    if url:
+        return f"url:{url.lower()}"
+    page_id = normalize_text(record.get("_notion_page_id"))
+    if page_id:
+        return f"page:{page_id}"
+    return f"title:{normalized_title(normalize_text(field(record, 'Signal Title', 'Title', 'Name')))}"
+
+
+class NearDuplicateIndex:
+    """MinHash signatures with LSH banding, so a lookup only compares entries that share a band bucket.
+
+    Entries are keyed by the row they describe, so adding a row again (a re-read, an edit, or a
+    candidate that was just written) replaces its entry. Past `max_entries`, the least recently
+    added entries are evicted.
+    """
+
+    def __init__(self, threshold: float = NEAR_DUPLICATE_THRESHOLD, max_entries: int = NEAR_DUPLICATE_MAX_ENTRIES):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.entries: dict[str, tuple[int, str, tuple[int, ...]]] = {}
+        self.buckets: dict[tuple[int, ...], set[str]] = {}
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def bands(signature: tuple[int, ...]) -> list[tuple[int, ...]]:
+        rows = NEAR_DUPLICATE_BAND_ROWS
+        return [(start, *signature[start : start + rows]) for start in range(0, len(signature), rows)]
+
+    def add(self, title: str, signature: tuple[int, ...], key: str = "") -> None:
+        if len(signature) != NEAR_DUPLICATE_PERMUTATIONS:
+            return
+        key = key or f"title:{normalized_title(title)}"
+        self.remove(key)
+        self._sequence += 1
+        self.entries[key] = (self._sequence, title, signature)
+        for band in self.bands(signature):
+            self.buckets.setdefault(band, set()).add(key)
+        while len(self.entries) > self.max_entries:
+            self.remove(next(iter(self.entries)))
+
+    def remove(self, key: str) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        for band in self.bands(entry[2]):
+            members = self.buckets.get(band)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del self.buckets[band]
+
+    def add_records(self, records: list[dict[str, Any]]) -> None:
+        for record in records:
+            self.add(normalize_text(field(record, "Signal Title", "Title", "Name")), minhash_signature(record), near_duplicate_key(record))
+
+    def match(self, signature: tuple[int, ...]) -> tuple[str, float] | None:
+        """Return the most similar indexed title and its estimated Jaccard similarity when above the threshold."""
+        if len(signature) != NEAR_DUPLICATE_PERMUTATIONS:
+            return None
+        keys = {key for band in self.bands(signature) for key in self.buckets.get(band, ())}
+        best: tuple[str, float] | None = None
+        for _sequence, title, other in sorted(self.entries[key] for key in keys):
+            score = sum(1 for left, right in zip(signature, other) if left == right) / NEAR_DUPLICATE_PERMUTATIONS
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (title, score)
+        return best
+
+    def to_json(self) -> list[list[str]]:
+        return [[key, title, "".join(f"{value:08x}" for value in signature)] for key, (_sequence, title, signature) in self.entries.items()]
+
+    @classmethod
+    def from_json(cls, entries: list[Any]) -> "NearDuplicateIndex":
+        index = cls()
+        for entry in entries:
+            if isinstance(entry, list) and len(entry) == 3:
+                key, title, signature = (str(value) for value in entry)
+                index.add(title, tuple(int(signature[offset : offset + 8], 16) for offset in range(0, len(signature), 8)), key)
+        return index
+
+
+class DedupeIndex:
+    """Persisted dedupe state of Signal Intake rows, refreshed incrementally by `last_edited_time`.
+
+    Holds the exact `url:` / `title:` keys and a near-duplicate MinHash index over title and summary.
+    """
+
+    def __init__(self, keys: set[str] | None = None, synced_through: str = "", near_duplicates: NearDuplicateIndex | None = None):
+        self.keys: set[str] = set(keys or set())
+        self.synced_through = synced_through
+        self.near_duplicates = near_duplicates or NearDuplicateIndex()
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> "DedupeIndex":
+        if not path.exists():
+            return cls()
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict) or not isinstance(data.get("keys"), list):
+            raise SourceCollectorError(f"{path} is not a collector dedupe index")
+        if data.get("index_version") != DEDUPE_INDEX_VERSION:
+            # Older index layouts are rebuilt from a full Signal Intake read.
+            return cls()
+        return cls(
+            {str(key) for key in data["keys"]},
+            normalize_text(data.get("synced_through")),
+            NearDuplicateIndex.from_json(data.get("near_duplicates") or []),
+        )
+
+    def save(self, path: pathlib.Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "index_version": DEDUPE_INDEX_VERSION,
+            "synced_through": self.synced_through,
+            "keys": sorted(self.keys),
+            "near_duplicates": self.near_duplicates.to_json(),
+        }
+        path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    def add_records(self, records: list[dict[str, Any]]) -> None:
+        self.keys |= existing_keys(records)
+        self.near_duplicates.add_records(records)
+        edited = [normalize_text(record.get("_last_edited_time")) for record in records]
+        self.synced_through = max([self.synced_through, *edited])
+
+    def add_candidates(self, candidates: list[dict[str, Any]]) -> None:
+        self.keys |= existing_keys(candidates)
+        self.near_duplicates.add_records(candidates)
+
+    def sync(self, client: "NotionClient", reconcile: bool = False) -> dict[str, Any]:
+        """Bring the index up to date: a full Signal Intake read on first use or reconcile, else only edited rows."""
+        if reconcile or not self.synced_through:
+            records = client.list_signal_intake()
+            self.keys = set()
+            self.synced_through = ""
+            self.near_duplicates = NearDuplicateIndex()
+            mode = "full"
+        else:
+            records = client.list_signal_intake(edited_since=self.synced_through)
+            mode = "incremental"
+        self.add_records(records)
+        return {
+            "mode": mode,
+            "rows_read": len(records),
+            "keys": len(self.keys),
+            "near_duplicate_entries": len(self.near_duplicates),
+            "synced_through": self.synced_through,
+        }
+
+
+def skip_source_reason(source: SourceRecord, decision: dict[str, Any] | None = None) -> str:
     if not source.enabled:
         return "source_disabled"
     if source.priority not in ALLOWED_PRIORITIES:
@@ -571,23 +2202,50 @@ def skip_source_reason(source: SourceRecord) -> str:
         return "missing_url"
     if not supported_source(source):
         return "unsupported_source_type"
+    if decision is not None:
+        return decision["reason"]
     if not frequency_due(source):
         return "fetch_frequency_not_due"
     return "not_eligible"
 
 
 def dedupe_candidates(
-    candidates: list[dict[str, Any]], existing_records: list[dict[str, Any]]
+    candidates: list[dict[str, Any]],
+    existing_records: list[dict[str, Any]],
+    known_keys: set[str] | None = None,
+    near_duplicates: NearDuplicateIndex | None = None,
 ) -> tuple[list[dict[str, Any]], int, list[dict[str, Any]], dict[str, int]]:
-    keys = existing_keys(existing_records)
+    keys = existing_keys(existing_records) | (known_keys or set())
+    history = NearDuplicateIndex()
+    history.add_records(existing_records)
+    # Candidates emitted by this run go into a separate index so the caller's persisted one is not mutated.
+    emitted_index = NearDuplicateIndex()
     emitted: list[dict[str, Any]] = []
     skipped_candidates: list[dict[str, Any]] = []
-    skipped_by_reason = {"duplicate_source_url": 0, "duplicate_title": 0}
+    skipped_by_reason = {"duplicate_source_url": 0, "duplicate_title": 0, "near_duplicate": 0}
     skipped = 0
     for candidate in candidates:
         url_key = f"url:{normalize_text(candidate.get('Source URL')).lower()}"
         title_key = f"title:{normalized_title(normalize_text(candidate.get('Signal Title')))}"
         matched_keys = [key for key in (url_key, title_key) if key in keys]
+        signature = () if matched_keys else minhash_signature(candidate)
+        matches = [index.match(signature) for index in (near_duplicates, history, emitted_index) if index is not None]
+        near_match = max((match for match in matches if match), key=lambda match: match[1], default=None)
+        if near_match:
+            matched_title, similarity = near_match
+            skipped += 1
+            skipped_by_reason["near_duplicate"] += 1
+            skipped_candidates.append(
+                {
+                    "source": normalize_text(candidate.get("Source Name")),
+                    "title": normalize_text(candidate.get("Signal Title")),
+                    "source_url": normalize_text(candidate.get("Source URL")),
+                    "reason": "near_duplicate",
+                    "matched_title": matched_title,
+                    "similarity": round(similarity, 3),
+                }
+            )
+            continue
         if matched_keys:
             skipped += 1
             reason = "duplicate_source_url" if url_key in matched_keys else "duplicate_title"
@@ -604,6 +2262,7 @@ def dedupe_candidates(
             continue
         keys.add(url_key)
         keys.add(title_key)
+        emitted_index.add(normalize_text(candidate.get("Signal Title")), signature, near_duplicate_key(candidate))
         emitted.append(candidate)
     return emitted, skipped, skipped_candidates, skipped_by_reason
 
@@ -618,15 +2277,7 @@ def freshness_diagnostic(raw_items_seen: int, new_candidates_created: int, dupli
     return "no new candidates created"
 
 
-def urllib_notion_transport(url: str, headers: dict[str, str], payload: dict[str, Any] | None, method: str) -> dict[str, Any]:
-    data = json.dumps(payload or {}).encode("utf-8") if payload is not None else None
-    request = urllib.request.Request(url, data=data, headers=headers, method=method)
-    try:
-        with urllib.request.urlopen(request, timeout=30) as response:
-            body = response.read().decode("utf-8")
-    except urllib.error.URLError as exc:
-        raise SourceCollectorError(f"Notion request failed: {exc}") from exc
-    return json.loads(body) if body else {}
+urllib_notion_transport = RateLimitedNotionTransport(error_class=SourceCollectorError, error_prefix="Notion request failed")
 
 
 class NotionClient:
@@ -635,6 +2286,9 @@ class NotionClient:
         self.sources_database_id = sources_database_id
         self.signal_intake_database_id = signal_intake_database_id
         self.transport = transport
+        self._signal_intake_properties: set[str] | None = None
+        self._source_properties: set[str] | None = None
+        self._schema_lock = threading.Lock()
 
     @property
     def headers(self) -> dict[str, str]:
@@ -644,28 +2298,26 @@ class NotionClient:
             "Notion-Version": NOTION_VERSION,
         }
 
-    def query_database(self, database_id: str) -> list[dict[str, Any]]:
-        url = f"https://api.notion.com/v1/databases/{database_id}/query"
-        payload: dict[str, Any] = {"page_size": 100}
-        records: list[dict[str, Any]] = []
-        while True:
-            response = self.transport(url, self.headers, payload, "POST")
-            results = response.get("results")
-            if not isinstance(results, list):
-                raise SourceCollectorError("Notion query response is missing results")
-            records.extend(notion_page_to_record(page) for page in results if isinstance(page, dict))
-            if response.get("has_more") is not True:
-                return records
-            cursor = response.get("next_cursor")
-            if not cursor:
-                raise SourceCollectorError("Notion query response is missing next_cursor")
-            payload = {"page_size": 100, "start_cursor": cursor}
-
-    def list_sources(self) -> list[dict[str, Any]]:
-        return self.query_database(self.sources_database_id)
-
-    def list_signal_intake(self) -> list[dict[str, Any]]:
-        return self.query_database(self.signal_intake_database_id)
+    def query_database(self, database_id: str, query_filter: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        return query_database_records(
+            lambda url, headers, payload: self.transport(url, headers, payload, "POST"),
+            self.token,
+            database_id,
+            COLLECTOR_PAGE_DECODER,
+            SourceCollectorError,
+            query_filter=query_filter,
+            notion_version=NOTION_VERSION,
+        )
+
+    @staticmethod
+    def edited_since_filter(edited_since: str) -> dict[str, Any] | None:
+        return edited_since_filter(edited_since)
+
+    def list_sources(self, edited_since: str = "") -> list[dict[str, Any]]:
+        return self.query_database(self.sources_database_id, self.edited_since_filter(edited_since))
+
+    def list_signal_intake(self, edited_since: str = "") -> list[dict[str, Any]]:
+        return self.query_database(self.signal_intake_database_id, self.edited_since_filter(edited_since))
 
     def create_signal_intake_row(self, candidate: dict[str, Any]) -> None:
         payload = {
@@ -674,23 +2326,154 @@ class NotionClient:
         }
         self.transport("https://api.notion.com/v1/pages", self.headers, payload, "POST")
 
-    def signal_intake_property_names(self) -> set[str]:
-        response = self.transport(f"https://api.notion.com/v1/databases/{self.signal_intake_database_id}", self.headers, None, "GET")
-        properties = response.get("properties")
-        if not isinstance(properties, dict):
-            return set()
-        return {str(name) for name in properties}
+    def create_signal_intake_rows(self, candidates: list[dict[str, Any]], max_workers: int = NOTION_WRITE_WORKERS) -> list[dict[str, Any]]:
+        """Create Signal Intake rows with bounded parallelism and return one result per candidate, in order.
+
+        Pacing against the Notion rate limit is left to the transport.
+        """
+        self.signal_intake_property_names()
 
-    def update_source_fetch_status(self, source: SourceRecord, fetched_at: str, success: bool, error: str = "") -> None:
+        def write(candidate: dict[str, Any]) -> dict[str, Any]:
+            result = {
+                "title": normalize_text(candidate.get("Signal Title")),
+                "source_url": normalize_text(candidate.get("Source URL")),
+                "status": "created",
+            }
+            try:
+                self.create_signal_intake_row(candidate)
+            except (SourceCollectorError, OSError, ValueError) as exc:
+                result["status"] = "error"
+                result["error"] = str(exc)
+            return result
+
+        if max_workers <= 1 or len(candidates) <= 1:
+            return [write(candidate) for candidate in candidates]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(candidates))) as executor:
+            return list(executor.map(write, candidates))
+
+    def signal_intake_property_names(self) -> set[str]:
+        """Return the Signal Intake property names, fetching the database schema once per client."""
+        with self._schema_lock:
+            if self._signal_intake_properties is None:
+                response = self.transport(f"https://api.notion.com/v1/databases/{self.signal_intake_database_id}", self.headers, None, "GET")
+                properties = response.get("properties")
+                self._signal_intake_properties = {str(name) for name in properties} if isinstance(properties, dict) else set()
+            return set(self._signal_intake_properties)
+
+    def source_property_names(self) -> set[str]:
+        """Return the Sources database property names, fetching its schema once per client."""
+        with self._schema_lock:
+            if self._source_properties is None:
+                response = self.transport(f"https://api.notion.com/v1/databases/{self.sources_database_id}", self.headers, None, "GET")
+                properties = response.get("properties")
+                self._source_properties = {str(name) for name in properties} if isinstance(properties, dict) else set()
+            return set(self._source_properties)
+
+    def update_source_fetch_status(
+        self, source: SourceRecord, fetched_at: str, success: bool, error: str = "", supported_properties: set[str] | None = None
+    ) -> None:
         if not source.notion_page_id:
             return
         properties: dict[str, Any] = {
             "Last Fetched At": {"date": {"start": fetched_at}},
-            "Last Error": {"rich_text": [{"text": {"content": error[:1800]}}]},
+            "Last Error": {"rich_text": [{"text": {"content": error[:SOURCE_STATUS_ERROR_LIMIT]}}]},
         }
         if success:
             properties["Last Success At"] = {"date": {"start": fetched_at}}
-        self.transport(f"https://api.notion.com/v1/pages/{source.notion_page_id}", self.headers, {"properties": properties}, "PATCH")
+        if supported_properties is not None:
+            properties = {name: value for name, value in properties.items() if name in supported_properties}
+        if properties:
+            self.transport(f"https://api.notion.com/v1/pages/{source.notion_page_id}", self.headers, {"properties": properties}, "PATCH")
+
+
+class SourceStatusWriter:
+    """Buffer a run's per-source fetch status and write only the changes to the Sources database.
+
+    `record` keeps the latest status per source. `flush_in_background` sends one PATCH per changed source
+    from a background thread while the run finishes; the shared Notion transport paces the requests.
+    A status is unchanged when the error matches `Last Error` (empty after a success that is already
+    recorded) and `Last Fetched At` is younger than both `refresh_hours` and the source's Fetch Frequency,
+    which reads that timestamp to decide whether the source is due.
+    """
+
+    def __init__(
+        self,
+        client: NotionClient,
+        refresh_hours: float = SOURCE_STATUS_REFRESH_HOURS,
+        max_workers: int = SOURCE_STATUS_WRITE_WORKERS,
+        now: Callable[[], dt.datetime] = lambda: dt.datetime.now(dt.timezone.utc),
+    ):
+        self.client = client
+        self.refresh_hours = refresh_hours
+        self.max_workers = max_workers
+        self.now = now
+        self.pending: dict[str, tuple[SourceRecord, bool, str]] = {}
+        self.report = {"sources_recorded": 0, "patches_sent": 0, "patches_skipped_unchanged": 0, "patches_failed": 0, "errors": []}
+        self._thread: threading.Thread | None = None
+
+    def record(self, source: SourceRecord, success: bool, error: str = "") -> None:
+        if source.notion_page_id:
+            self.pending[source.notion_page_id] = (source, success, "" if success else error[:SOURCE_STATUS_ERROR_LIMIT])
+
+    def record_collection(self, source_records: list[dict[str, Any]], collected: CollectedCandidates) -> None:
+        """Record every source the run tried to fetch; skipped and deferred sources keep their status."""
+        for index, result in zip(collected.source_indices, collected.source_results):
+            if result["status"] in {"collected", "not_modified"}:
+                self.record(source_from_record(source_records[index]), True)
+            elif result["status"] == "error":
+                self.record(source_from_record(source_records[index]), False, result.get("error", ""))
+
+    def changed(self, source: SourceRecord, success: bool, error: str, now: dt.datetime) -> bool:
+        if error != source.last_error[:SOURCE_STATUS_ERROR_LIMIT] or (success and not source.last_success_at):
+            return True
+        try:
+            last_fetched = dt.datetime.fromisoformat(source.last_fetched_at.replace("Z", "+00:00"))
+        except ValueError:
+            return True
+        if last_fetched.tzinfo is None:
+            last_fetched = last_fetched.replace(tzinfo=dt.timezone.utc)
+        return now - last_fetched >= dt.timedelta(hours=min(self.refresh_hours, frequency_hours(source)))
+
+    def flush(self) -> dict[str, Any]:
+        now = self.now()
+        fetched_at = iso_timestamp(now)
+        pending, self.pending = list(self.pending.values()), {}
+        self.report["sources_recorded"] += len(pending)
+        changes = [(source, success, error) for source, success, error in pending if self.changed(source, success, error, now)]
+        self.report["patches_skipped_unchanged"] += len(pending) - len(changes)
+        if not changes:
+            return self.report
+        try:
+            supported = self.client.source_property_names()
+        except (SourceCollectorError, OSError, ValueError) as exc:
+            self.report["patches_failed"] += len(changes)
+            self.report["errors"].append(str(exc))
+            return self.report
+
+        def write(change: tuple[SourceRecord, bool, str]) -> str:
+            source, success, error = change
+            try:
+                self.client.update_source_fetch_status(source, fetched_at, success, error, supported)
+            except (SourceCollectorError, OSError, ValueError) as exc:
+                return f"{source.name}: {exc}"
+            return ""
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(changes)))) as executor:
+            failures = [failure for failure in executor.map(write, changes) if failure]
+        self.report["patches_sent"] += len(changes) - len(failures)
+        self.report["patches_failed"] += len(failures)
+        self.report["errors"].extend(failures)
+        return self.report
+
+    def flush_in_background(self) -> None:
+        self._thread = threading.Thread(target=self.flush, name="source-status-writer")
+        self._thread.start()
+
+    def wait(self) -> dict[str, Any]:
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        return self.report
 
 
 def notion_candidate_properties(candidate: dict[str, Any], supported_properties: set[str] | None = None) -> dict[str, Any]:
@@ -722,60 +2505,277 @@ def notion_candidate_properties(candidate: dict[str, Any], supported_properties:
     return properties
 
 
-def build_candidates(
+def shard_key(source: SourceRecord) -> str:
+    """Partition key: the source host, with every arXiv category source sharing one key.
+
+    Sources on one host stay in one shard, so per-host spacing, circuit breakers, and arXiv batching
+    behave exactly as in a single run.
+    """
+    return "arxiv" if arxiv_categories(source) else url_host(source.url)
+
+
+def source_shard(source: SourceRecord, shard_count: int) -> int:
+    digest = hashlib.sha256(shard_key(source).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % shard_count
+
+
+def merge_report_sections(sections: list[dict[str, Any]]) -> dict[str, Any]:
+    """Combine the run-level report sections of several shards: counters add, open hosts join, the deadline keeps the least time left.
+
+    Each shard ran with its share of the run's fetch budget, so the shares add back up to the run-wide budget.
+    """
+    merged: dict[str, Any] = {}
+    for section in sections:
+        for name, value in section.items():
+            if name not in merged:
+                merged[name] = json.loads(json.dumps(value))
+            elif name == "open_circuit_hosts":
+                merged[name] = sorted(set(merged[name]) | set(value))
+            elif name == "deadline":
+                merged[name]["remaining_seconds"] = min(merged[name]["remaining_seconds"], value["remaining_seconds"])
+            else:
+                for key, count in value.items():
+                    if key == "fetch_budget":
+                        merged[name][key] = None if count is None or merged[name][key] is None else merged[name][key] + count
+                    else:
+                        merged[name][key] += count
+    return merged
+
+
+@dataclass
+class CollectedCandidates:
+    """Per-source results and undeduplicated candidates of one collection pass, in source registry order.
+
+    `source_indices` are registry positions, so the passes of several shards can be merged back into
+    registry order. `sections` holds the run-level report parts (arXiv batch, schedule, circuits, deadline).
+    """
+
+    sources_seen: int
+    source_indices: list[int]
+    source_results: list[dict[str, Any]]
+    source_candidates: list[list[dict[str, Any]]]
+    sections: dict[str, Any]
+    # Kept in memory only, for the adaptive schedule of the run that fetched the sources.
+    fetched: list[tuple[SourceRecord, int, list[dict[str, Any]]]]
+    decisions: list[tuple[SourceRecord, dict[str, Any]]]
+
+    def shard_report(self, shard_index: int, shard_count: int) -> dict[str, Any]:
+        return {
+            "collector_version": "source_collector_v1",
+            "shard_report_version": SHARD_REPORT_VERSION,
+            "shard": {"index": shard_index, "count": shard_count},
+            "sources_seen": self.sources_seen,
+            "source_indices": self.source_indices,
+            "source_results": self.source_results,
+            "source_candidates": self.source_candidates,
+            "sections": self.sections,
+        }
+
+    @classmethod
+    def from_shard_reports(cls, reports: list[dict[str, Any]]) -> "CollectedCandidates":
+        """Merge shard reports back into registry order; every shard of one run must be present exactly once."""
+        if not reports:
+            raise SourceCollectorError("no shard reports to merge")
+        for report in reports:
+            if not isinstance(report, dict) or report.get("shard_report_version") != SHARD_REPORT_VERSION:
+                raise SourceCollectorError("not a collector shard report")
+        shard_count = reports[0]["shard"]["count"]
+        sources_seen = reports[0]["sources_seen"]
+        indices = sorted(report["shard"]["index"] for report in reports)
+        if indices != list(range(shard_count)) or any(
+            report["shard"]["count"] != shard_count or report["sources_seen"] != sources_seen for report in reports
+        ):
+            raise SourceCollectorError(f"shard reports must cover shards 0..{shard_count - 1} of one run exactly once")
+        entries = sorted(
+            (index, result, candidates)
+            for report in reports
+            for index, result, candidates in zip(report["source_indices"], report["source_results"], report["source_candidates"])
+        )
+        if [index for index, _, _ in entries] != list(range(sources_seen)):
+            raise SourceCollectorError("shard reports do not cover every source exactly once")
+        return cls(
+            sources_seen=sources_seen,
+            source_indices=[index for index, _, _ in entries],
+            source_results=[result for _, result, _ in entries],
+            source_candidates=[candidates for _, _, candidates in entries],
+            sections=merge_report_sections([report["sections"] for report in reports]),
+            fetched=[],
+            decisions=[],
+        )
+
+
+def source_result_from_outcome(source: SourceRecord, collected: CollectedSourceItems | SourceCollectorError, watermarks: FeedWatermarks | None) -> dict[str, Any]:
+    if isinstance(collected, SourceCircuitOpen):
+        return {
+            "source": source.name,
+            "source_url": source.url,
+            "status": "skipped",
+            "reason": "circuit_open",
+            "circuit_open_hosts": collected.hosts,
+            "circuit_open_until": collected.open_until,
+            "raw_items_seen": 0,
+            "candidates_built": 0,
+        }
+    if isinstance(collected, SourceDeadlineDeferred):
+        return {
+            "source": source.name,
+            "source_url": source.url,
+            "status": "deferred_deadline",
+            "deadline_remaining_seconds": collected.remaining_seconds,
+            "expected_seconds": collected.expected_seconds,
+            "raw_items_seen": 0,
+            "candidates_built": 0,
+        }
+    if isinstance(collected, SourceCollectorError):
+        return {
+            "source": source.name,
+            "source_url": source.url,
+            "status": "error",
+            "error": str(collected),
+            "raw_items_seen": 0,
+            "candidates_built": 0,
+        }
+    result = {
+        "source": source.name,
+        "source_url": source.url,
+        "status": "not_modified" if collected.not_modified_reason else "collected",
+        "fetched_url": collected.fetched_url,
+        "raw_items_seen": len(collected.items),
+        "items": len(collected.items),
+        "candidates_built": len(collected.items),
+    }
+    if collected.wire_bytes is not None:
+        result["wire_bytes"] = collected.wire_bytes
+        result["decoded_bytes"] = collected.decoded_bytes
+    if collected.not_modified_reason:
+        result["not_modified_reason"] = collected.not_modified_reason
+        result["bytes_not_downloaded"] = collected.bytes_not_downloaded
+    if collected.fallback_used:
+        result["fallback_used"] = True
+        result["fallback_reason"] = collected.fallback_reason
+        result["recommended_source_url"] = collected.fetched_url
+    if collected.primary_probe_skipped:
+        result["primary_probe_skipped"] = True
+    if collected.head_only:
+        result["html_head_only"] = True
+    if collected.discovered_feed_url:
+        result["discovered_feed_url"] = collected.discovered_feed_url
+    if collected.feed_promoted:
+        result["feed_promoted"] = True
+        result["recommended_source_url"] = collected.fetched_url
+    if collected.arxiv_batched:
+        result["arxiv_batched"] = True
+    if collected.fetch_seconds is not None:
+        result["fetch_seconds"] = collected.fetch_seconds
+    if watermarks is not None:
+        result["watermark_pruned"] = collected.watermark_pruned
+    return result
+
+
+def collect_candidates(
     source_records: list[dict[str, Any]],
-    existing_signal_intake: list[dict[str, Any]],
     fetch: FetchTransport = fetch_url,
-) -> dict[str, Any]:
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    endpoint_health: EndpointHealth | None = None,
+    watermarks: FeedWatermarks | None = None,
+    scheduler: FetchScheduler | None = None,
+    fetch_budget: int | None = None,
+    arxiv_batch: ArxivBatch | None = None,
+    circuits: HostCircuitBreaker | None = None,
+    latency: SourceLatency | None = None,
+    deadline: RunDeadline | None = None,
+    shard: tuple[int, int] | None = None,
+) -> CollectedCandidates:
+    """Fetch due sources and build their candidates without deduplicating; with `shard`, only that (index, count) partition."""
+    indices = list(range(len(source_records)))
     sources = [source_from_record(record) for record in source_records]
-    collected_candidates: list[dict[str, Any]] = []
-    source_results: list[dict[str, Any]] = []
-    for source in sources:
-        if not eligible_source(source):
-            source_results.append(
-                {
-                    "source": source.name,
-                    "source_url": source.url,
-                    "status": "skipped",
-                    "reason": skip_source_reason(source),
-                    "raw_items_seen": 0,
-                    "candidates_built": 0,
-                }
-            )
-            continue
-        try:
-            collected = collect_source_items(source, fetch=fetch)
-            candidates = [candidate_from_item(item) for item in collected.items]
-            collected_candidates.extend(candidates)
+    if shard is not None:
+        shard_index, shard_count = shard
+        indices = [index for index in indices if source_shard(sources[index], shard_count) == shard_index]
+        sources = [sources[index] for index in indices]
+    if scheduler is not None:
+        collectable = [collectable_source(source) for source in sources]
+        planned = iter(scheduler.plan([source for source, ok in zip(sources, collectable) if ok], fetch_budget))
+        decisions = [next(planned) if ok else None for ok in collectable]
+        eligible = [bool(decision and decision["due"]) for decision in decisions]
+    else:
+        decisions = [None] * len(sources)
+        eligible = [eligible_source(source) for source in sources]
+    due_sources = [source for source, is_eligible in zip(sources, eligible) if is_eligible]
+    batched = [arxiv_batch is not None and bool(arxiv_categories(source)) for source in due_sources]
+    feed_outcomes = iter(
+        collect_sources(
+            [source for source, is_batched in zip(due_sources, batched) if not is_batched],
+            fetch=fetch,
+            max_concurrency=max_concurrency,
+            endpoint_health=endpoint_health,
+            watermarks=watermarks,
+            circuits=circuits,
+            latency=latency,
+            deadline=deadline,
+        )
+    )
+    sections: dict[str, Any] = {}
+    arxiv_outcomes: Any = iter(())
+    if arxiv_batch is not None:
+        batch_outcomes, sections["arxiv_batch"] = arxiv_batch.collect(
+            [source for source, is_batched in zip(due_sources, batched) if is_batched], fetch, deadline
+        )
+        arxiv_outcomes = iter(batch_outcomes)
+    outcomes = iter([next(arxiv_outcomes) if is_batched else next(feed_outcomes) for is_batched in batched])
+    collected = CollectedCandidates(len(source_records), indices, [], [], sections, [], [])
+    for source, is_eligible, decision in zip(sources, eligible, decisions):
+        if is_eligible:
+            outcome = next(outcomes)
+            result = source_result_from_outcome(source, outcome, watermarks)
+            candidates = [candidate_from_item(item) for item in outcome.items] if isinstance(outcome, CollectedSourceItems) else []
+            if isinstance(outcome, CollectedSourceItems):
+                collected.fetched.append((source, len(outcome.items), candidates))
+        else:
             result = {
                 "source": source.name,
                 "source_url": source.url,
-                "status": "collected",
-                "fetched_url": collected.fetched_url,
-                "raw_items_seen": len(collected.items),
-                "items": len(collected.items),
-                "candidates_built": len(candidates),
+                "status": "skipped",
+                "reason": skip_source_reason(source, decision),
+                "raw_items_seen": 0,
+                "candidates_built": 0,
             }
-            if collected.fallback_used:
-                result["fallback_used"] = True
-                result["fallback_reason"] = collected.fallback_reason
-                result["recommended_source_url"] = collected.fetched_url
-            source_results.append(result)
-        except SourceCollectorError as exc:
-            source_results.append(
-                {
-                    "source": source.name,
-                    "source_url": source.url,
-                    "status": "error",
-                    "error": str(exc),
-                    "raw_items_seen": 0,
-                    "candidates_built": 0,
-                }
-            )
-    deduped, duplicates_skipped, skipped_candidates, skipped_by_reason = dedupe_candidates(collected_candidates, existing_signal_intake)
+            candidates = []
+        if decision is not None:
+            result["schedule"] = decision
+            collected.decisions.append((source, decision))
+        collected.source_results.append(result)
+        collected.source_candidates.append(candidates)
+    if deadline is not None:
+        sections["deadline"] = {"deadline_seconds": deadline.seconds, "remaining_seconds": round(deadline.remaining(), 3)}
+    if circuits is not None:
+        sections["open_circuit_hosts"] = circuits.open_hosts()
+    if scheduler is not None:
+        reasons = [decision["reason"] for decision in decisions if decision is not None]
+        sections["schedule"] = {
+            "fetch_budget": fetch_budget,
+            "sources_due": sum(1 for is_eligible in eligible if is_eligible),
+            "sources_not_due": reasons.count("schedule_not_due"),
+            "sources_deferred_by_budget": reasons.count("fetch_budget_exhausted"),
+        }
+    return collected
+
+
+def finish_candidates(
+    collected: CollectedCandidates,
+    existing_signal_intake: list[dict[str, Any]],
+    known_keys: set[str] | None = None,
+    near_duplicates: NearDuplicateIndex | None = None,
+) -> dict[str, Any]:
+    """Deduplicate the collected candidates across all sources and build the run report."""
+    collected_candidates = [candidate for candidates in collected.source_candidates for candidate in candidates]
+    deduped, duplicates_skipped, skipped_candidates, skipped_by_reason = dedupe_candidates(
+        collected_candidates, existing_signal_intake, known_keys, near_duplicates
+    )
+    source_results = collected.source_results
     raw_items_seen = len(collected_candidates)
     new_candidates_created = len(deduped)
-    return {
+    report = {
         "collector_version": "source_collector_v1",
         "candidates": deduped,
         "candidate_count": new_candidates_created,
@@ -785,14 +2785,78 @@ def build_candidates(
         "freshness_diagnostic": freshness_diagnostic(raw_items_seen, new_candidates_created, duplicates_skipped),
         "skipped_candidates": skipped_candidates,
         "skipped_by_reason": skipped_by_reason,
-        "sources_seen": len(source_records),
+        "sources_seen": collected.sources_seen,
         "sources_fetched": sum(1 for item in source_results if item.get("status") == "collected"),
         "sources_failed": sum(1 for item in source_results if item.get("status") == "error"),
+        "sources_not_modified": sum(1 for item in source_results if item.get("status") == "not_modified"),
+        "bytes_not_downloaded": sum(int(item.get("bytes_not_downloaded") or 0) for item in source_results),
+        "wire_bytes": sum(int(item.get("wire_bytes") or 0) for item in source_results),
+        "decoded_bytes": sum(int(item.get("decoded_bytes") or 0) for item in source_results),
+        "watermark_pruned": sum(int(item.get("watermark_pruned") or 0) for item in source_results),
+        "feeds_discovered": sum(1 for item in source_results if item.get("discovered_feed_url")),
+        "feeds_promoted": sum(1 for item in source_results if item.get("feed_promoted")),
         "source_results": source_results,
         "openai_call_performed": OPENAI_CALL_PERFORMED,
         "source_page_body_scraping_performed": SOURCE_PAGE_BODY_SCRAPING_PERFORMED,
         "public_static_files_written": PUBLIC_STATIC_FILES_WRITTEN,
     }
+    sections = collected.sections
+    if "arxiv_batch" in sections:
+        report["arxiv_batch"] = sections["arxiv_batch"]
+    if "deadline" in sections:
+        report["sources_deferred_deadline"] = sum(1 for item in source_results if item.get("status") == "deferred_deadline")
+        report["deadline"] = sections["deadline"]
+    if "open_circuit_hosts" in sections:
+        report["sources_circuit_open"] = sum(1 for item in source_results if item.get("reason") == "circuit_open")
+        report["open_circuit_hosts"] = sections["open_circuit_hosts"]
+    if "schedule" in sections:
+        report["schedule"] = sections["schedule"]
+    return report
+
+
+def observe_schedule(scheduler: FetchScheduler, collected: CollectedCandidates, emitted: list[dict[str, Any]]) -> None:
+    """Fold each fetched source's items and emitted candidates into the schedule and refresh `next_due_at` in its result."""
+    emitted_ids = {id(candidate) for candidate in emitted}
+    for source, item_count, candidates in collected.fetched:
+        scheduler.observe(source, item_count, sum(1 for candidate in candidates if id(candidate) in emitted_ids))
+    for source, decision in collected.decisions:
+        if decision["due"]:
+            decision["next_due_at"] = scheduler.entries.get(source_state_key(source), {}).get("next_due_at", "")
+
+
+def build_candidates(
+    source_records: list[dict[str, Any]],
+    existing_signal_intake: list[dict[str, Any]],
+    fetch: FetchTransport = fetch_url,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    known_keys: set[str] | None = None,
+    near_duplicates: NearDuplicateIndex | None = None,
+    endpoint_health: EndpointHealth | None = None,
+    watermarks: FeedWatermarks | None = None,
+    scheduler: FetchScheduler | None = None,
+    fetch_budget: int | None = None,
+    arxiv_batch: ArxivBatch | None = None,
+    circuits: HostCircuitBreaker | None = None,
+    latency: SourceLatency | None = None,
+    deadline: RunDeadline | None = None,
+) -> dict[str, Any]:
+    collected = collect_candidates(
+        source_records,
+        fetch=fetch,
+        max_concurrency=max_concurrency,
+        endpoint_health=endpoint_health,
+        watermarks=watermarks,
+        scheduler=scheduler,
+        fetch_budget=fetch_budget,
+        arxiv_batch=arxiv_batch,
+        circuits=circuits,
+        latency=latency,
+        deadline=deadline,
+    )
+    report = finish_candidates(collected, existing_signal_intake, known_keys, near_duplicates)
+    if scheduler is not None:
+        observe_schedule(scheduler, collected, report["candidates"])
+    return report
 
 
 def load_json_records(path: pathlib.Path) -> list[dict[str, Any]]:
@@ -814,6 +2878,424 @@ def fixture_fetcher(mapping: dict[str, pathlib.Path]) -> FetchTransport:
     return fetch
 
 
+def run_notion_collection(
+    client: NotionClient,
+    fetch: FetchTransport,
+    state_dir: pathlib.Path | None = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    dry_run: bool = False,
+    reconcile_dedupe_index: bool = False,
+    endpoint_health: EndpointHealth | None = None,
+    watermarks: FeedWatermarks | None = None,
+    scheduler: FetchScheduler | None = None,
+    fetch_budget: int | None = None,
+    sources: list[dict[str, Any]] | None = None,
+    dedupe_index: DedupeIndex | None = None,
+    arxiv_batch: ArxivBatch | None = None,
+    circuits: HostCircuitBreaker | None = None,
+    latency: SourceLatency | None = None,
+    deadline: RunDeadline | None = None,
+    write_source_status: bool = False,
+) -> dict[str, Any]:
+    """Collect Notion-registered sources and, unless `dry_run`, write new candidates to Signal Intake.
+
+    `sources` and `dedupe_index` let a long-running caller pass its warm copies instead of re-reading them.
+    `deadline` bounds source fetching only; candidates already collected are still written when it runs out.
+    With `write_source_status`, changed source fetch statuses are written in the background meanwhile.
+    """
+    if sources is None:
+        sources = client.list_sources()
+    collected = collect_candidates(
+        sources,
+        fetch=fetch,
+        max_concurrency=max_concurrency,
+        endpoint_health=endpoint_health,
+        watermarks=watermarks,
+        scheduler=scheduler,
+        fetch_budget=fetch_budget,
+        arxiv_batch=arxiv_batch,
+        circuits=circuits,
+        latency=latency,
+        deadline=deadline,
+    )
+    status_writer: SourceStatusWriter | None = None
+    if write_source_status and not dry_run:
+        status_writer = SourceStatusWriter(client)
+        status_writer.record_collection(sources, collected)
+        status_writer.flush_in_background()
+    try:
+        result = finish_notion_collection(
+            client,
+            collected,
+            state_dir=state_dir,
+            dry_run=dry_run,
+            reconcile_dedupe_index=reconcile_dedupe_index,
+            dedupe_index=dedupe_index,
+            scheduler=scheduler,
+        )
+    finally:
+        status_report = status_writer.wait() if status_writer is not None else None
+    if status_report is not None:
+        result["source_status_writes"] = status_report
+        result["notion_transport"] = notion_transport_stats(client.transport)
+    return result
+
+
+def finish_notion_collection(
+    client: NotionClient,
+    collected: CollectedCandidates,
+    state_dir: pathlib.Path | None = None,
+    dry_run: bool = False,
+    reconcile_dedupe_index: bool = False,
+    dedupe_index: DedupeIndex | None = None,
+    scheduler: FetchScheduler | None = None,
+) -> dict[str, Any]:
+    """Deduplicate collected candidates against Signal Intake and, unless `dry_run`, write the new ones."""
+    existing: list[dict[str, Any]] = []
+    known_keys: set[str] | None = None
+    near_duplicates: NearDuplicateIndex | None = None
+    if dedupe_index is None and state_dir:
+        dedupe_index = DedupeIndex.load(state_dir / DEDUPE_INDEX_FILENAME)
+    if dedupe_index is not None:
+        dedupe_report = dedupe_index.sync(client, reconcile=reconcile_dedupe_index)
+        known_keys = dedupe_index.keys
+        near_duplicates = dedupe_index.near_duplicates
+    else:
+        existing = client.list_signal_intake()
+        dedupe_report = {"mode": "full", "rows_read": len(existing), "keys": len(existing_keys(existing))}
+    result = finish_candidates(collected, existing, known_keys, near_duplicates)
+    if scheduler is not None:
+        observe_schedule(scheduler, collected, result["candidates"])
+    result["dedupe_index"] = dedupe_report
+    if not dry_run:
+        writes = client.create_signal_intake_rows(result["candidates"])
+        result["signal_intake_writes"] = writes
+        result["signal_intake_rows_created"] = sum(1 for item in writes if item["status"] == "created")
+        result["signal_intake_rows_failed"] = sum(1 for item in writes if item["status"] == "error")
+        if dedupe_index is not None and state_dir:
+            dedupe_index.add_candidates(
+                [candidate for candidate, write in zip(result["candidates"], writes) if write["status"] == "created"]
+            )
+            dedupe_index.save(state_dir / DEDUPE_INDEX_FILENAME)
+    result["notion_transport"] = notion_transport_stats(client.transport)
+    return result
+
+
+def source_fetcher(
+    pool: HostConnectionPool,
+    http_cache: HttpValidatorCache | None = None,
+    fetch_map: dict[str, pathlib.Path] | None = None,
+) -> FetchTransport:
+    if http_cache is not None:
+        return conditional_fetcher(http_cache, plain_response_fetcher(fixture_fetcher(fetch_map)) if fetch_map else pool.fetch_response)
+    return fixture_fetcher(fetch_map) if fetch_map else pool.fetch_url
+
+
+class CollectorState:
+    """Collector state kept in `--state-dir` between runs."""
+
+    def __init__(
+        self,
+        state_dir: pathlib.Path,
+        adaptive_schedule: bool = False,
+        arxiv_batch: bool = False,
+        circuit_failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+    ):
+        self.state_dir = state_dir
+        self.adaptive_schedule = adaptive_schedule
+        self.use_arxiv_batch = arxiv_batch
+        self.endpoint_health = EndpointHealth.load(state_dir / ENDPOINT_HEALTH_FILENAME)
+        self.circuits = HostCircuitBreaker.load(state_dir / CIRCUITS_FILENAME, circuit_failure_threshold)
+        self.latency = SourceLatency.load(state_dir / LATENCY_FILENAME)
+        self.reload()
+
+    def reload(self) -> None:
+        """Reload the state that may only advance once every candidate of a run was written."""
+        self.http_cache = HttpValidatorCache.load(self.state_dir / HTTP_CACHE_FILENAME)
+        self.watermarks = FeedWatermarks.load(self.state_dir / WATERMARKS_FILENAME)
+        self.scheduler = FetchScheduler.load(self.state_dir / SCHEDULE_FILENAME) if self.adaptive_schedule else None
+        self.arxiv_batch = ArxivBatch.load(self.state_dir / ARXIV_OFFSETS_FILENAME) if self.use_arxiv_batch else None
+
+    def save(self, items_committed: bool) -> None:
+        self.endpoint_health.save(self.state_dir / ENDPOINT_HEALTH_FILENAME)
+        self.circuits.save(self.state_dir / CIRCUITS_FILENAME)
+        self.latency.save(self.state_dir / LATENCY_FILENAME)
+        # Failed rows must be refetched next run, so validators, watermarks, the schedule, and arXiv offsets are kept only when every write landed.
+        if items_committed:
+            self.http_cache.save(self.state_dir / HTTP_CACHE_FILENAME)
+            self.watermarks.save(self.state_dir / WATERMARKS_FILENAME)
+            if self.scheduler is not None:
+                self.scheduler.save(self.state_dir / SCHEDULE_FILENAME)
+            if self.arxiv_batch is not None:
+                self.arxiv_batch.save(self.state_dir / ARXIV_OFFSETS_FILENAME)
+
+    def committed_entries(self) -> dict[str, dict[str, Any]]:
+        """Copy the entries of the state that only advances once a run's candidates are written."""
+        parts = {"http_cache": self.http_cache, "watermarks": self.watermarks, "schedule": self.scheduler, "arxiv_offsets": self.arxiv_batch}
+        return {name: json.loads(json.dumps(part.entries)) for name, part in parts.items() if part is not None}
+
+
+# Commit-gated state files a shard run leaves pending for the merge: report name -> (state class, state file).
+PENDING_STATE_PARTS: dict[str, tuple[Any, str]] = {
+    "http_cache": (HttpValidatorCache, HTTP_CACHE_FILENAME),
+    "watermarks": (FeedWatermarks, WATERMARKS_FILENAME),
+    "schedule": (FetchScheduler, SCHEDULE_FILENAME),
+    "arxiv_offsets": (ArxivBatch, ARXIV_OFFSETS_FILENAME),
+}
+
+
+def shard_state_path(report_path: pathlib.Path) -> pathlib.Path:
+    return report_path.with_name(f"{report_path.stem}.state.json")
+
+
+def pending_shard_state(state: CollectorState, before: dict[str, dict[str, Any]], collected: CollectedCandidates) -> dict[str, Any]:
+    """Describe how a shard run would advance the commit-gated state, for the merge to apply after its writes.
+
+    Holds the changed validator, watermark, schedule, and arXiv offset entries, plus one schedule
+    observation per fetched source; its yield depends on which candidates survive the global dedupe.
+    """
+    positions = {id(candidates): position for position, candidates in enumerate(collected.source_candidates)}
+    return {
+        "shard_state_version": SHARD_STATE_VERSION,
+        "entries": {
+            name: {key: entry for key, entry in entries.items() if before.get(name, {}).get(key) != entry}
+            for name, entries in state.committed_entries().items()
+        },
+        "schedule_observations": [
+            {"source_index": collected.source_indices[positions[id(candidates)]], "source": asdict(source), "fresh_items": fresh_items}
+            for source, fresh_items, candidates in collected.fetched
+        ]
+        if state.scheduler is not None
+        else [],
+    }
+
+
+def apply_shard_states(
+    state_dir: pathlib.Path, pending_states: list[dict[str, Any]], collected: CollectedCandidates, emitted: list[dict[str, Any]]
+) -> dict[str, int]:
+    """Fold the shards' pending state into `state_dir`; call only once every merged candidate was written."""
+    applied: dict[str, int] = {}
+    for name, (state_class, filename) in PENDING_STATE_PARTS.items():
+        entries = {key: entry for pending in pending_states for key, entry in pending["entries"].get(name, {}).items()}
+        observations = [observation for pending in pending_states for observation in pending["schedule_observations"]] if name == "schedule" else []
+        if not entries and not observations:
+            continue
+        part = state_class.load(state_dir / filename)
+        part.entries.update(entries)
+        if observations:
+            # Merged candidates are in registry order, so a source's candidates sit at its registry index.
+            collected.fetched = [
+                (SourceRecord(**observation["source"]), int(observation["fresh_items"]), collected.source_candidates[int(observation["source_index"])])
+                for observation in observations
+            ]
+            observe_schedule(part, collected, emitted)
+        part.save(state_dir / filename)
+        applied[name] = len(entries) + len(observations)
+    return applied
+
+
+def load_shard_states(report_paths: list[pathlib.Path]) -> list[dict[str, Any]]:
+    states = []
+    for report_path in report_paths:
+        path = shard_state_path(report_path)
+        if not path.exists():
+            continue
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict) or data.get("shard_state_version") != SHARD_STATE_VERSION:
+            raise SourceCollectorError(f"{path} is not a collector shard state file")
+        states.append(data)
+    return states
+
+
+class SourceRegistry:
+    """Warm copy of the Notion Sources database, refreshed incrementally by `last_edited_time`."""
+
+    def __init__(self) -> None:
+        self.records: dict[str, dict[str, Any]] = {}
+        self.synced_through = ""
+
+    def refresh(self, client: NotionClient, full: bool = False) -> dict[str, Any]:
+        if full or not self.synced_through:
+            # Archived sources drop out of Notion queries, so only a full read removes them.
+            records = client.list_sources()
+            self.records = {}
+            self.synced_through = ""
+            mode = "full"
+        else:
+            records = client.list_sources(edited_since=self.synced_through)
+            mode = "incremental"
+        for record in records:
+            self.records[normalize_text(record.get("_notion_page_id")) or normalize_text(field(record, "URL", "url"))] = record
+        self.synced_through = max([self.synced_through, *(normalize_text(record.get("_last_edited_time")) for record in records)])
+        return {"mode": mode, "rows_read": len(records), "sources": len(self.records), "synced_through": self.synced_through}
+
+    def sources(self) -> list[dict[str, Any]]:
+        return list(self.records.values())
+
+
+def write_heartbeat(path: pathlib.Path, payload: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f"{path.name}.tmp")
+    temporary.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(temporary, path)
+
+
+class CollectorDaemon:
+    """Long-running collector that keeps the source registry, dedupe index, HTTP pool, and state warm between cycles.
+
+    Each cycle refreshes Notion incrementally, collects the sources the adaptive schedule marks due,
+    writes candidates, and saves state. Between cycles it sleeps until the next source is due.
+    """
+
+    def __init__(
+        self,
+        client: NotionClient,
+        pool: HostConnectionPool,
+        state: CollectorState,
+        heartbeat_path: pathlib.Path | None = None,
+        output_path: pathlib.Path | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        fetch_budget: int | None = None,
+        dry_run: bool = False,
+        reconcile_dedupe_index: bool = False,
+        tick_seconds: float = DAEMON_TICK_SECONDS,
+        min_sleep_seconds: float = DAEMON_MIN_SLEEP_SECONDS,
+        full_refresh_seconds: float = DAEMON_SOURCE_FULL_REFRESH_SECONDS,
+        deadline_seconds: float | None = None,
+        write_source_status: bool = False,
+        clock: Callable[[], float] = time.time,
+    ):
+        if state.scheduler is None:
+            raise SourceCollectorError("daemon mode requires an adaptive schedule")
+        self.client = client
+        self.pool = pool
+        self.state = state
+        self.heartbeat_path = heartbeat_path
+        self.output_path = output_path
+        self.max_concurrency = max_concurrency
+        self.fetch_budget = fetch_budget
+        self.dry_run = dry_run
+        self.reconcile_dedupe_index = reconcile_dedupe_index
+        self.tick_seconds = tick_seconds
+        self.min_sleep_seconds = min_sleep_seconds
+        self.full_refresh_seconds = full_refresh_seconds
+        self.deadline_seconds = deadline_seconds
+        self.write_source_status = write_source_status
+        self.clock = clock
+        self.registry = SourceRegistry()
+        self.dedupe_index = DedupeIndex.load(state.state_dir / DEDUPE_INDEX_FILENAME)
+        self.stop_event = threading.Event()
+        self.cycles = 0
+        self.last_full_refresh: float | None = None
+        self.last_cycle: dict[str, Any] = {}
+
+    def stop(self, *_args: Any) -> None:
+        """Request a graceful stop after the current cycle; usable as a signal handler."""
+        self.stop_event.set()
+
+    def run_cycle(self) -> dict[str, Any]:
+        deadline = RunDeadline(self.deadline_seconds) if self.deadline_seconds is not None else None
+        now = self.clock()
+        full_refresh = self.last_full_refresh is None or now - self.last_full_refresh >= self.full_refresh_seconds
+        registry_report = self.registry.refresh(self.client, full=full_refresh)
+        if full_refresh:
+            self.last_full_refresh = now
+        spacing_wait_before = self.pool.spacing_wait_seconds
+        try:
+            result = run_notion_collection(
+                self.client,
+                source_fetcher(self.pool, self.state.http_cache),
+                state_dir=self.state.state_dir,
+                max_concurrency=self.max_concurrency,
+                dry_run=self.dry_run,
+                reconcile_dedupe_index=self.reconcile_dedupe_index and self.cycles == 0,
+                endpoint_health=self.state.endpoint_health,
+                watermarks=self.state.watermarks,
+                scheduler=self.state.scheduler,
+                fetch_budget=self.fetch_budget,
+                sources=self.registry.sources(),
+                dedupe_index=self.dedupe_index,
+                arxiv_batch=self.state.arxiv_batch,
+                circuits=self.state.circuits,
+                latency=self.state.latency,
+                deadline=deadline,
+                write_source_status=self.write_source_status,
+            )
+        except Exception:
+            # Collection already advanced validators, watermarks, and the schedule in memory; nothing was written, so undo that.
+            self.state.reload()
+            raise
+        result["source_registry"] = registry_report
+        result["host_spacing_wait_seconds"] = round(self.pool.spacing_wait_seconds - spacing_wait_before, 3)
+        self.state.save(items_committed=not self.dry_run and not result.get("signal_intake_rows_failed"))
+        if result.get("signal_intake_rows_failed"):
+            # Roll the in-memory validators, watermarks, and schedule back so unwritten items are collected again.
+            self.state.reload()
+        if self.output_path:
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            self.output_path.write_text(json.dumps(result, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        return result
+
+    def seconds_until_next_wake(self) -> float:
+        """Sleep until the earliest next-due source, between `min_sleep_seconds` and `tick_seconds`."""
+        scheduler = self.state.scheduler
+        now = dt.datetime.fromtimestamp(self.clock(), dt.timezone.utc)
+        wait = self.tick_seconds
+        for record in self.registry.sources():
+            source = source_from_record(record)
+            if not collectable_source(source) or scheduler is None:
+                continue
+            entry = scheduler.entries.get(source_state_key(source))
+            try:
+                next_due = dt.datetime.fromisoformat(str((entry or {}).get("next_due_at", "")).replace("Z", "+00:00"))
+            except ValueError:
+                continue
+            wait = min(wait, (next_due - now).total_seconds())
+        return max(self.min_sleep_seconds, wait)
+
+    def heartbeat(self, status: str, next_wake_seconds: float | None = None) -> None:
+        if not self.heartbeat_path:
+            return
+        write_heartbeat(
+            self.heartbeat_path,
+            {
+                "status": status,
+                "pid": os.getpid(),
+                "updated_at": iso_timestamp(dt.datetime.fromtimestamp(self.clock(), dt.timezone.utc)),
+                "cycles": self.cycles,
+                "last_cycle": self.last_cycle,
+                "next_wake_seconds": next_wake_seconds,
+            },
+        )
+
+    def run(self, max_cycles: int | None = None) -> int:
+        self.heartbeat("starting")
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    result = self.run_cycle()
+                    self.last_cycle = {
+                        "candidates": result["candidate_count"],
+                        "sources_fetched": result["sources_fetched"],
+                        "sources_failed": result["sources_failed"],
+                        "signal_intake_rows_created": result.get("signal_intake_rows_created", 0),
+                        "signal_intake_rows_failed": result.get("signal_intake_rows_failed", 0),
+                    }
+                    print(f"[source-collector-v1] daemon cycle {self.cycles + 1}: {json.dumps(self.last_cycle, sort_keys=True)}")
+                except (OSError, json.JSONDecodeError, SourceCollectorError) as exc:
+                    self.last_cycle = {"error": str(exc)}
+                    print(f"[source-collector-v1] daemon cycle {self.cycles + 1} failed: {exc}", file=sys.stderr)
+                self.cycles += 1
+                if max_cycles is not None and self.cycles >= max_cycles:
+                    break
+                wait = self.seconds_until_next_wake()
+                self.heartbeat("running", wait)
+                self.stop_event.wait(wait)
+        finally:
+            self.heartbeat("stopped")
+        return 0
+
+
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Collect DysonX source metadata into Signal Intake candidates.")
     parser.add_argument("--sources-fixture", help="Offline source registry fixture JSON.")
@@ -821,55 +3303,289 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--fetch-fixture-map", help="JSON object mapping source URL to local fixture path.")
     parser.add_argument("--output-candidates", help="Optional offline candidate report path.")
     parser.add_argument("--dry-run", action="store_true", help="Do not write Notion rows.")
+    parser.add_argument(
+        "--state-dir",
+        help="Optional directory for collector state persisted between runs, such as the HTTP validator cache.",
+    )
+    parser.add_argument(
+        "--reconcile-dedupe-index",
+        action="store_true",
+        help="Rebuild the persisted dedupe index from a full Signal Intake read instead of an incremental refresh.",
+    )
+    parser.add_argument(
+        "--adaptive-schedule",
+        action="store_true",
+        help="Schedule sources from their observed arrival rate and yield, kept in --state-dir, instead of Fetch Frequency alone.",
+    )
+    parser.add_argument(
+        "--fetch-budget",
+        type=int,
+        default=None,
+        help="With --adaptive-schedule, fetch at most this many due sources per run, highest priority first; shard runs split it evenly.",
+    )
+    parser.add_argument(
+        "--arxiv-batch",
+        action="store_true",
+        help="Collect arXiv category sources through batched export-API queries, with offsets kept in --state-dir.",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run continuously with warm Notion, dedupe, and HTTP state, collecting sources as the adaptive schedule makes them due.",
+    )
+    parser.add_argument("--heartbeat-file", help="With --daemon, JSON file rewritten after every cycle for health checks.")
+    parser.add_argument(
+        "--daemon-tick-seconds",
+        type=float,
+        default=DAEMON_TICK_SECONDS,
+        help="With --daemon, the longest sleep between cycles.",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help="Maximum number of sources fetched in parallel. Defaults to serial collection.",
+    )
+    parser.add_argument(
+        "--max-connections-per-host",
+        type=int,
+        default=DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        help="Maximum number of open keep-alive connections per source host.",
+    )
+    parser.add_argument(
+        "--host-min-interval-seconds",
+        type=float,
+        default=DEFAULT_HOST_MIN_INTERVAL_SECONDS,
+        help="Minimum spacing between the starts of two requests to the same source host.",
+    )
+    parser.add_argument(
+        "--circuit-failure-threshold",
+        type=int,
+        default=CIRCUIT_FAILURE_THRESHOLD,
+        help="Consecutive failed fetches after which a host's circuit opens; with --state-dir it stays open across runs.",
+    )
+    parser.add_argument(
+        "--write-source-status",
+        action="store_true",
+        help="Write changed Last Fetched At / Last Success At / Last Error values back to the Sources database after a live run.",
+    )
+    parser.add_argument(
+        "--shard-index",
+        type=int,
+        default=None,
+        help="Collect only this shard (0-based) of a --shard-count split and write a shard report instead of Signal Intake rows.",
+    )
+    parser.add_argument("--shard-count", type=int, default=None, help="Number of shards the source registry is split into.")
+    parser.add_argument(
+        "--merge-shards",
+        nargs="+",
+        metavar="SHARD_REPORT",
+        help="Merge shard reports, deduplicate globally, and write Signal Intake rows (or use --existing-signal-intake-fixture offline).",
+    )
+    parser.add_argument(
+        "--deadline-seconds",
+        type=float,
+        default=None,
+        help="Wall-clock budget for source fetching; sources that no longer fit are deferred and collected candidates are still written. Each shard run gets the full budget.",
+    )
     return parser.parse_args(argv)
 
 
+def notion_client_from_env() -> NotionClient:
+    missing = [name for name in (NOTION_TOKEN_ENV, SOURCES_DATABASE_ENV, SIGNAL_INTAKE_DATABASE_ENV) if not os.environ.get(name)]
+    if missing:
+        raise SourceCollectorError(f"Missing required environment variables: {', '.join(missing)}")
+    return NotionClient(
+        token=os.environ[NOTION_TOKEN_ENV],
+        sources_database_id=os.environ[SOURCES_DATABASE_ENV],
+        signal_intake_database_id=os.environ[SIGNAL_INTAKE_DATABASE_ENV],
+    )
+
+
+def run_daemon(args: argparse.Namespace, pool: HostConnectionPool) -> int:
+    if not args.state_dir:
+        raise SourceCollectorError("--daemon requires --state-dir")
+    if args.sources_fixture:
+        raise SourceCollectorError("--daemon collects live Notion sources and cannot use fixtures")
+    daemon = CollectorDaemon(
+        notion_client_from_env(),
+        pool,
+        CollectorState(
+            pathlib.Path(args.state_dir),
+            adaptive_schedule=True,
+            arxiv_batch=args.arxiv_batch,
+            circuit_failure_threshold=args.circuit_failure_threshold,
+        ),
+        heartbeat_path=pathlib.Path(args.heartbeat_file) if args.heartbeat_file else None,
+        output_path=pathlib.Path(args.output_candidates) if args.output_candidates else None,
+        max_concurrency=args.max_concurrency,
+        fetch_budget=args.fetch_budget,
+        dry_run=args.dry_run,
+        reconcile_dedupe_index=args.reconcile_dedupe_index,
+        tick_seconds=args.daemon_tick_seconds,
+        deadline_seconds=args.deadline_seconds,
+        write_source_status=args.write_source_status,
+    )
+    signal.signal(signal.SIGTERM, daemon.stop)
+    signal.signal(signal.SIGINT, daemon.stop)
+    return daemon.run()
+
+
+def validate_shard_args(args: argparse.Namespace) -> None:
+    if (args.shard_index is None) != (args.shard_count is None):
+        raise SourceCollectorError("--shard-index and --shard-count must be given together")
+    if args.shard_count is not None:
+        if args.shard_count < 1 or not 0 <= args.shard_index < args.shard_count:
+            raise SourceCollectorError("--shard-index must be between 0 and --shard-count - 1")
+        if not args.output_candidates:
+            raise SourceCollectorError("a shard run requires --output-candidates for its shard report")
+    if args.merge_shards and args.shard_count is not None:
+        raise SourceCollectorError("--merge-shards cannot be combined with --shard-index/--shard-count")
+    if args.daemon and (args.merge_shards or args.shard_count is not None):
+        raise SourceCollectorError("--daemon cannot run shards or merge shard reports")
+
+
+def merge_shards(args: argparse.Namespace) -> dict[str, Any]:
+    """Merge shard reports and deduplicate globally, offline against a fixture or against Signal Intake.
+
+    Once every candidate is written, the shards' pending state files are applied to `--state-dir` and removed.
+    """
+    report_paths = [pathlib.Path(path) for path in args.merge_shards]
+    reports = [json.loads(path.read_text(encoding="utf-8")) for path in report_paths]
+    collected = CollectedCandidates.from_shard_reports(reports)
+    pending_states = load_shard_states(report_paths)
+    state_dir = pathlib.Path(args.state_dir) if args.state_dir else None
+    if args.existing_signal_intake_fixture:
+        result = finish_candidates(collected, load_json_records(pathlib.Path(args.existing_signal_intake_fixture)))
+    else:
+        result = finish_notion_collection(
+            notion_client_from_env(),
+            collected,
+            state_dir=state_dir,
+            dry_run=args.dry_run,
+            reconcile_dedupe_index=args.reconcile_dedupe_index,
+        )
+    if pending_states:
+        committed = state_dir is not None and not args.dry_run and not result.get("signal_intake_rows_failed")
+        applied = apply_shard_states(state_dir, pending_states, collected, result["candidates"]) if committed else {}
+        if committed:
+            for report_path in report_paths:
+                shard_state_path(report_path).unlink(missing_ok=True)
+        result["shard_state"] = {"shards_pending": len(pending_states), "applied": committed, "entries_applied": applied}
+    return result
+
+
+def shard_fetch_budget(fetch_budget: int | None, shard_index: int, shard_count: int) -> int | None:
+    """Split a run-wide `--fetch-budget` across shards so the shards together fetch at most the budget."""
+    if fetch_budget is None:
+        return None
+    share, remainder = divmod(max(fetch_budget, 0), shard_count)
+    return share + (1 if shard_index < remainder else 0)
+
+
+def write_json_report(path: pathlib.Path, report: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
 def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv)
+    pool: HostConnectionPool | None = None
     try:
-        if args.sources_fixture:
-            sources = load_json_records(pathlib.Path(args.sources_fixture))
-            existing = load_json_records(pathlib.Path(args.existing_signal_intake_fixture)) if args.existing_signal_intake_fixture else []
+        validate_shard_args(args)
+        deadline = RunDeadline(args.deadline_seconds) if args.deadline_seconds is not None else None
+        pool = HostConnectionPool(
+            max_connections_per_host=args.max_connections_per_host,
+            min_request_interval_seconds=args.host_min_interval_seconds,
+        )
+        if args.daemon:
+            return run_daemon(args, pool)
+        if args.adaptive_schedule and not args.state_dir:
+            raise SourceCollectorError("--adaptive-schedule requires --state-dir")
+        state = None
+        if args.merge_shards:
+            result = merge_shards(args)
+        else:
+            if args.state_dir:
+                state = CollectorState(pathlib.Path(args.state_dir), args.adaptive_schedule, args.arxiv_batch, args.circuit_failure_threshold)
+            http_cache = state.http_cache if state else None
+            collection_state = {
+                "endpoint_health": state.endpoint_health if state else None,
+                "watermarks": state.watermarks if state else None,
+                "scheduler": state.scheduler if state else None,
+                "fetch_budget": args.fetch_budget,
+                "arxiv_batch": state.arxiv_batch if state else (ArxivBatch() if args.arxiv_batch else None),
+                "circuits": state.circuits if state else None,
+                "latency": state.latency if state else None,
+                "deadline": deadline,
+            }
             fetch_map = {}
             if args.fetch_fixture_map:
                 raw_map = json.loads(pathlib.Path(args.fetch_fixture_map).read_text(encoding="utf-8"))
                 fetch_map = {url: pathlib.Path(path) for url, path in raw_map.items()}
-            result = build_candidates(sources, existing, fetch=fixture_fetcher(fetch_map) if fetch_map else fetch_url)
-        else:
-            missing = [
-                name
-                for name in (NOTION_TOKEN_ENV, SOURCES_DATABASE_ENV, SIGNAL_INTAKE_DATABASE_ENV)
-                if not os.environ.get(name)
-            ]
-            if missing:
-                raise SourceCollectorError(f"Missing required environment variables: {', '.join(missing)}")
-            client = NotionClient(
-                token=os.environ[NOTION_TOKEN_ENV],
-                sources_database_id=os.environ[SOURCES_DATABASE_ENV],
-                signal_intake_database_id=os.environ[SIGNAL_INTAKE_DATABASE_ENV],
-            )
-            sources = client.list_sources()
-            existing = client.list_signal_intake()
-            result = build_candidates(sources, existing)
-            if not args.dry_run:
-                for candidate in result["candidates"]:
-                    client.create_signal_intake_row(candidate)
+            fetch = source_fetcher(pool, http_cache, fetch_map)
+            if args.shard_count is not None:
+                sources = load_json_records(pathlib.Path(args.sources_fixture)) if args.sources_fixture else notion_client_from_env().list_sources()
+                collection_state["fetch_budget"] = shard_fetch_budget(args.fetch_budget, args.shard_index, args.shard_count)
+                before = state.committed_entries() if state is not None else {}
+                collected = collect_candidates(
+                    sources, fetch=fetch, max_concurrency=args.max_concurrency, shard=(args.shard_index, args.shard_count), **collection_state
+                )
+                report_path = pathlib.Path(args.output_candidates)
+                if state is not None:
+                    # Shard candidates are only written by the merge, so validators, watermarks, and offsets stay
+                    # pending next to the shard report until the merge has written them.
+                    state.save(items_committed=False)
+                    write_json_report(shard_state_path(report_path), pending_shard_state(state, before, collected))
+                write_json_report(report_path, collected.shard_report(args.shard_index, args.shard_count))
+                print(
+                    f"[source-collector-v1] PASS shard={args.shard_index}/{args.shard_count} "
+                    f"sources={len(collected.source_results)} candidates_built={sum(len(items) for items in collected.source_candidates)} "
+                    "openai_call_performed=False public_static_files_written=False"
+                )
+                return 0
+            if args.sources_fixture:
+                sources = load_json_records(pathlib.Path(args.sources_fixture))
+                existing = load_json_records(pathlib.Path(args.existing_signal_intake_fixture)) if args.existing_signal_intake_fixture else []
+                result = build_candidates(sources, existing, fetch=fetch, max_concurrency=args.max_concurrency, **collection_state)
+            else:
+                result = run_notion_collection(
+                    notion_client_from_env(),
+                    fetch,
+                    state_dir=state.state_dir if state else None,
+                    max_concurrency=args.max_concurrency,
+                    dry_run=args.dry_run,
+                    reconcile_dedupe_index=args.reconcile_dedupe_index,
+                    write_source_status=args.write_source_status,
+                    **collection_state,
+                )
+                result["host_spacing_wait_seconds"] = round(pool.spacing_wait_seconds, 3)
 
+        if state is not None:
+            state.save(items_committed=not args.dry_run and not result.get("signal_intake_rows_failed"))
         if args.output_candidates:
-            output_path = pathlib.Path(args.output_candidates)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(json.dumps(result, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+            write_json_report(pathlib.Path(args.output_candidates), result)
+        if result.get("signal_intake_rows_failed"):
+            print(
+                f"[source-collector-v1] failed: {result['signal_intake_rows_failed']} Signal Intake row writes failed; see signal_intake_writes",
+                file=sys.stderr,
+            )
+            return 2
         print(
             "[source-collector-v1] PASS "
             f"candidates={result['candidate_count']} duplicates_skipped={result['duplicates_skipped']} "
             f"raw_items_seen={result['raw_items_seen']} sources_fetched={result['sources_fetched']} "
-            f"sources_failed={result['sources_failed']} "
+            f"sources_failed={result['sources_failed']} sources_not_modified={result['sources_not_modified']} "
+            f"sources_deferred_deadline={result.get('sources_deferred_deadline', 0)} "
             "openai_call_performed=False public_static_files_written=False"
         )
         return 0
     except (OSError, json.JSONDecodeError, SourceCollectorError) as exc:
         print(f"[source-collector-v1] failed: {exc}", file=sys.stderr)
         return 2
+    finally:
+        if pool is not None:
+            pool.close()
 
 
 if __name__ == "__main__":
@@ -243,9 +243,10 @@ def check_deleted_artifact_references(html: str) -> None:
     for artifact in REMOVED_PUBLIC_ARTIFACTS:
         if artifact.lower() in lower_html:
             fail(f"index.html references deleted artifact: {artifact}")
-    expected_sitemap = f"{public_seo_base_url()}/sitemap.xml".lower()
-    if "sitemap.xml" in lower_robots and expected_sitemap not in lower_robots:
-        fail("robots.txt references an unexpected sitemap.xml")
+    expected_sitemaps = {f"{public_seo_base_url()}/{name}".lower() for name in ("sitemap.xml", "sitemap_index.xml")}
+    for line in lower_robots.splitlines():
+        if line.startswith("sitemap:") and line.split(":", 1)[1].strip() not in expected_sitemaps:
+            fail("robots.txt references an unexpected sitemap")
 
 
 def check_active_workflows() -> None:
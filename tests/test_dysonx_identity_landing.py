@@ -101,7 +101,8 @@ class DysonXIdentityLandingTests(unittest.TestCase):
     def test_robots_points_to_public_signals_sitemap(self):
         text = read_lower(ROBOTS)
 
-        self.assertIn(f"sitemap: {public_seo_base_url()}/sitemap.xml", text)
+        # The public Signals sync advertises the sitemap index; earlier outputs point at sitemap.xml.
+        self.assertTrue(any(f"sitemap: {public_seo_base_url()}/{name}" in text for name in ("sitemap_index.xml", "sitemap.xml")))
         self.assertNotIn("posts/", text)
 
 
@@ -0,0 +1,269 @@
+import http.server
+import json
+import pathlib
+import sys
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import dysonx_notion_client as notion_client  # noqa: E402
+import dysonx_notion_public_signals_sync as public_sync  # noqa: E402
+import dysonx_notion_readonly_adapter as readonly_adapter  # noqa: E402
+import dysonx_notion_transport as transport_module  # noqa: E402
+import dysonx_source_collector_v1 as collector  # noqa: E402
+
+
+def page(page_id, **properties):
+    return {"id": page_id, "last_edited_time": "2026-07-01T00:00:00.000Z", "properties": properties}
+
+
+SAMPLE_PAGE = page(
+    " page-1 ",
+    Name={"type": "title", "title": [{"plain_text": "Frontier "}, {"plain_text": "eval"}]},
+    Status={"type": "status", "status": {"name": "Approved"}},
+    Tags={"type": "multi_select", "multi_select": [{"name": "agents"}, {"name": ""}]},
+    Published={"type": "checkbox", "checkbox": True},
+    Date={"type": "date", "date": None},
+    Score={"type": "formula", "formula": {"type": "number", "number": 91}},
+    People={"type": "people", "people": []},
+)
+
+
+class PagedTransport:
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.payloads = []
+
+    def __call__(self, url, headers, payload):
+        self.payloads.append(payload)
+        index = len(self.payloads) - 1
+        has_more = index + 1 < len(self.pages)
+        return {"results": self.pages[index], "has_more": has_more, "next_cursor": f"c{index + 2}" if has_more else None}
+
+
+class DysonXNotionClientTests(unittest.TestCase):
+    def test_page_decoders_keep_each_module_record_shape(self):
+        self.assertEqual(
+            public_sync.notion_page_to_record(SAMPLE_PAGE),
+            {
+                "Name": "Frontier eval",
+                "Status": "Approved",
+                "Tags": ["agents"],
+                "Published": True,
+                "Date": "",
+                "Score": 91,
+                "People": None,
+                "_notion_page_id": "page-1",
+            },
+        )
+        self.assertEqual(collector.notion_page_to_record(SAMPLE_PAGE)["_last_edited_time"], "2026-07-01T00:00:00.000Z")
+        source_record = readonly_adapter.notion_page_to_source_record(SAMPLE_PAGE)
+        self.assertEqual((source_record["Status"], source_record["Score"], source_record["Date"]), (None, None, None))
+        with self.assertRaisesRegex(readonly_adapter.NotionReadOnlyFetchError, "missing properties"):
+            readonly_adapter.notion_page_to_source_record({"id": "x"})
+
+    def test_compiled_plan_follows_a_property_type_change(self):
+        decoder = notion_client.NotionPageDecoder(RuntimeError)
+        decoder(page("a", Priority={"type": "select", "select": {"name": "High"}}))
+        record = decoder(page("b", Priority={"type": "rich_text", "rich_text": [{"plain_text": "Critical"}]}))
+        self.assertEqual(record["Priority"], "Critical")
+        self.assertEqual(decoder._plan["Priority"][0], "rich_text")
+
+    def test_pipelined_query_fetches_next_page_while_decoding(self):
+        next_page_requested = threading.Event()
+        transport = PagedTransport([[page("a")], [page("b")]])
+
+        def recording_transport(url, headers, payload):
+            if payload.get("start_cursor") == "c2":
+                next_page_requested.set()
+            return transport(url, headers, payload)
+
+        overlapped = []
+
+        def decode(notion_page):
+            if notion_page["id"] == "a":
+                overlapped.append(next_page_requested.wait(timeout=5))
+            return {"id": notion_page["id"]}
+
+        records = notion_client.query_database_records(recording_transport, "token", "db", decode, RuntimeError)
+
+        self.assertEqual(records, [{"id": "a"}, {"id": "b"}])
+        self.assertEqual(overlapped, [True])
+
+    def test_pipelining_keeps_payloads_and_order(self):
+        query_filter = notion_client.published_or_ready_filter()
+        results = []
+        for pipelined in (True, False):
+            transport = PagedTransport([[page("a")], [page("b")], [page("c")]])
+            records = notion_client.query_database_records(
+                transport, "token", "db", notion_client.NotionPageDecoder(RuntimeError), RuntimeError, query_filter=query_filter, pipelined=pipelined
+            )
+            results.append(([record["_notion_page_id"] for record in records], transport.payloads))
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0][0], ["a", "b", "c"])
+        self.assertEqual(results[0][1][2], {"page_size": 100, "filter": query_filter, "start_cursor": "c3"})
+
+    def test_public_sync_pushes_published_filter_to_notion(self):
+        transport = PagedTransport([[page("a")]])
+        public_sync.query_notion_records("token", "db", transport, query_filter=notion_client.published_or_ready_filter())
+        self.assertEqual(
+            transport.payloads[0]["filter"],
+            {"or": [{"property": "Published", "checkbox": {"equals": True}}, {"property": "Ready for Pipeline", "checkbox": {"equals": True}}]},
+        )
+
+    def test_query_errors_use_the_caller_error_class_and_label(self):
+        with self.assertRaisesRegex(public_sync.NotionPublicSignalsSyncError, "^Notion response is missing next_cursor$"):
+            public_sync.query_notion_records("token", "db", lambda url, headers, payload: {"results": [], "has_more": True})
+        with self.assertRaisesRegex(collector.SourceCollectorError, "^Notion query response is missing results$"):
+            collector.NotionClient("token", "sources", "intake", transport=lambda *args: {}).list_sources()
+
+
+def serve(handle):
+    """Start an HTTP/1.1 server whose handler calls `handle(handler, request_number)`; return (server, requests, connections)."""
+    requests = []
+    connections = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            connections.append(self.client_address)
+
+        def handle_request(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            self.rfile.read(length)
+            requests.append((self.command, self.path))
+            handle(self, len(requests))
+
+        do_GET = do_POST = handle_request
+
+        def log_message(self, format, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, requests, connections
+
+
+def respond(handler, body=b"{}"):
+    handler.send_response(200)
+    handler.send_header("Content-Length", str(len(body)))
+    handler.end_headers()
+    handler.wfile.write(body)
+
+
+def drop_second_request(handler, number):
+    if number == 2:
+        handler.close_connection = True
+        return
+    respond(handler)
+
+
+class KeepAliveSendTests(unittest.TestCase):
+    def stop(self, server, send):
+        send.close()
+        server.shutdown()
+        server.server_close()
+
+    def test_requests_share_one_connection(self):
+        connections = []
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                connections.append(self.client_address)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.dumps({"echo": json.loads(self.rfile.read(length))}).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        send = transport_module.KeepAliveSend()
+        transport = transport_module.RateLimitedNotionTransport(limiter=transport_module.TokenBucket(rate=0), send=send)
+        url = f"http://127.0.0.1:{server.server_address[1]}/v1/databases/db/query"
+        try:
+            responses = [transport(url, {"Content-Type": "application/json"}, {"page": index}) for index in range(3)]
+        finally:
+            send.close()
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(responses, [{"echo": {"page": index}} for index in range(3)])
+        self.assertEqual(len(connections), 1)
+
+    def test_connections_are_shared_across_worker_threads_and_closed_together(self):
+        server, requests, connections = serve(lambda handler, number: respond(handler))
+        send = transport_module.KeepAliveSend()
+        url = f"http://127.0.0.1:{server.server_address[1]}/v1/databases/db"
+        try:
+            for _ in range(3):
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    executor.submit(send, url, {}, None, "GET", 5).result()
+            self.assertEqual(send.idle_connections(), 1)
+        finally:
+            self.stop(server, send)
+
+        self.assertEqual(len(requests), 3)
+        self.assertEqual(len(connections), 1)
+        self.assertEqual(send.idle_connections(), 0)
+
+    def test_read_timeout_after_the_request_was_sent_is_not_resent(self):
+        server, requests, _ = serve(lambda handler, number: (time.sleep(0.5) if number == 2 else None, respond(handler)))
+        send = transport_module.KeepAliveSend()
+        url = f"http://127.0.0.1:{server.server_address[1]}/v1/databases/db"
+        try:
+            send(url, {}, None, "GET", 5)
+            with self.assertRaisesRegex(OSError, "timed out"):
+                send(url, {}, None, "GET", 0.1)
+        finally:
+            self.stop(server, send)
+
+        self.assertEqual(len(requests), 2)
+
+    def test_reused_connection_closed_by_the_server_is_resent_only_when_replay_safe(self):
+        for method, path, expected_requests in (("GET", "/v1/databases/db", 3), ("POST", "/v1/pages", 2)):
+            server, requests, _ = serve(drop_second_request)
+            send = transport_module.KeepAliveSend()
+            url = f"http://127.0.0.1:{server.server_address[1]}{path}"
+            data = b"{}" if method == "POST" else None
+            try:
+                send(url, {}, data, method, 5)
+                if method == "GET":
+                    self.assertEqual(send(url, {}, data, method, 5)[0], 200)
+                else:
+                    with self.assertRaisesRegex(OSError, "RemoteDisconnected"):
+                        send(url, {}, data, method, 5)
+            finally:
+                self.stop(server, send)
+
+            self.assertEqual(len(requests), expected_requests)
+
+    def test_connect_failures_are_reported_as_not_sent(self):
+        server, _, _ = serve(lambda handler, number: respond(handler))
+        port = server.server_address[1]
+        server.shutdown()
+        server.server_close()
+
+        with self.assertRaises(transport_module.NotionRequestNotSent):
+            transport_module.KeepAliveSend()(f"http://127.0.0.1:{port}/v1/pages", {}, b"{}", "POST", 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,12 +4,14 @@ import shutil
 import tempfile
 import unittest
 import sys
+from unittest import mock
 
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "scripts"))
 
 import dysonx_notion_public_signals_sync as sync  # noqa: E402
+import dysonx_public_signals_auto_merge_gate as gate  # noqa: E402
 
 
 FIXTURE_DOMAIN = "example.com"
@@ -59,10 +61,12 @@ class DysonXNotionPublicSignalsSyncTests(unittest.TestCase):
             for path in sorted((self.root / "signals").rglob("*"))
             if path.is_file()
         }
-        for name in ("robots.txt", "sitemap.xml", "rss.xml", "feed.json"):
+        for name in ("robots.txt", "sitemap.xml", "sitemap_index.xml", "rss.xml", "feed.json"):
             path = self.root / name
             if path.exists():
                 files[name] = path.read_text(encoding="utf-8")
+        for path in sorted(self.root.glob("sitemap-*.xml")):
+            files[path.name] = path.read_text(encoding="utf-8")
         return files
 
     def test_eligible_row_generates_page(self):
@@ -199,7 +203,11 @@ class DysonXNotionPublicSignalsSyncTests(unittest.TestCase):
             for entry in manifest["launched"]
         }
 
-        self.assertEqual(robots, f"User-agent: *\nAllow: /\nSitemap: {FIXTURE_BASE_URL}/sitemap.xml\n")
+        sitemap_index = (self.root / "sitemap_index.xml").read_text(encoding="utf-8")
+        self.assertEqual(
+            robots, f"User-agent: *\nAllow: /\nSitemap: {FIXTURE_BASE_URL}/sitemap_index.xml\n"
+        )
+        self.assertIn(f"<loc>{FIXTURE_BASE_URL}/sitemap.xml</loc>", sitemap_index)
         self.assertIn(f"{FIXTURE_BASE_URL}/", sitemap)
         self.assertIn(f"{FIXTURE_BASE_URL}/signals/", sitemap)
         for url in launched_urls:
@@ -218,6 +226,8 @@ class DysonXNotionPublicSignalsSyncTests(unittest.TestCase):
         self.assertIn("signals/public_artifact_manifest.json", artifact_paths)
         self.assertIn("robots.txt", artifact_paths)
         self.assertIn("sitemap.xml", artifact_paths)
+        self.assertIn("sitemap_index.xml", artifact_paths)
+        self.assertIn("signals/page/1/index.html", artifact_paths)
         self.assertIn("rss.xml", artifact_paths)
         self.assertIn("feed.json", artifact_paths)
         signal_artifact = next(item for item in artifact_manifest["artifacts"] if item["path"] == "signals/notion-agent-reliability/index.html")
@@ -952,6 +962,249 @@ class DysonXNotionPublicSignalsSyncTests(unittest.TestCase):
 
         self.assertEqual(entry["source_priority"], "Critical")
 
+    def incremental_records(self, count=3, changes=None):
+        changes = changes or {}
+        return [
+            eligible_record(
+                **{
+                    "Signal ID": f"sig_incremental_{index}",
+                    "Signal Title": f"Incremental public Signal {index}",
+                    "Slug": f"incremental-public-signal-{index}",
+                    "Summary": changes.get(index, f"Summary-only public Signal {index} about AI agent evaluation."),
+                }
+            )
+            for index in range(count)
+        ]
+
+    def test_incremental_sync_renders_only_changed_pages(self):
+        shutil.rmtree(self.root / "signals")
+        report_path = self.root / "tmp" / "report.json"
+        sync.sync_records(self.incremental_records(), self.root, refreshed_at="2026-06-27T00:00:00Z", output_report=report_path)
+        first_report = json.loads(report_path.read_text(encoding="utf-8"))
+        unchanged_page = self.root / "signals" / "incremental-public-signal-0" / "index.html"
+        unchanged_html = unchanged_page.read_text(encoding="utf-8")
+
+        changed = self.incremental_records(changes={2: "Updated summary-only Signal about AI agent evaluation."})
+        manifest = sync.sync_records(changed, self.root, refreshed_at="2026-06-28T00:00:00Z", output_report=report_path)
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        changed_html = (self.root / "signals" / "incremental-public-signal-2" / "index.html").read_text(encoding="utf-8")
+
+        self.assertEqual((first_report["pages_rendered"], first_report["pages_skipped_unchanged"]), (3, 0))
+        self.assertEqual((report["pages_rendered"], report["pages_skipped_unchanged"]), (1, 2))
+        self.assertGreater(report["bytes_written"], len(changed_html.encode("utf-8")))
+        self.assertEqual(manifest["content_refreshed_at"], "2026-06-28T00:00:00Z")
+        self.assertEqual(unchanged_page.read_text(encoding="utf-8"), unchanged_html)
+        self.assertIn("Content refreshed at 2026-06-28T00:00:00Z", changed_html)
+        self.assertTrue(all(len(entry["material_hash"]) == 64 for entry in manifest["launched"]))
+
+    def test_identical_rerun_writes_no_bytes(self):
+        shutil.rmtree(self.root / "signals")
+        report_path = self.root / "tmp" / "report.json"
+        sync.sync_records(self.incremental_records(), self.root, refreshed_at="2026-06-27T00:00:00Z")
+        sync.sync_records(self.incremental_records(), self.root, refreshed_at="2026-06-28T00:00:00Z", output_report=report_path)
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+
+        self.assertEqual((report["pages_rendered"], report["pages_skipped_unchanged"], report["bytes_written"]), (0, 3, 0))
+
+    def test_missing_page_is_rendered_even_when_hash_is_unchanged(self):
+        shutil.rmtree(self.root / "signals")
+        report_path = self.root / "tmp" / "report.json"
+        sync.sync_records(self.incremental_records(), self.root, refreshed_at="2026-06-27T00:00:00Z")
+        page = self.root / "signals" / "incremental-public-signal-1" / "index.html"
+        page.unlink()
+
+        sync.sync_records(self.incremental_records(), self.root, refreshed_at="2026-06-27T00:00:00Z", output_report=report_path)
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+
+        self.assertTrue(page.exists())
+        self.assertEqual((report["pages_rendered"], report["pages_skipped_unchanged"]), (1, 2))
+
+    def test_existing_index_reads_declared_pages_from_manifest(self):
+        shutil.rmtree(self.root / "signals")
+        sync.sync_records(self.incremental_records(), self.root, refreshed_at="2026-06-27T00:00:00Z")
+        orphan_dir = self.root / "signals" / "valid-orphan-signal"
+        orphan_dir.mkdir()
+        (orphan_dir / "index.html").write_text(
+            "<h1>Valid orphan Signal</h1><h2>Summary</h2><p>Existing summary-only public Signal retained.</p>",
+            encoding="utf-8",
+        )
+
+        with mock.patch.object(sync, "parse_existing_signal_page", wraps=sync.parse_existing_signal_page) as parse_page:
+            existing = sync.existing_public_signals(self.root)
+
+        self.assertEqual([call.args[0].parent.name for call in parse_page.call_args_list], ["valid-orphan-signal"])
+        by_slug = {record["slug"]: record for record in existing}
+        self.assertEqual(by_slug["incremental-public-signal-1"]["title"], "Incremental public Signal 1")
+        self.assertTrue(by_slug["incremental-public-signal-1"]["declared"])
+        self.assertEqual(by_slug["valid-orphan-signal"]["summary"], "Existing summary-only public Signal retained.")
+        self.assertFalse(by_slug["valid-orphan-signal"]["declared"])
+
+    def test_manifest_entry_without_summary_falls_back_to_page_html(self):
+        shutil.rmtree(self.root / "signals")
+        page_dir = self.root / "signals" / "declared-signal"
+        page_dir.mkdir(parents=True)
+        (self.root / "signals" / "public_launch_manifest.json").write_text(
+            json.dumps({"launched": [{"slug": "declared-signal", "title": "Declared Signal"}]}),
+            encoding="utf-8",
+        )
+        (page_dir / "index.html").write_text("<h1>Declared Signal</h1><h2>Summary</h2><p>Summary kept in HTML.</p>", encoding="utf-8")
+
+        existing = sync.existing_public_signals(self.root)
+
+        self.assertEqual(existing[0]["summary"], "Summary kept in HTML.")
+
+    def test_sync_loads_the_launch_manifest_once(self):
+        with mock.patch.object(sync, "existing_manifest", wraps=sync.existing_manifest) as load_manifest:
+            sync.sync_records([eligible_record()], self.root, refreshed_at="2026-06-27T00:00:00Z")
+
+        self.assertEqual(load_manifest.call_count, 1)
+
+    def test_rank_public_signals_dedupes_and_orders_in_one_pass(self):
+        def ranked(slug, signal_id, quality, **extra):
+            return {"slug": slug, "signal_id": signal_id, "source_url": "", "source_priority": "High", "agi_relevance": "High", "quality_hint": quality, "title": slug, **extra}
+
+        preserved = {**ranked("kept-page", "existing_kept_page", ""), "source_priority": "", "agi_relevance": "Retained"}
+        first_tie = ranked("tie", "sig_same", 90)
+        second_tie = ranked("tie", "sig_same", 90, summary="second")
+        eligible = [ranked("dup", "sig_b", 85), ranked("dup", "sig_a", 85), first_tie, second_tie, ranked("top", "sig_top", 95)]
+
+        merged = sync.rank_public_signals(eligible, [preserved])
+
+        self.assertEqual([record["slug"] for record in merged], ["top", "tie", "dup", "kept-page"])
+        self.assertIs(merged[1], first_tie)
+        self.assertEqual(merged[2]["signal_id"], "sig_a")
+
+    def test_parallel_page_rendering_matches_serial_output(self):
+        shutil.rmtree(self.root / "signals")
+        records = self.incremental_records(count=9)
+        sync.sync_records(records, self.root, refreshed_at="2026-06-27T00:00:00Z")
+        serial_snapshot = self.output_snapshot()
+        shutil.rmtree(self.root / "signals")
+        for name in ("robots.txt", "sitemap.xml", "sitemap_index.xml", "rss.xml", "feed.json"):
+            (self.root / name).unlink()
+
+        sync.sync_records(records, self.root, refreshed_at="2026-06-27T00:00:00Z", workers=3)
+
+        self.assertEqual(self.output_snapshot(), serial_snapshot)
+
+    def test_parallel_page_rendering_surfaces_unsafe_pages(self):
+        records = self.incremental_records(count=4)
+        records[2]["Watch Next"] = "Watch tmp/" "production_publish_pack for updates."
+
+        with self.assertRaisesRegex(sync.NotionPublicSignalsSyncError, "Signal page incremental-public-signal-2 contains forbidden public terms"):
+            sync.sync_records(records, self.root, refreshed_at="2026-06-27T00:00:00Z", workers=2)
+
+    def sync_listing(self, records, refreshed_at, **kwargs):
+        report_path = self.root / "tmp" / "report.json"
+        manifest = sync.sync_records(records, self.root, refreshed_at=refreshed_at, output_report=report_path, **kwargs)
+        return manifest, json.loads(report_path.read_text(encoding="utf-8"))
+
+    def test_signals_pages_keep_boundaries_when_signals_are_added(self):
+        shutil.rmtree(self.root / "signals")
+        records = self.incremental_records(count=7)
+        first_manifest, first_report = self.sync_listing(records[:5], "2026-06-27T00:00:00Z", signals_page_size=2)
+        first_pages = {slug: entry["index_page"] for slug, entry in ((entry["slug"], entry) for entry in first_manifest["launched"])}
+        first_snapshot = self.output_snapshot()
+
+        manifest, report = self.sync_listing(records, "2026-06-28T00:00:00Z", signals_page_size=2)
+        snapshot = self.output_snapshot()
+        pages = {entry["slug"]: entry["index_page"] for entry in manifest["launched"]}
+
+        self.assertEqual((first_report["index_pages"], first_report["index_pages_rendered"]), (3, 3))
+        self.assertEqual(sorted(first_pages.values()), [1, 1, 2, 2, 3])
+        self.assertEqual({slug: pages[slug] for slug in first_pages}, first_pages)
+        self.assertEqual((pages["incremental-public-signal-5"], pages["incremental-public-signal-6"]), (3, 4))
+        self.assertEqual((report["index_pages_rendered"], report["index_pages_skipped_unchanged"]), (2, 2))
+        for page in (1, 2):
+            path = f"signals/page/{page}/index.html"
+            self.assertEqual(snapshot[path], first_snapshot[path])
+        self.assertIn('href="/signals/page/4/">Next page</a>', snapshot["signals/page/3/index.html"])
+        self.assertIn('href="/signals/page/1/">page 1</a> … <a href="/signals/page/4/">page 4</a>', snapshot["signals/index.html"])
+        self.assertNotIn("newest", snapshot["signals/index.html"])
+
+    def test_removing_signals_only_rewrites_their_pages(self):
+        shutil.rmtree(self.root / "signals")
+        records = self.incremental_records(count=5)
+        self.sync_listing(records, "2026-06-27T00:00:00Z", signals_page_size=2)
+        first_snapshot = self.output_snapshot()
+        for index in (0, 4):
+            shutil.rmtree(self.root / "signals" / f"incremental-public-signal-{index}")
+
+        manifest, report = self.sync_listing(records[1:4], "2026-06-28T00:00:00Z", signals_page_size=2)
+        snapshot = self.output_snapshot()
+
+        self.assertEqual(sorted({entry["index_page"] for entry in manifest["launched"]}), [1, 2])
+        self.assertEqual((report["index_pages_rendered"], report["index_pages_skipped_unchanged"]), (2, 0))
+        self.assertNotIn("signals/page/3/index.html", snapshot)
+        self.assertFalse((self.root / "signals" / "page" / "3").exists())
+        self.assertNotIn("incremental-public-signal-0", snapshot["signals/page/1/index.html"])
+        self.assertNotIn("Next page", snapshot["signals/page/2/index.html"])
+        self.assertNotEqual(snapshot["signals/page/2/index.html"], first_snapshot["signals/page/2/index.html"])
+
+    def test_gate_accepts_a_listing_page_the_sync_deleted(self):
+        shutil.rmtree(self.root / "signals")
+        records = self.incremental_records(count=5)
+        self.sync_listing(records, "2026-06-27T00:00:00Z", signals_page_size=2)
+        shutil.rmtree(self.root / "signals" / "incremental-public-signal-4")
+        before = self.output_snapshot()
+
+        self.sync_listing(records[:4], "2026-06-28T00:00:00Z", signals_page_size=2)
+        after = self.output_snapshot()
+        changed_files = sorted(path for path in {*before, *after} if before.get(path) != after.get(path))
+        changed_files_path = self.root / "tmp" / "changed_files.json"
+        changed_files_path.write_text(json.dumps(changed_files), encoding="utf-8")
+        gate_args = ["--manifest", str(self.root / "signals" / "public_launch_manifest.json"), "--changed-files-json", str(changed_files_path)]
+        # The home page is not a sync output, but listing pages link to it.
+        (self.root / "index.html").write_text("<!doctype html><title>DysonX</title>\n", encoding="utf-8")
+
+        self.assertIn("signals/page/3/index.html", changed_files)
+        self.assertNotIn("signals/page/3/index.html", after)
+        with mock.patch("sys.stdout"):
+            self.assertEqual(gate.main(gate_args), 0)
+        (self.root / "signals" / "page" / "3").mkdir()
+        (self.root / "signals" / "page" / "3" / "index.html").write_text(before["signals/page/3/index.html"], encoding="utf-8")
+        with mock.patch("sys.stdout"), mock.patch("sys.stderr"):
+            self.assertNotEqual(gate.main(gate_args), 0)
+
+    def test_sitemap_shards_are_bounded_and_only_changed_shards_are_rewritten(self):
+        shutil.rmtree(self.root / "signals")
+        records = self.incremental_records(count=7)
+        self.sync_listing(records, "2026-06-27T00:00:00Z", sitemap_shard_url_limit=3)
+        first_snapshot = self.output_snapshot()
+        sitemap_index = first_snapshot["sitemap_index.xml"]
+
+        self.assertEqual([name for name in first_snapshot if name.startswith("sitemap")], ["sitemap.xml", "sitemap_index.xml", "sitemap-2.xml", "sitemap-3.xml"])
+        for name in ("sitemap.xml", "sitemap-2.xml", "sitemap-3.xml"):
+            self.assertLessEqual(first_snapshot[name].count("<url>"), 3)
+            self.assertIn(f"<loc>{FIXTURE_BASE_URL}/{name}</loc>", sitemap_index)
+        self.assertEqual(sum(first_snapshot[name].count("/signals/incremental-public-signal-") for name in ("sitemap.xml", "sitemap-2.xml", "sitemap-3.xml")), 7)
+
+        changed = self.incremental_records(count=7, changes={6: "Updated summary-only Signal about AI agent evaluation."})
+        manifest, report = self.sync_listing(changed, "2026-06-28T00:00:00Z", sitemap_shard_url_limit=3)
+        snapshot = self.output_snapshot()
+        changed_shard = next(entry["sitemap_shard"] for entry in manifest["launched"] if entry["slug"] == "incremental-public-signal-6")
+
+        self.assertEqual(changed_shard, 3)
+        self.assertEqual((report["sitemap_shards_rendered"], report["sitemap_shards_skipped_unchanged"]), (2, 1))
+        self.assertEqual(snapshot["sitemap-2.xml"], first_snapshot["sitemap-2.xml"])
+        self.assertIn("<lastmod>2026-06-28</lastmod>", snapshot["sitemap-3.xml"])
+        self.assertIn("<lastmod>2026-06-27</lastmod>", snapshot["sitemap-3.xml"])
+
+    def test_stable_buckets_bound_items_and_weight(self):
+        weights = {"a": 4, "b": 4, "c": 4, "d": 9, "e": 1, "f": 11}
+
+        buckets = sync.stable_buckets(list(weights), {"a": 1, "b": 1, "c": 2}, 3, weight=weights.__getitem__, weight_limit=10, reserved={1: (1, 2)})
+
+        # d overflows shard 2 by weight, and f, too heavy for any shard, gets an empty one to itself.
+        self.assertEqual(buckets, {"a": 1, "b": 1, "c": 2, "d": 3, "e": 3, "f": 4})
+
+    def test_reserved_listing_slug_is_blocked(self):
+        report_path = self.root / "tmp" / "report.json"
+        sync.sync_records([eligible_record(Slug="page")], self.root, refreshed_at="2026-06-27T00:00:00Z", output_report=report_path)
+
+        self.assertIn("reserved_public_slug", report_path.read_text(encoding="utf-8"))
+        self.assertFalse((self.root / "signals" / "page" / "index.html").exists())
+
 
 if __name__ == "__main__":
     unittest.main()
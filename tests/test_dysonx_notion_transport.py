@@ -0,0 +1,214 @@
+import http.server
+import json
+import pathlib
+import sys
+import threading
+import time
+import unittest
+
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import dysonx_notion_public_signals_sync as public_sync  # noqa: E402
+import dysonx_notion_readonly_adapter as readonly_adapter  # noqa: E402
+import dysonx_notion_transport as transport_module  # noqa: E402
+import dysonx_source_collector_v1 as collector  # noqa: E402
+
+
+class ScriptedSend:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def __call__(self, url, headers, data, method, timeout):
+        self.calls.append((url, method, json.loads(data) if data else None))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def unlimited_transport(send, **kwargs):
+    sleeps = []
+    transport = transport_module.RateLimitedNotionTransport(
+        limiter=transport_module.TokenBucket(rate=0),
+        send=send,
+        sleep=sleeps.append,
+        jitter=lambda: 0.0,
+        **kwargs,
+    )
+    return transport, sleeps
+
+
+class DysonXNotionTransportTests(unittest.TestCase):
+    def test_token_bucket_allows_burst_then_paces(self):
+        now = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(round(seconds, 3))
+            now[0] += seconds
+
+        bucket = transport_module.TokenBucket(rate=2, capacity=2, clock=lambda: now[0], sleep=sleep)
+        waits = [bucket.acquire() for _ in range(4)]
+
+        self.assertEqual(waits[:2], [0.0, 0.0])
+        self.assertEqual(sleeps, [0.5, 0.5])
+
+    def test_429_honours_retry_after_and_counts_retries(self):
+        send = ScriptedSend(
+            [
+                (429, {"retry-after": "2"}, b'{"code": "rate_limited"}'),
+                (200, {}, b'{"results": []}'),
+            ]
+        )
+        transport, sleeps = unlimited_transport(send)
+
+        response = transport("https://api.notion.com/v1/databases/db/query", {}, {"page_size": 100})
+
+        self.assertEqual(response, {"results": []})
+        self.assertEqual(sleeps, [2.0])
+        self.assertEqual(send.calls[0][1], "POST")
+        stats = transport.stats.as_dict()
+        self.assertEqual(stats["requests"], 2)
+        self.assertEqual(stats["retries"], 1)
+        self.assertEqual(stats["rate_limited_responses"], 1)
+        self.assertEqual(stats["backoff_wait_seconds"], 2.0)
+
+    def test_server_errors_back_off_exponentially(self):
+        send = ScriptedSend(
+            [
+                (502, {}, b"bad gateway"),
+                (503, {}, b"unavailable"),
+                OSError("connection reset"),
+                (200, {}, b"{}"),
+            ]
+        )
+        transport, sleeps = unlimited_transport(send, base_backoff_seconds=1.0)
+
+        self.assertEqual(transport("https://api.notion.com/v1/pages/page", {}, None, "GET"), {})
+        self.assertEqual(sleeps, [0.5, 1.0, 2.0])
+        self.assertEqual(transport.stats.server_error_responses, 2)
+        self.assertEqual(transport.stats.connection_errors, 1)
+
+    def test_client_errors_fail_without_retry_using_client_error_class(self):
+        send = ScriptedSend([(400, {}, b'{"message": "validation_error"}')])
+        transport, sleeps = unlimited_transport(send, error_class=collector.SourceCollectorError)
+
+        with self.assertRaisesRegex(collector.SourceCollectorError, "HTTP Error 400"):
+            transport("https://api.notion.com/v1/pages", {}, {"properties": {}}, "POST")
+        self.assertEqual(sleeps, [])
+
+    def test_create_is_not_replayed_after_timeout_or_server_error(self):
+        for failure in (TimeoutError("timed out"), (500, {}, b"internal"), (503, {}, b"unavailable")):
+            send = ScriptedSend([failure, (200, {}, b'{"id": "duplicate"}')])
+            transport, sleeps = unlimited_transport(send, error_class=collector.SourceCollectorError)
+
+            with self.assertRaisesRegex(collector.SourceCollectorError, "POST not retried"):
+                transport("https://api.notion.com/v1/pages", {}, {"properties": {}}, "POST")
+            self.assertEqual(len(send.calls), 1)
+            self.assertEqual(sleeps, [])
+
+    def test_create_retries_only_when_notion_cannot_have_applied_it(self):
+        send = ScriptedSend(
+            [
+                transport_module.NotionRequestNotSent("ConnectionRefusedError: refused"),
+                (429, {"retry-after": "1"}, b""),
+                (503, {"retry-after": "2"}, b"maintenance"),
+                (200, {}, b'{"id": "row"}'),
+            ]
+        )
+        transport, sleeps = unlimited_transport(send)
+
+        self.assertEqual(transport("https://api.notion.com/v1/pages", {}, {"properties": {}}, "POST"), {"id": "row"})
+        self.assertEqual(sleeps, [0.5, 1.0, 2.0])
+
+    def test_database_queries_keep_the_full_retry_policy(self):
+        self.assertTrue(transport_module.replay_safe("POST", "https://api.notion.com/v1/databases/db/query"))
+        self.assertTrue(transport_module.replay_safe("get", "https://api.notion.com/v1/databases/db"))
+        self.assertFalse(transport_module.replay_safe("POST", "https://api.notion.com/v1/pages"))
+        self.assertFalse(transport_module.replay_safe("PATCH", "https://api.notion.com/v1/pages/page"))
+        send = ScriptedSend([TimeoutError("timed out"), (500, {}, b""), (200, {}, b'{"results": []}')])
+        transport, sleeps = unlimited_transport(send)
+
+        self.assertEqual(transport("https://api.notion.com/v1/databases/db/query", {}, {"page_size": 100}), {"results": []})
+        self.assertEqual(len(sleeps), 2)
+
+    def test_accepted_create_that_times_out_writes_one_row(self):
+        created = []
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                created.append(json.loads(self.rfile.read(length)))
+                time.sleep(0.5)
+                body = b'{"id": "row"}'
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        send = transport_module.KeepAliveSend()
+        transport = transport_module.RateLimitedNotionTransport(
+            error_class=collector.SourceCollectorError,
+            limiter=transport_module.TokenBucket(rate=0),
+            timeout=0.1,
+            send=send,
+            sleep=lambda seconds: None,
+        )
+        url = f"http://127.0.0.1:{server.server_address[1]}/v1/pages"
+        try:
+            with self.assertRaisesRegex(collector.SourceCollectorError, "POST not retried"):
+                transport(url, {"Content-Type": "application/json"}, {"parent": {"database_id": "intake"}, "properties": {}}, "POST")
+        finally:
+            send.close()
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(transport.stats.requests, 1)
+        self.assertEqual(len(created), 1)
+
+    def test_retries_are_bounded(self):
+        send = ScriptedSend([(429, {}, b"")] * 3)
+        transport, sleeps = unlimited_transport(send, max_retries=2, error_class=public_sync.NotionPublicSignalsSyncError)
+
+        with self.assertRaisesRegex(public_sync.NotionPublicSignalsSyncError, "after 3 attempts"):
+            transport("https://api.notion.com/v1/databases/db/query", {}, {"page_size": 100})
+        self.assertEqual(len(sleeps), 2)
+
+    def test_retry_after_accepts_http_dates(self):
+        self.assertEqual(transport_module.retry_after_seconds("Thu, 01 Jan 1970 00:00:10 GMT", now=lambda: 4.0), 6.0)
+        self.assertIsNone(transport_module.retry_after_seconds("soon"))
+
+    def test_notion_clients_default_to_shared_rate_limited_transport(self):
+        for transport in (collector.urllib_notion_transport, public_sync.urllib_notion_transport, readonly_adapter.urllib_notion_transport):
+            self.assertIsInstance(transport, transport_module.RateLimitedNotionTransport)
+            self.assertIs(transport.limiter, transport_module.DEFAULT_NOTION_RATE_LIMITER)
+        self.assertIs(readonly_adapter.urllib_notion_transport.error_class, readonly_adapter.NotionReadOnlyFetchError)
+
+    def test_injected_transport_paginates_read_only_queries(self):
+        send = ScriptedSend(
+            [
+                (200, {}, b'{"results": [], "has_more": true, "next_cursor": "c2"}'),
+                (429, {"retry-after": "0"}, b""),
+                (200, {}, b'{"results": [], "has_more": false}'),
+            ]
+        )
+        transport, _ = unlimited_transport(send, error_class=readonly_adapter.NotionReadOnlyFetchError)
+        client = readonly_adapter.NotionReadOnlySourceClient(token="token", database_id="db", transport=transport)
+
+        self.assertEqual(client.list_source_records(), [])
+        self.assertEqual([call[2] for call in send.calls], [{"page_size": 100}, {"page_size": 100, "start_cursor": "c2"}, {"page_size": 100, "start_cursor": "c2"}])
+        self.assertEqual(transport_module.notion_transport_stats(transport)["retries"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,6 +12,7 @@ import dysonx_public_signals_auto_merge_gate as gate  # noqa: E402
 from dysonx_public_signals_contract import (  # noqa: E402
     PUBLIC_SIGNAL_CONTRACT_VERSION,
     PUBLIC_SIGNAL_POLICY_VERSION,
+    artifact_class_for_path,
     build_artifact_entry,
 )
 
@@ -42,7 +43,13 @@ class DysonXPublicSignalsAutoMergeGateTests(unittest.TestCase):
             f'<h1>Critical AI Agent Evaluation Signal</h1><p>Summary-only public Signal about AI agent evaluation.</p><a href="/">Home</a> <a href="/signals/">Signals</a> <a href="https://example.org/source">Source</a><script type="application/ld+json">{{"@context":"https://schema.org","@type":"TechArticle","headline":"Critical AI Agent Evaluation Signal","description":"Summary-only public Signal about AI agent evaluation.","url":"{FIXTURE_BASE_URL}/signals/critical-agent-signal/"}}</script>',
             encoding="utf-8",
         )
-        (self.root / "robots.txt").write_text(f"User-agent: *\nAllow: /\nSitemap: {FIXTURE_BASE_URL}/sitemap.xml\n", encoding="utf-8")
+        (self.root / "robots.txt").write_text(
+            f"User-agent: *\nAllow: /\nSitemap: {FIXTURE_BASE_URL}/sitemap_index.xml\n", encoding="utf-8"
+        )
+        (self.root / "sitemap_index.xml").write_text(
+            f'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n  <sitemap>\n    <loc>{FIXTURE_BASE_URL}/sitemap.xml</loc>\n    <lastmod>2026-06-27</lastmod>\n  </sitemap>\n</sitemapindex>\n',
+            encoding="utf-8",
+        )
         (self.root / "sitemap.xml").write_text(
             f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n  <url>\n    <loc>{FIXTURE_BASE_URL}/</loc>\n    <lastmod>2026-06-27</lastmod>\n  </url>\n  <url>\n    <loc>{FIXTURE_BASE_URL}/signals/</loc>\n    <lastmod>2026-06-27</lastmod>\n  </url>\n  <url>\n    <loc>{FIXTURE_BASE_URL}/signals/critical-agent-signal/</loc>\n    <lastmod>2026-06-27</lastmod>\n  </url>\n</urlset>\n',
             encoding="utf-8",
@@ -124,6 +131,7 @@ class DysonXPublicSignalsAutoMergeGateTests(unittest.TestCase):
             "robots.txt",
             "rss.xml",
             "sitemap.xml",
+            "sitemap_index.xml",
             "signals/index.html",
             "signals/public_launch_manifest.json",
             "signals/public_artifact_manifest.json",
@@ -368,6 +376,7 @@ class DysonXPublicSignalsAutoMergeGateTests(unittest.TestCase):
             "robots.txt",
             "rss.xml",
             "sitemap.xml",
+            "sitemap_index.xml",
             "signals/index.html",
             "signals/public_launch_manifest.json",
             "signals/public_artifact_manifest.json",
@@ -457,6 +466,78 @@ class DysonXPublicSignalsAutoMergeGateTests(unittest.TestCase):
         )
         self.assertNotEqual(self.run_gate(), 0)
 
+    def test_contract_classifies_paginated_pages_and_sitemap_shards(self):
+        expected = {
+            "signals/page/12/index.html": "signals_page_html",
+            "signals/page/index.html": None,
+            "signals/page/01/index.html": None,
+            "sitemap_index.xml": "sitemap_index_xml",
+            "sitemap-2.xml": "sitemap_shard_xml",
+            "sitemap-1.xml": None,
+            "sitemap.xml": "sitemap_xml",
+        }
+        self.assertEqual({path: artifact_class_for_path(path) for path in expected}, expected)
+        self.assertEqual(build_artifact_entry("signals/page/3/index.html", "m", membership_hash="h")["allowed_embeds"], ["json_ld_organization"])
+
+    def write_signals_page(self, body):
+        page = self.signals / "page" / "1" / "index.html"
+        page.parent.mkdir(parents=True)
+        page.write_text(body, encoding="utf-8")
+        self.write_artifact_manifest(paths=[*[entry["path"] for entry in self.artifact_manifest()["artifacts"]], "signals/page/1/index.html"])
+
+    def test_paginated_signals_page_passes(self):
+        self.write_changed_files(["signals/page/1/index.html"])
+        self.write_signals_page(
+            f'<h1>Signals page 1</h1><a href="/signals/{self.slug}/">Signal</a> <a href="/signals/">Signals</a><script type="application/ld+json">{{"@context":"https://schema.org","@type":"Organization","name":"EnergizeOS Media","url":"{FIXTURE_BASE_URL}"}}</script>'
+        )
+        self.assertEqual(self.run_gate(), 0)
+
+    def test_paginated_signals_page_with_article_json_ld_fails(self):
+        self.write_changed_files(["signals/page/1/index.html"])
+        self.write_signals_page(f'<h1>Signals page 1</h1><script type="application/ld+json">{{"@type":"TechArticle","url":"{FIXTURE_BASE_URL}/signals/page/1/"}}</script>')
+        self.assertNotEqual(self.run_gate(), 0)
+
+    def test_paginated_signals_page_must_be_declared(self):
+        self.write_changed_files(["signals/page/1/index.html"])
+        page = self.signals / "page" / "1" / "index.html"
+        page.parent.mkdir(parents=True)
+        page.write_text("<h1>Signals page 1</h1>", encoding="utf-8")
+        self.assertNotEqual(self.run_gate(), 0)
+
+    def test_deleted_listing_pages_and_sitemap_shards_pass_undeclared(self):
+        self.write_changed_files(["signals/page/3/index.html", "sitemap-4.xml", "sitemap_index.xml"])
+        self.assertEqual(self.run_gate(), 0)
+        self.write_changed_files(["signals/critical-agent-signal/index.html", "signals/page/3/index.html"])
+        (self.signals / "critical-agent-signal" / "index.html").unlink()
+        self.assertNotEqual(self.run_gate(), 0)
+
+    def test_sitemap_shard_lists_only_launched_signals(self):
+        self.write_changed_files(["sitemap-2.xml", "sitemap_index.xml"])
+        self.write_artifact_manifest(paths=[*[entry["path"] for entry in self.artifact_manifest()["artifacts"]], "sitemap-2.xml"])
+        (self.root / "sitemap_index.xml").write_text(
+            f'<?xml version="1.0" encoding="UTF-8"?><sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"><sitemap><loc>{FIXTURE_BASE_URL}/sitemap.xml</loc><lastmod>2026-06-27</lastmod></sitemap><sitemap><loc>{FIXTURE_BASE_URL}/sitemap-2.xml</loc><lastmod>2026-06-27</lastmod></sitemap></sitemapindex>',
+            encoding="utf-8",
+        )
+        shard = self.root / "sitemap-2.xml"
+        shard.write_text(
+            f'<?xml version="1.0" encoding="UTF-8"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"><url><loc>{FIXTURE_BASE_URL}/signals/critical-agent-signal/</loc><lastmod>2026-06-27</lastmod></url></urlset>',
+            encoding="utf-8",
+        )
+        self.assertEqual(self.run_gate(), 0)
+        shard.write_text(
+            f'<?xml version="1.0" encoding="UTF-8"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"><url><loc>{FIXTURE_BASE_URL}/signals/blocked-medical-signal/</loc><lastmod>2026-06-27</lastmod></url></urlset>',
+            encoding="utf-8",
+        )
+        self.assertNotEqual(self.run_gate(), 0)
+
+    def test_sitemap_index_pointing_at_missing_shard_fails(self):
+        self.write_changed_files(["sitemap_index.xml"])
+        (self.root / "sitemap_index.xml").write_text(
+            f'<?xml version="1.0" encoding="UTF-8"?><sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"><sitemap><loc>{FIXTURE_BASE_URL}/sitemap.xml</loc><lastmod>2026-06-27</lastmod></sitemap><sitemap><loc>{FIXTURE_BASE_URL}/sitemap-2.xml</loc><lastmod>2026-06-27</lastmod></sitemap></sitemapindex>',
+            encoding="utf-8",
+        )
+        self.assertNotEqual(self.run_gate(), 0)
+
     def test_rss_raw_body_leakage_fails(self):
         self.write_changed_files(["rss.xml"])
         (self.root / "rss.xml").write_text("full article text", encoding="utf-8")
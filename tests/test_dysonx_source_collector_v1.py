@@ -1,7 +1,12 @@
+import gzip
+import http.server
 import json
 import pathlib
 import tempfile
+import threading
+import time
 import unittest
+from unittest import mock
 import sys
 
 
@@ -9,6 +14,7 @@ ROOT = pathlib.Path(__file__).resolve().parents[1]
 FIXTURES = ROOT / "tests" / "fixtures" / "source_collector_v1"
 sys.path.insert(0, str(ROOT / "scripts"))
 
+import dysonx_source_collector_benchmark as collector_benchmark  # noqa: E402
 import dysonx_source_collector_v1 as collector  # noqa: E402
 
 
@@ -17,6 +23,162 @@ def load_records(name: str):
     return data["records"]
 
 
+class FeedServer:
+    """Local keep-alive HTTP server that serves the RSS fixture gzip-compressed."""
+
+    def __init__(self, delay_seconds: float = 0.0):
+        feed = (FIXTURES / "rss_feed_sample.xml").read_bytes()
+        # A page whose body is large and poorly compressible, so stopping at </head> is visible on the wire.
+        page_body = "".join(f"<p>{collector.hashlib.sha256(str(index).encode()).hexdigest()}</p>" for index in range(20_000))
+        page = (
+            '<html><head><title>Agent safety evaluation update</title>'
+            '<link rel="alternate" type="application/rss+xml" href="/rss.xml">'
+            f"</head><body>{page_body}</body></html>"
+        ).encode("utf-8")
+        state = {"connections": 0, "active": 0, "max_active": 0, "encodings": []}
+        lock = threading.Lock()
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with lock:
+                    state["connections"] += 1
+
+            def do_GET(self):
+                with lock:
+                    state["active"] += 1
+                    state["max_active"] = max(state["max_active"], state["active"])
+                    state["encodings"].append(self.headers.get("Accept-Encoding", ""))
+                time.sleep(delay_seconds)
+                if self.path.startswith("/old"):
+                    self.send_response(301)
+                    self.send_header("Location", "/rss.xml")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                elif self.path.startswith("/rss.xml"):
+                    body = gzip.compress(feed)
+                    self.send_response(200)
+                    self.send_header("Content-Encoding", "gzip")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                elif self.path.startswith("/page.html"):
+                    body = gzip.compress(page)
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/html; charset=utf-8")
+                    self.send_header("Content-Encoding", "gzip")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    try:
+                        self.wfile.write(body)
+                    except (BrokenPipeError, ConnectionResetError):
+                        pass
+                elif self.path.startswith("/drip.xml"):
+                    # Each byte arrives well inside the socket timeout, but the body would take minutes.
+                    self.send_response(200)
+                    self.send_header("Content-Length", "10000")
+                    self.end_headers()
+                    try:
+                        for _ in range(10000):
+                            self.wfile.write(b" ")
+                            self.wfile.flush()
+                            time.sleep(0.02)
+                    except (BrokenPipeError, ConnectionResetError):
+                        pass
+                else:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                with lock:
+                    state["active"] -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self.state = state
+        self.feed = feed
+        self.page = page
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def notion_page(page_id: str, properties: dict, last_edited_time: str = "2026-07-01T00:00:00.000Z") -> dict:
+    typed = {}
+    for name, value in properties.items():
+        if name in {"Name", "Signal Title"}:
+            typed[name] = {"type": "title", "title": [{"plain_text": value}]}
+        elif isinstance(value, bool):
+            typed[name] = {"type": "checkbox", "checkbox": value}
+        elif isinstance(value, int):
+            typed[name] = {"type": "number", "number": value}
+        elif name in {"URL", "Source URL"}:
+            typed[name] = {"type": "url", "url": value}
+        else:
+            typed[name] = {"type": "select", "select": {"name": value}}
+    return {"id": page_id, "last_edited_time": last_edited_time, "properties": typed}
+
+
+class FakeNotion:
+    """In-memory Notion API for the collector: a Sources database and a Signal Intake database."""
+
+    def __init__(self, sources: list, intake: list):
+        self.sources = sources
+        self.intake = intake
+        self.calls = []
+        self.fail_writes = False
+        self.fail_intake_queries = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, url, headers, payload, method):
+        with self.lock:
+            self.calls.append((method, url, payload))
+        since = ((payload or {}).get("filter") or {}).get("last_edited_time", {}).get("on_or_after", "")
+        if url.endswith("/databases/sources-db/query"):
+            return {"results": [page for page in self.sources if page["last_edited_time"] >= since], "has_more": False}
+        if url.endswith("/databases/intake-db/query"):
+            if self.fail_intake_queries:
+                self.fail_intake_queries -= 1
+                raise collector.SourceCollectorError("Notion request failed: HTTP Error 502")
+            return {"results": [page for page in self.intake if page["last_edited_time"] >= since], "has_more": False}
+        if url.endswith("/databases/intake-db"):
+            return {"properties": {"Signal Title": {}}}
+        if url.endswith("/databases/sources-db"):
+            return {"properties": {"Name": {}, "Last Fetched At": {}, "Last Success At": {}, "Last Error": {}}}
+        if "/pages/" in url and method == "PATCH":
+            page = next(page for page in self.sources if url.endswith(f"/pages/{page['id']}"))
+            for name, value in payload["properties"].items():
+                if "date" in value:
+                    page["properties"][name] = {"type": "date", "date": value["date"]}
+                else:
+                    text = "".join(item["text"]["content"] for item in value["rich_text"])
+                    page["properties"][name] = {"type": "rich_text", "rich_text": [{"plain_text": text}] if text else []}
+            return {"id": page["id"]}
+        if url.endswith("/pages") and method == "POST":
+            if self.fail_writes:
+                raise collector.SourceCollectorError("Notion request failed: HTTP Error 400")
+            with self.lock:
+                self.intake.append({"id": f"row-{len(self.intake)}", "last_edited_time": "2026-07-02T00:00:00.000Z", "properties": payload["properties"]})
+            return {"id": "created"}
+        return {}
+
+    def intake_queries(self):
+        return [payload for method, url, payload in self.calls if url.endswith("/databases/intake-db/query")]
+
+    def source_queries(self):
+        return [payload for method, url, payload in self.calls if url.endswith("/databases/sources-db/query")]
+
+
 class DysonXSourceCollectorV1Tests(unittest.TestCase):
     def fixture_fetch(self, url: str) -> str:
         mapping = {
@@ -101,6 +263,65 @@ class DysonXSourceCollectorV1Tests(unittest.TestCase):
         self.assertEqual(candidate["Source URL"], "https://example.org/research/agent-benchmark")
         self.assertEqual(candidate["Attribution Status"], "Complete")
 
+    def feed_with_items(self, count: int, tail: str = "</channel></rss>") -> str:
+        items = "".join(
+            f"<item><title>Agent benchmark update {index}</title><link>https://example.org/agent/{index}</link>"
+            f"<description>{'Agent benchmark metadata summary. ' * 20}</description></item>"
+            for index in range(count)
+        )
+        return f"<rss><channel><title>Feed</title>{items}{tail}"
+
+    def test_feed_parser_stops_after_entry_cap(self):
+        source = collector.source_from_record(load_records("source_registry_sample.json")[0])
+        feed = self.feed_with_items(25, tail="<item><title>broken")
+
+        items = collector.parse_feed_items(feed, source)
+
+        self.assertEqual(len(items), collector.FEED_ENTRY_LIMIT)
+        self.assertEqual(items[-1].title, "Agent benchmark update 19")
+
+    def test_feed_parser_consumes_large_feed_incrementally(self):
+        source = collector.source_from_record(load_records("source_registry_sample.json")[0])
+        feed = self.feed_with_items(3000)
+        feed_calls = []
+        real_parser = collector.feed_pull_parser
+
+        def counting_parser():
+            parser = real_parser()
+
+            class CountingParser:
+                def feed(self, data):
+                    feed_calls.append(len(data))
+                    parser.feed(data)
+
+                def __getattr__(self, name):
+                    return getattr(parser, name)
+
+            return CountingParser()
+
+        with mock.patch.object(collector, "feed_pull_parser", counting_parser):
+            items = collector.parse_feed_items(feed, source)
+
+        self.assertEqual(len(items), collector.FEED_ENTRY_LIMIT)
+        self.assertLess(sum(feed_calls), len(feed.encode("utf-8")) // 10)
+
+    def test_malformed_feed_raises_collector_error(self):
+        source = collector.source_from_record(load_records("source_registry_sample.json")[0])
+
+        with self.assertRaises(collector.SourceCollectorError):
+            collector.parse_feed_items(self.feed_with_items(2, tail="</channel>"), source)
+
+    @unittest.skipIf(collector.LXML_ETREE is None, "lxml is not installed")
+    def test_lxml_and_stdlib_feed_backends_agree(self):
+        source = collector.source_from_record(load_records("source_registry_sample.json")[0])
+        feed = self.feed_with_items(30)
+
+        accelerated = collector.parse_feed_items(feed, source)
+        with mock.patch.object(collector, "LXML_ETREE", None):
+            fallback = collector.parse_feed_items(feed, source)
+
+        self.assertEqual(accelerated, fallback)
+
     def test_unsupported_source_is_skipped(self):
         sources = [load_records("source_registry_sample.json")[5]]
         result = collector.build_candidates(sources, [], fetch=self.fixture_fetch)
@@ -194,6 +415,163 @@ class DysonXSourceCollectorV1Tests(unittest.TestCase):
         self.assertEqual(result["source_results"][0]["fetched_url"], "https://developer.nvidia.com/blog/feed/")
         self.assertTrue(result["source_results"][0]["fallback_used"])
 
+    def blocked_openai_source(self):
+        return collector.SourceRecord(
+            notion_page_id="openai-source",
+            name="OpenAI Blog",
+            url="https://openai.com/blog",
+            source_type="Official Website",
+            platform="Website",
+            priority="Critical",
+            authority_score=95,
+            enabled=True,
+        )
+
+    def recording_fetch(self, responses: dict):
+        calls = []
+
+        def fetch(url: str) -> str:
+            calls.append(url)
+            response = responses.get(url)
+            if response is None or isinstance(response, Exception):
+                raise response or collector.SourceCollectorError(f"unexpected fetch URL: {url}")
+            return response
+
+        return fetch, calls
+
+    def test_endpoint_health_prefers_known_good_fallback_until_primary_reprobe(self):
+        source = self.blocked_openai_source()
+        feed = (FIXTURES / "rss_feed_sample.xml").read_text(encoding="utf-8")
+        blocked = collector.SourceCollectorError("source fetch failed: HTTP Error 403: Forbidden")
+        fetch, calls = self.recording_fetch({source.url: blocked, "https://openai.com/news/rss.xml": feed})
+        health = collector.EndpointHealth()
+
+        first = collector.collect_source_items(source, fetch=fetch, endpoint_health=health)
+        entry = health.entries["openai-source"]
+        second = collector.collect_source_items(source, fetch=fetch, endpoint_health=health)
+
+        self.assertEqual(calls, [source.url, "https://openai.com/news/rss.xml", "https://openai.com/news/rss.xml"])
+        self.assertFalse(first.primary_probe_skipped)
+        self.assertTrue(second.primary_probe_skipped)
+        self.assertTrue(second.fallback_used)
+        self.assertEqual(entry["preferred_url"], "https://openai.com/news/rss.xml")
+        self.assertEqual(entry["primary_failures"], 1)
+
+    def test_primary_reprobe_delay_doubles_and_resets_on_recovery(self):
+        source = self.blocked_openai_source()
+        now = collector.dt.datetime(2026, 7, 1, tzinfo=collector.dt.timezone.utc)
+        fallbacks = collector.official_metadata_fallback_urls(source)
+        health = collector.EndpointHealth()
+        health.record(source, "https://openai.com/news/rss.xml", primary_failed=True, now=now)
+
+        self.assertEqual(health.endpoint_order(source, fallbacks, now=now + collector.dt.timedelta(hours=5)), (["https://openai.com/news/rss.xml", source.url], True))
+        due = now + collector.dt.timedelta(hours=6)
+        self.assertEqual(health.endpoint_order(source, fallbacks, now=due), ([source.url, "https://openai.com/news/rss.xml"], False))
+
+        health.record(source, "https://openai.com/news/rss.xml", primary_failed=True, now=due)
+        self.assertEqual(health.entries["openai-source"]["next_primary_probe_at"], "2026-07-01T18:00:00Z")
+
+        health.record(source, source.url, primary_failed=False, now=due)
+        self.assertEqual(health.entries, {})
+
+    def test_primary_is_tried_last_when_known_good_endpoint_fails(self):
+        source = self.blocked_openai_source()
+        fetch, calls = self.recording_fetch(
+            {
+                source.url: (FIXTURES / "rss_feed_sample.xml").read_text(encoding="utf-8"),
+                "https://openai.com/news/rss.xml": collector.SourceCollectorError("source fetch failed: HTTP Error 500"),
+            }
+        )
+        health = collector.EndpointHealth()
+        health.record(source, "https://openai.com/news/rss.xml", primary_failed=True)
+
+        collected = collector.collect_source_items(source, fetch=fetch, endpoint_health=health)
+
+        self.assertEqual(calls, ["https://openai.com/news/rss.xml", source.url])
+        self.assertFalse(collected.fallback_used)
+        self.assertEqual(health.entries, {})
+
+    def test_page_head_parser_stops_at_head_and_captures_feed_links(self):
+        head = collector.parse_page_head(
+            """
+            <html><head>
+              <title>Lab news</title>
+              <link rel="alternate" type="application/atom+xml" href="/news/atom.xml">
+              <link rel="alternate" type="text/html" hreflang="fr" href="/fr/news">
+              <link rel="alternate" type="application/rss+xml" href="https://example.org/news/rss.xml">
+            </head>
+            <body><meta name="description" content="Body text is not metadata."></body></html>
+            """
+        )
+
+        self.assertTrue(head.head_closed)
+        self.assertEqual(head.description, "")
+        self.assertEqual(head.feed_urls, ["/news/atom.xml", "https://example.org/news/rss.xml"])
+        self.assertEqual(collector.discovered_feed_url(head, "https://example.org/news"), "https://example.org/news/atom.xml")
+
+    def test_connection_pool_stops_html_download_after_head(self):
+        with FeedServer() as server:
+            pool = collector.HostConnectionPool()
+            try:
+                page = pool.fetch_url(f"{server.base_url}/page.html")
+                feed = pool.fetch_url(f"{server.base_url}/rss.xml")
+            finally:
+                pool.close()
+
+        self.assertTrue(page.head_only)
+        self.assertTrue(page.endswith("</head>"))
+        self.assertLess(page.wire_bytes, 2 * collector.HTML_HEAD_CHUNK_SIZE)
+        self.assertLess(page.decoded_bytes, len(server.page) // 100)
+        self.assertFalse(feed.head_only)
+        self.assertEqual(server.state["connections"], 2)
+
+    def test_discovered_feed_is_promoted_until_it_fails(self):
+        source = collector.SourceRecord("lab-page", "Lab News", "https://example.org/news", "Official Website", "Website", "High", 90, True)
+        page = '<html><head><title>Lab news</title><link rel="alternate" type="application/rss+xml" href="/news/rss.xml"></head></html>'
+        responses = {source.url: page, "https://example.org/news/rss.xml": (FIXTURES / "rss_feed_sample.xml").read_text(encoding="utf-8")}
+        fetch, calls = self.recording_fetch(responses)
+        health = collector.EndpointHealth()
+
+        first = collector.collect_source_items(source, fetch=fetch, endpoint_health=health)
+        second = collector.collect_source_items(source, fetch=fetch, endpoint_health=health)
+        responses["https://example.org/news/rss.xml"] = collector.SourceCollectorError("source fetch failed: HTTP Error 404")
+        third = collector.collect_source_items(source, fetch=fetch, endpoint_health=health)
+        fourth = collector.collect_source_items(source, fetch=fetch, endpoint_health=health)
+
+        self.assertEqual(first.discovered_feed_url, "https://example.org/news/rss.xml")
+        self.assertEqual(len(first.items), 1)
+        self.assertTrue(second.feed_promoted)
+        self.assertGreater(len(second.items), 1)
+        self.assertFalse(third.feed_promoted)
+        self.assertEqual(third.fetched_url, source.url)
+        self.assertEqual(fourth.fetched_url, source.url)
+        self.assertEqual(calls, [source.url, "https://example.org/news/rss.xml", "https://example.org/news/rss.xml", source.url, source.url])
+        self.assertEqual(health.entries["lab-page"], {"rejected_feed_url": "https://example.org/news/rss.xml"})
+
+    def test_endpoint_health_persists_through_state_dir(self):
+        source = self.blocked_openai_source()
+        health = collector.EndpointHealth()
+        health.record(source, "https://openai.com/news/rss.xml", primary_failed=True)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = pathlib.Path(tmpdir) / collector.ENDPOINT_HEALTH_FILENAME
+            health.save(path)
+
+            self.assertEqual(collector.EndpointHealth.load(path).entries, health.entries)
+
+    def test_fallback_registry_rules_require_every_named_condition(self):
+        registry = (
+            {"hosts": (".example.org",), "path_contains": ("news",), "fallback_url": "https://example.org/news/feed.xml"},
+            {"name_contains": ("example lab",), "fallback_url": "https://lab.example.org/rss"},
+        )
+        source = collector.SourceRecord("p", "Example Lab News", "https://www.example.org/news/latest", "Website", "Website", "High", 90, True)
+        blog = collector.replace(source, url="https://www.example.org/blog", name="Example Blog")
+
+        self.assertEqual(
+            collector.official_metadata_fallback_urls(source, registry),
+            ["https://example.org/news/feed.xml", "https://lab.example.org/rss"],
+        )
+        self.assertEqual(collector.official_metadata_fallback_urls(blog, registry), [])
+
     def test_source_disconnect_is_reported_without_aborting_collection(self):
         source = collector.SourceRecord(
             notion_page_id="disconnect-source",
@@ -274,6 +652,61 @@ class DysonXSourceCollectorV1Tests(unittest.TestCase):
         for candidate in result["candidates"]:
             self.assertLessEqual(len(candidate["Summary"]), 260)
 
+    def classifier_item(self, title: str, summary: str, **overrides) -> collector.SourceItem:
+        fields = {
+            "title": title,
+            "link": "https://example.org/lab/update",
+            "published_date": "2026-06-27T08:00:00Z",
+            "summary": summary,
+            "source_name": "Official Lab",
+            "source_url": "https://example.org/lab",
+            "source_type": "RSS",
+            "priority": "Critical",
+            "authority_score": 95,
+            "attribution_complete": True,
+        }
+        fields.update(overrides)
+        return collector.SourceItem(**fields)
+
+    def test_classifier_matches_whole_words_only(self):
+        features = collector.item_features(self.classifier_item("Operations said to maintain office hours", "The team said nothing new."))
+
+        self.assertEqual(features.relevance, "Low")
+        self.assertEqual(features.keywords, frozenset())
+        self.assertEqual(features.category, "Market Signal")
+
+        features = collector.item_features(self.classifier_item("Foundation models under new AI policies", "Evals for frontier systems."))
+        self.assertEqual(features.relevance, "High")
+        self.assertEqual(features.category, "Policy")
+        self.assertTrue({"foundation models", "ai", "policies", "evals"} <= features.keywords)
+
+    def test_candidate_features_are_computed_once(self):
+        item = self.classifier_item("Agent safety evaluation update", "Agent safety evaluation metadata summary.")
+        with mock.patch.object(collector, "item_features", wraps=collector.item_features) as features:
+            candidate = collector.candidate_from_item(item)
+
+        features.assert_called_once_with(item)
+        self.assertEqual(candidate["AGI Relevance"], "High")
+        self.assertEqual(candidate["Category"], "Safety")
+        self.assertTrue(candidate["Published"])
+
+    def test_raw_marker_blocks_auto_publish_on_word_boundary(self):
+        drawing = collector.candidate_from_item(self.classifier_item("Drawing agent safety evaluation", "Agent safety evaluation."))
+        raw = collector.candidate_from_item(self.classifier_item("Agent safety evaluation", "Raw transcript of the agent safety evaluation."))
+        raw_link = collector.candidate_from_item(
+            self.classifier_item("Agent safety evaluation", "Agent safety evaluation.", link="https://example.org/raw/agent-safety")
+        )
+
+        self.assertTrue(drawing["Published"])
+        self.assertFalse(raw["Published"])
+        self.assertFalse(raw_link["Published"])
+
+    def test_classifier_benchmark_matches_previous_candidates(self):
+        report = collector_benchmark.run_classifier_benchmark(item_count=40, repeats=1)
+
+        self.assertTrue(report["candidates_identical"])
+        self.assertGreater(report["after_microseconds_per_item"], 0)
+
     def test_duplicate_source_url_is_skipped(self):
         sources = [load_records("source_registry_sample.json")[0]]
         existing = load_records("existing_signal_intake_sample.json")
@@ -460,6 +893,1008 @@ class DysonXSourceCollectorV1Tests(unittest.TestCase):
             self.assertIn(properties["Status"]["select"]["name"], allowed_statuses)
             self.assertIn(properties["Attribution Status"]["select"]["name"], allowed_attribution)
 
+    def test_concurrent_collection_matches_serial_report(self):
+        sources = load_records("source_registry_sample.json")
+        serial = collector.build_candidates(sources, [], fetch=self.fixture_fetch)
+        concurrent = collector.build_candidates(sources, [], fetch=self.fixture_fetch, max_concurrency=4)
+
+        self.assertEqual(json.dumps(concurrent, sort_keys=True), json.dumps(serial, sort_keys=True))
+        self.assertEqual([item["source"] for item in concurrent["source_results"]], [collector.source_from_record(record).name for record in sources])
+
+    def test_concurrent_collection_reports_errors_in_source_order(self):
+        sources = [
+            collector.asdict(
+                collector.SourceRecord(
+                    notion_page_id=f"source-{index}",
+                    name=f"AI Source {index}",
+                    url=f"https://example.org/{index}",
+                    source_type="RSS",
+                    platform="RSS",
+                    priority="High",
+                    authority_score=90,
+                    enabled=True,
+                )
+            )
+            for index in range(4)
+        ]
+
+        def fetch(url: str) -> str:
+            if url.endswith("/1"):
+                raise OSError("connection reset")
+            return (FIXTURES / "rss_feed_sample.xml").read_text(encoding="utf-8")
+
+        result = collector.build_candidates(sources, [], fetch=fetch, max_concurrency=3)
+
+        self.assertEqual([item["status"] for item in result["source_results"]], ["collected", "error", "collected", "collected"])
+        self.assertEqual(result["sources_failed"], 1)
+
+    def test_invalid_max_concurrency_is_rejected(self):
+        with self.assertRaises(collector.SourceCollectorError):
+            collector.collect_sources([], fetch=self.fixture_fetch, max_concurrency=0)
+
+    def test_fixture_benchmark_shows_concurrent_speedup(self):
+        report = collector_benchmark.run_fetch_benchmark(source_count=8, latency_seconds=0.05, max_concurrency=8)
+
+        self.assertTrue(report["reports_identical"])
+        self.assertGreater(report["speedup"], 2.0)
+
+    def test_conditional_fetch_sends_validators_and_reports_not_modified_on_304(self):
+        sources = [load_records("source_registry_sample.json")[0]]
+        feed = (FIXTURES / "rss_feed_sample.xml").read_text(encoding="utf-8")
+        seen_headers = []
+
+        def fetch_response(url: str, headers: dict) -> collector.FetchResponse:
+            seen_headers.append(dict(headers))
+            if headers.get("If-None-Match") == '"v1"':
+                return collector.FetchResponse(status=304, body="", headers={})
+            return collector.FetchResponse(status=200, body=feed, headers={"etag": '"v1"', "last-modified": "Thu, 25 Jun 2026 02:00:00 GMT"})
+
+        cache = collector.HttpValidatorCache()
+        first = collector.build_candidates(sources, [], fetch=collector.conditional_fetcher(cache, fetch_response))
+        second = collector.build_candidates(sources, [], fetch=collector.conditional_fetcher(cache, fetch_response))
+
+        self.assertEqual(first["source_results"][0]["status"], "collected")
+        self.assertEqual(seen_headers[1]["If-Modified-Since"], "Thu, 25 Jun 2026 02:00:00 GMT")
+        self.assertEqual(second["source_results"][0]["status"], "not_modified")
+        self.assertEqual(second["source_results"][0]["not_modified_reason"], "http_304")
+        self.assertEqual(second["bytes_not_downloaded"], len(feed.encode("utf-8")))
+        self.assertEqual(second["sources_not_modified"], 1)
+        self.assertEqual(second["raw_items_seen"], 0)
+
+    def test_identical_body_skips_parsing(self):
+        sources = [load_records("source_registry_sample.json")[0]]
+        cache = collector.HttpValidatorCache()
+        fetch = collector.conditional_fetcher(cache, collector.plain_response_fetcher(self.fixture_fetch))
+
+        collector.build_candidates(sources, [], fetch=fetch)
+        with mock.patch.object(collector, "parse_feed_items", side_effect=AssertionError("parsed unchanged feed")):
+            result = collector.build_candidates(sources, [], fetch=fetch)
+
+        self.assertEqual(result["source_results"][0]["status"], "not_modified")
+        self.assertEqual(result["source_results"][0]["not_modified_reason"], "identical_body")
+        self.assertEqual(result["candidate_count"], 0)
+
+    def test_state_dir_persists_http_cache_between_runs(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fetch_map = pathlib.Path(tmpdir) / "fetch_map.json"
+            fetch_map.write_text(json.dumps({"https://example.org/rss.xml": str(FIXTURES / "rss_feed_sample.xml")}), encoding="utf-8")
+            sources = pathlib.Path(tmpdir) / "sources.json"
+            sources.write_text(json.dumps({"records": [load_records("source_registry_sample.json")[0]]}), encoding="utf-8")
+            output = pathlib.Path(tmpdir) / "candidates.json"
+            args = [
+                "--sources-fixture",
+                str(sources),
+                "--fetch-fixture-map",
+                str(fetch_map),
+                "--state-dir",
+                str(pathlib.Path(tmpdir) / "state"),
+                "--output-candidates",
+                str(output),
+            ]
+
+            self.assertEqual(collector.main(args), 0)
+            self.assertTrue((pathlib.Path(tmpdir) / "state" / collector.HTTP_CACHE_FILENAME).exists())
+            self.assertEqual(collector.main(args), 0)
+            result = json.loads(output.read_text(encoding="utf-8"))
+
+        self.assertEqual(result["sources_not_modified"], 1)
+        self.assertEqual(result["source_results"][0]["status"], "not_modified")
+
+    def test_watermark_prunes_seen_entries_before_items_are_built(self):
+        sources = [load_records("source_registry_sample.json")[0]]
+        watermarks = collector.FeedWatermarks()
+
+        first = collector.build_candidates(sources, [], fetch=self.fixture_fetch, watermarks=watermarks)
+        with mock.patch.object(collector, "short_summary", side_effect=AssertionError("summarised a seen entry")):
+            second = collector.build_candidates(sources, [], fetch=self.fixture_fetch, watermarks=watermarks)
+
+        self.assertEqual(first["watermark_pruned"], 0)
+        self.assertGreater(first["raw_items_seen"], 0)
+        self.assertEqual(second["watermark_pruned"], 2)
+        self.assertEqual(second["source_results"][0]["watermark_pruned"], 2)
+        self.assertEqual((second["raw_items_seen"], second["candidate_count"]), (0, 0))
+        self.assertEqual(watermarks.entries[sources[0]["_notion_page_id"]]["published"], "2026-06-27T09:00:00Z")
+
+    def test_watermark_keeps_newer_entries_and_prunes_older_unseen_ones(self):
+        source = collector.source_from_record(load_records("source_registry_sample.json")[0])
+        feed = """
+        <rss><channel>
+          <item><title>Fresh agent safety benchmark</title><link>https://example.org/fresh</link><pubDate>Sun, 28 Jun 2026 08:00:00 GMT</pubDate></item>
+          <item><title>Seen agent benchmark</title><link>https://example.org/seen</link><pubDate>Sat, 27 Jun 2026 09:00:00 GMT</pubDate></item>
+          <item><title>Late old agent item</title><link>https://example.org/late</link><pubDate>Fri, 26 Jun 2026 09:00:00 GMT</pubDate></item>
+          <item><title>Same-time agent item</title><link>https://example.org/same-time</link><pubDate>2026-06-27T09:00:00Z</pubDate></item>
+        </channel></rss>
+        """
+        watermark = collector.FeedWatermark("2026-06-27T09:00:00Z", frozenset({"https://example.org/seen"}))
+
+        items = collector.parse_feed_items(feed, source, watermark=watermark)
+
+        self.assertEqual([item.link for item in items], ["https://example.org/fresh", "https://example.org/same-time"])
+        self.assertEqual(watermark.pruned, 2)
+        self.assertEqual(watermark.seen_published, "2026-06-28T08:00:00Z")
+
+    def test_state_dir_persists_watermarks_except_on_dry_run(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fetch_map = pathlib.Path(tmpdir) / "fetch_map.json"
+            fetch_map.write_text(json.dumps({"https://example.org/rss.xml": str(FIXTURES / "rss_feed_sample.xml")}), encoding="utf-8")
+            sources = pathlib.Path(tmpdir) / "sources.json"
+            sources.write_text(json.dumps({"records": [load_records("source_registry_sample.json")[0]]}), encoding="utf-8")
+            state_dir = pathlib.Path(tmpdir) / "state"
+            args = ["--sources-fixture", str(sources), "--fetch-fixture-map", str(fetch_map), "--state-dir", str(state_dir)]
+
+            self.assertEqual(collector.main([*args, "--dry-run"]), 0)
+            self.assertFalse((state_dir / collector.WATERMARKS_FILENAME).exists())
+            self.assertEqual(collector.main(args), 0)
+            watermarks = collector.FeedWatermarks.load(state_dir / collector.WATERMARKS_FILENAME)
+
+        self.assertEqual(len(watermarks.entries), 1)
+
+    def scheduled_source(self, name: str, priority: str = "High", frequency: str = "daily"):
+        return collector.SourceRecord(name, name, f"https://{name}.example.org/rss.xml", "RSS", "RSS", priority, 90, True, frequency)
+
+    ARXIV_QUERY = "cat:cs.AI OR cat:cs.LG"
+
+    def arxiv_fixture_fetch(self):
+        mapping = {
+            collector.arxiv_query_url(self.ARXIV_QUERY, start, 2): FIXTURES / f"arxiv_api_page_{page}.xml"
+            for page, start in ((1, 0), (2, 2), (3, 4))
+        }
+        mapping["https://example.org/rss.xml"] = FIXTURES / "rss_feed_sample.xml"
+        fixture_fetch = collector.fixture_fetcher(mapping)
+        calls = []
+
+        def fetch(url: str) -> str:
+            calls.append(url)
+            return fixture_fetch(url)
+
+        return fetch, calls
+
+    def arxiv_source_records(self):
+        arxiv_source = {"Source Type": "arXiv", "Platform": "RSS", "Enabled": True}
+        return [
+            load_records("source_registry_sample.json")[0],
+            dict(arxiv_source, _notion_page_id="src_arxiv_ai", Name="arXiv cs.AI", URL="https://export.arxiv.org/rss/cs.AI", Priority="Critical", **{"Authority Score": 90}),
+            dict(arxiv_source, _notion_page_id="src_arxiv_lg", Name="arXiv cs.LG", URL="https://rss.arxiv.org/rss/cs.LG", Priority="High", **{"Authority Score": 88}),
+        ]
+
+    def test_arxiv_batch_merges_sources_into_one_paged_query_and_dedupes_ids(self):
+        fetch, calls = self.arxiv_fixture_fetch()
+        batch = collector.ArxivBatch(page_size=2, request_interval_seconds=0)
+
+        result = collector.build_candidates(self.arxiv_source_records(), [], fetch=fetch, arxiv_batch=batch)
+
+        self.assertEqual([url for url in calls if url.startswith(collector.ARXIV_API_URL)], [collector.arxiv_query_url(self.ARXIV_QUERY, start, 2) for start in (0, 2, 4)])
+        self.assertEqual(result["arxiv_batch"]["queries"], 1)
+        self.assertEqual(result["arxiv_batch"]["requests"], 3)
+        self.assertEqual(result["arxiv_batch"]["duplicate_arxiv_ids_skipped"], 1)
+        feed, arxiv_ai, arxiv_lg = result["source_results"]
+        self.assertNotIn("arxiv_batched", feed)
+        self.assertTrue(arxiv_ai["arxiv_batched"])
+        # 2606.20003 is primarily cs.CL and reaches the cs.AI source through its cross-listing.
+        self.assertEqual(arxiv_ai["items"], 2)
+        self.assertEqual(arxiv_lg["items"], 2)
+        links = [candidate["Source URL"] for candidate in result["candidates"] if "arxiv.org" in candidate["Source URL"]]
+        self.assertEqual(sorted(links), [f"https://arxiv.org/abs/2606.2000{index}" for index in range(1, 5)])
+        self.assertEqual(batch.entries[self.ARXIV_QUERY], {"newest_published": "2026-06-27T17:00:00Z", "next_start": 0})
+
+    def test_arxiv_batch_resumes_unfinished_sweep_from_saved_offset(self):
+        fetch, calls = self.arxiv_fixture_fetch()
+        sources = [collector.source_from_record(record) for record in self.arxiv_source_records()[1:]]
+        batch = collector.ArxivBatch({self.ARXIV_QUERY: {"newest_published": "2026-06-01T00:00:00Z", "next_start": 0}}, page_size=2, max_pages=1, request_interval_seconds=0)
+
+        batch.collect(sources, fetch)
+        saved = dict(batch.entries[self.ARXIV_QUERY])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = pathlib.Path(tmpdir) / collector.ARXIV_OFFSETS_FILENAME
+            batch.save(path)
+            resumed = collector.ArxivBatch.load(path, page_size=2, max_pages=1, request_interval_seconds=0)
+        outcomes, report = resumed.collect(sources, fetch)
+
+        self.assertEqual(saved, {"newest_published": "2026-06-01T00:00:00Z", "next_start": 2, "sweep_newest": "2026-06-27T17:00:00Z"})
+        self.assertEqual(calls, [collector.arxiv_query_url(self.ARXIV_QUERY, start, 2) for start in (0, 2)])
+        self.assertEqual(report["resumed_queries"], 1)
+        self.assertEqual([item.link for item in outcomes[0].items], ["https://arxiv.org/abs/2606.20003"])
+
+    def test_arxiv_batch_stops_paging_at_deadline_and_saves_offset(self):
+        fetch, calls = self.arxiv_fixture_fetch()
+        sources = [collector.source_from_record(record) for record in self.arxiv_source_records()[1:]]
+        now = [0.0]
+
+        def sleep(seconds):
+            now[0] += seconds
+
+        batch = collector.ArxivBatch({self.ARXIV_QUERY: {"newest_published": "2026-06-01T00:00:00Z", "next_start": 0}}, page_size=2, request_interval_seconds=3.0, sleep=sleep)
+        outcomes, report = batch.collect(sources, fetch, collector.RunDeadline(10.0, clock=lambda: now[0]))
+        expired = collector.ArxivBatch(page_size=2, request_interval_seconds=0)
+        deferred, _ = expired.collect(sources, fetch, collector.RunDeadline(1.0, clock=lambda: now[0]))
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(report["pages_deferred_deadline"], 1)
+        self.assertEqual(batch.entries[self.ARXIV_QUERY]["next_start"], 4)
+        self.assertTrue(all(isinstance(outcome, collector.CollectedSourceItems) for outcome in outcomes))
+        self.assertTrue(all(isinstance(outcome, collector.SourceDeadlineDeferred) for outcome in deferred))
+
+    def test_arxiv_batch_sweep_stops_at_previous_newest_entry(self):
+        fetch, calls = self.arxiv_fixture_fetch()
+        sources = [collector.source_from_record(record) for record in self.arxiv_source_records()[1:]]
+        batch = collector.ArxivBatch({self.ARXIV_QUERY: {"newest_published": "2026-06-27T15:30:00Z", "next_start": 0}}, page_size=2, request_interval_seconds=0)
+
+        outcomes, report = batch.collect(sources, fetch)
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(report["watermark_pruned"], 1)
+        self.assertEqual([len(outcome.items) for outcome in outcomes], [1, 1])
+        self.assertEqual(batch.entries[self.ARXIV_QUERY], {"newest_published": "2026-06-27T17:00:00Z", "next_start": 0})
+
+    def test_arxiv_categories_come_from_category_feed_urls_only(self):
+        def categories(url):
+            return collector.arxiv_categories(collector.SourceRecord("p", "arXiv", url, "arXiv", "RSS", "High", 90, True))
+
+        self.assertEqual(categories("https://export.arxiv.org/rss/cs.AI+cs.LG"), ["cs.AI", "cs.LG"])
+        self.assertEqual(categories("https://arxiv.org/list/astro-ph.GA/recent"), ["astro-ph.GA"])
+        self.assertEqual(categories("https://export.arxiv.org/api/query?search_query=all:agents"), [])
+        self.assertEqual(categories("https://example.org/rss/cs.AI"), [])
+
+    def test_scheduler_learns_interval_within_fetch_frequency_bounds(self):
+        now = [collector.dt.datetime(2026, 7, 1, tzinfo=collector.dt.timezone.utc)]
+        scheduler = collector.FetchScheduler(clock=lambda: now[0])
+        busy, dormant = self.scheduled_source("busy"), self.scheduled_source("dormant")
+
+        for _ in range(6):
+            scheduler.observe(busy, fresh_items=20, new_candidates=5)
+            scheduler.observe(dormant, fresh_items=0, new_candidates=0)
+            now[0] += collector.dt.timedelta(hours=24)
+
+        self.assertEqual(scheduler.interval_hours(busy, scheduler.entries["busy"]), 6.0)
+        self.assertEqual(scheduler.interval_hours(dormant, scheduler.entries["dormant"]), 96.0)
+        self.assertEqual(scheduler.entries["busy"]["yield"], 1.0)
+        self.assertEqual(scheduler.entries["dormant"]["yield"], 0.0)
+        self.assertEqual(scheduler.entries["dormant"]["next_due_at"], "2026-07-10T00:00:00Z")
+
+    def test_scheduler_spends_fetch_budget_on_highest_priority_due_sources(self):
+        scheduler = collector.FetchScheduler()
+        sources = [self.scheduled_source("medium", "Medium"), self.scheduled_source("critical", "Critical"), self.scheduled_source("high")]
+
+        decisions = scheduler.plan(sources, fetch_budget=2)
+
+        self.assertEqual([decision["due"] for decision in decisions], [False, True, True])
+        self.assertEqual(decisions[0]["reason"], "fetch_budget_exhausted")
+        self.assertEqual(decisions[1]["reason"], "no_history")
+
+    def test_adaptive_schedule_defers_recently_fetched_sources_in_report(self):
+        sources = [load_records("source_registry_sample.json")[0]]
+        scheduler = collector.FetchScheduler()
+
+        first = collector.build_candidates(sources, [], fetch=self.fixture_fetch, scheduler=scheduler)
+        second = collector.build_candidates(sources, [], fetch=self.fixture_fetch, scheduler=scheduler)
+
+        self.assertEqual(first["source_results"][0]["status"], "collected")
+        self.assertTrue(first["source_results"][0]["schedule"]["next_due_at"])
+        self.assertEqual(second["source_results"][0]["status"], "skipped")
+        self.assertEqual(second["source_results"][0]["reason"], "schedule_not_due")
+        self.assertEqual(second["schedule"], {"fetch_budget": None, "sources_due": 0, "sources_not_due": 1, "sources_deferred_by_budget": 0})
+        self.assertEqual(scheduler.entries[sources[0]["_notion_page_id"]]["fetches"], 1)
+
+    def test_merged_shard_reports_match_single_run_byte_for_byte(self):
+        records = load_records("source_registry_sample.json")
+        fetch_map = {
+            "https://example.org/rss.xml": str(FIXTURES / "rss_feed_sample.xml"),
+            "https://export.arxiv.org/rss/cs.AI": str(FIXTURES / "arxiv_feed_sample.xml"),
+            "https://example.org/medium-rss.xml": str(FIXTURES / "rss_feed_sample.xml"),
+        }
+        for index in range(6):
+            url = f"https://mirror-{index}.example.net/feed.xml"
+            records.append({"_notion_page_id": f"mirror_{index}", "Name": f"Mirror {index}", "URL": url, "Source Type": "RSS", "Priority": "High", "Authority Score": 90, "Enabled": True})
+            fetch_map[url] = str(FIXTURES / ("rss_feed_sample.xml", "arxiv_feed_sample.xml")[index % 2])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp = pathlib.Path(tmpdir)
+            (tmp / "sources.json").write_text(json.dumps({"records": records}), encoding="utf-8")
+            (tmp / "fetch_map.json").write_text(json.dumps(fetch_map), encoding="utf-8")
+            common = ["--sources-fixture", str(tmp / "sources.json"), "--fetch-fixture-map", str(tmp / "fetch_map.json"), "--arxiv-batch"]
+            existing = ["--existing-signal-intake-fixture", str(FIXTURES / "existing_signal_intake_sample.json")]
+            with mock.patch("sys.stdout"):
+                self.assertEqual(collector.main([*common, *existing, "--output-candidates", str(tmp / "single.json")]), 0)
+                for index in range(3):
+                    shard_args = ["--shard-index", str(index), "--shard-count", "3", "--output-candidates", str(tmp / f"shard-{index}.json")]
+                    self.assertEqual(collector.main([*common, *shard_args]), 0)
+                shards = [str(tmp / f"shard-{index}.json") for index in range(3)]
+                self.assertEqual(collector.main(["--merge-shards", *shards, *existing, "--output-candidates", str(tmp / "merged.json")]), 0)
+            with mock.patch("sys.stderr"):
+                self.assertEqual(collector.main(["--merge-shards", *shards[:2], *existing]), 2)
+            shard_sizes = [len(json.loads(pathlib.Path(path).read_text(encoding="utf-8"))["source_indices"]) for path in shards]
+            single = (tmp / "single.json").read_bytes()
+            merged = (tmp / "merged.json").read_bytes()
+
+        self.assertEqual(sum(shard_sizes), len(records))
+        self.assertGreater(sum(1 for size in shard_sizes if size), 1)
+        self.assertGreater(json.loads(single)["duplicates_skipped"], 0)
+        self.assertEqual(merged, single)
+
+    def test_shard_state_stays_pending_until_the_merge_commits_it(self):
+        records = load_records("source_registry_sample.json")
+        fetch_map = {
+            "https://example.org/rss.xml": str(FIXTURES / "rss_feed_sample.xml"),
+            "https://export.arxiv.org/rss/cs.AI": str(FIXTURES / "arxiv_feed_sample.xml"),
+            "https://example.org/medium-rss.xml": str(FIXTURES / "rss_feed_sample.xml"),
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp = pathlib.Path(tmpdir)
+            state_dir = tmp / "state"
+            (tmp / "fetch_map.json").write_text(json.dumps(fetch_map), encoding="utf-8")
+            common = [
+                "--sources-fixture", str(FIXTURES / "source_registry_sample.json"),
+                "--fetch-fixture-map", str(tmp / "fetch_map.json"),
+                "--state-dir", str(state_dir),
+                "--adaptive-schedule",
+            ]
+            existing = ["--existing-signal-intake-fixture", str(FIXTURES / "existing_signal_intake_sample.json")]
+            shards = [tmp / f"shard-{index}.json" for index in range(2)]
+            with mock.patch("sys.stdout"):
+                for index, shard in enumerate(shards):
+                    self.assertEqual(collector.main([*common, "--shard-index", str(index), "--shard-count", "2", "--output-candidates", str(shard)]), 0)
+                pending = [json.loads(collector.shard_state_path(shard).read_text(encoding="utf-8")) for shard in shards]
+                committed_before_merge = [(state_dir / name).exists() for name in (collector.HTTP_CACHE_FILENAME, collector.WATERMARKS_FILENAME, collector.SCHEDULE_FILENAME)]
+                merge = ["--merge-shards", *map(str, shards), *existing, "--state-dir", str(state_dir)]
+                self.assertEqual(collector.main([*merge, "--dry-run", "--output-candidates", str(tmp / "dry.json")]), 0)
+                dry_state = json.loads((tmp / "dry.json").read_text(encoding="utf-8"))["shard_state"]
+                self.assertEqual(collector.main([*merge, "--output-candidates", str(tmp / "merged.json")]), 0)
+            merged = json.loads((tmp / "merged.json").read_text(encoding="utf-8"))
+            http_cache = collector.HttpValidatorCache.load(state_dir / collector.HTTP_CACHE_FILENAME)
+            schedule = collector.FetchScheduler.load(state_dir / collector.SCHEDULE_FILENAME)
+            pending_left = [collector.shard_state_path(shard).exists() for shard in shards]
+
+        fetched_urls = {url for state in pending for url in state["entries"]["http_cache"]}
+        self.assertEqual(committed_before_merge, [False, False, False])
+        self.assertEqual(dry_state["applied"], False)
+        self.assertTrue(merged["shard_state"]["applied"])
+        self.assertEqual(merged["shard_state"]["shards_pending"], 2)
+        self.assertTrue(fetched_urls)
+        self.assertEqual(set(http_cache.entries), fetched_urls)
+        observed = [observation["source"]["notion_page_id"] for state in pending for observation in state["schedule_observations"]]
+        self.assertTrue(observed)
+        self.assertEqual({key: schedule.entries[key]["fetches"] for key in observed}, {key: 1 for key in observed})
+        self.assertEqual(pending_left, [False, False])
+
+    def test_shard_runs_split_the_fetch_budget(self):
+        self.assertEqual([collector.shard_fetch_budget(5, index, 3) for index in range(3)], [2, 2, 1])
+        self.assertIsNone(collector.shard_fetch_budget(None, 0, 3))
+        sections = [{"schedule": {"fetch_budget": collector.shard_fetch_budget(5, index, 3), "sources_deferred_by_budget": index}} for index in range(3)]
+        self.assertEqual(collector.merge_report_sections(sections)["schedule"], {"fetch_budget": 5, "sources_deferred_by_budget": 3})
+        unbudgeted = [{"schedule": {"fetch_budget": None, "sources_deferred_by_budget": 0}} for _ in range(2)]
+        self.assertIsNone(collector.merge_report_sections(unbudgeted)["schedule"]["fetch_budget"])
+
+    def test_shard_partition_keeps_hosts_and_arxiv_categories_together(self):
+        sources = [
+            collector.SourceRecord("a1", "A1", "https://a.example/one.xml", "RSS", "RSS", "High", 90, True),
+            collector.SourceRecord("a2", "A2", "https://a.example/two.xml", "RSS", "RSS", "High", 90, True),
+            collector.SourceRecord("x1", "X1", "https://export.arxiv.org/rss/cs.AI", "arXiv", "RSS", "High", 90, True),
+            collector.SourceRecord("x2", "X2", "https://rss.arxiv.org/rss/cs.LG", "arXiv", "RSS", "High", 90, True),
+        ]
+
+        for count in (2, 3, 7):
+            shards = [collector.source_shard(source, count) for source in sources]
+            self.assertEqual(shards[0], shards[1])
+            self.assertEqual(shards[2], shards[3])
+            self.assertTrue(all(0 <= shard < count for shard in shards))
+        self.assertEqual(collector.shard_key(sources[0]), "a.example")
+
+    def test_adaptive_schedule_requires_state_dir(self):
+        with mock.patch("sys.stderr"):
+            self.assertEqual(collector.main(["--sources-fixture", str(FIXTURES / "source_registry_sample.json"), "--adaptive-schedule"]), 2)
+
+    def test_connection_pool_reuses_connections_and_decodes_gzip(self):
+        with FeedServer() as server:
+            pool = collector.HostConnectionPool()
+            try:
+                first = pool.fetch_url(f"{server.base_url}/rss.xml")
+                second = pool.fetch_url(f"{server.base_url}/old")
+            finally:
+                pool.close()
+
+        self.assertEqual(first, server.feed.decode("utf-8"))
+        self.assertEqual(second, first)
+        self.assertEqual(server.state["connections"], 1)
+        self.assertEqual(server.state["encodings"][0], "gzip, deflate")
+        self.assertEqual(first.decoded_bytes, len(server.feed))
+        self.assertLess(first.wire_bytes, first.decoded_bytes)
+
+    def test_connection_pool_enforces_per_host_cap(self):
+        with FeedServer(delay_seconds=0.05) as server:
+            pool = collector.HostConnectionPool(max_connections_per_host=2)
+            try:
+                urls = [f"{server.base_url}/rss.xml?page={index}" for index in range(6)]
+                with collector.ThreadPoolExecutor(max_workers=6) as executor:
+                    list(executor.map(pool.fetch_url, urls))
+            finally:
+                pool.close()
+
+        self.assertLessEqual(server.state["max_active"], 2)
+        self.assertLessEqual(server.state["connections"], 2)
+
+    def test_connection_pool_spaces_requests_to_the_same_host(self):
+        now = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        with FeedServer() as server:
+            pool = collector.HostConnectionPool(min_request_interval_seconds=1.0, clock=lambda: now[0], sleep=sleep)
+            other_host = server.base_url.replace("127.0.0.1", "localhost")
+            try:
+                pool.fetch_url(f"{server.base_url}/rss.xml")
+                pool.fetch_url(f"{other_host}/rss.xml")
+                pool.fetch_url(f"{server.base_url}/rss.xml?page=2")
+                pool.fetch_url(f"{server.base_url}/rss.xml?page=3")
+            finally:
+                pool.close()
+
+        self.assertEqual(sleeps, [1.0, 1.0])
+        self.assertEqual(pool.spacing_wait_seconds, 2.0)
+
+    def test_sources_are_fetched_round_robin_across_hosts(self):
+        urls = ["https://a.example/1", "https://a.example/2", "https://b.example/1", "https://a.example/3", "https://c.example/1"]
+        sources = [collector.SourceRecord(f"p{index}", f"S{index}", url, "RSS", "RSS", "High", 90, True) for index, url in enumerate(urls)]
+        calls = []
+
+        def fetch(url: str) -> str:
+            calls.append(url)
+            return (FIXTURES / "rss_feed_sample.xml").read_text(encoding="utf-8")
+
+        outcomes = collector.collect_sources(sources, fetch=fetch)
+
+        self.assertEqual(collector.host_interleaved_order(sources), [0, 2, 4, 1, 3])
+        self.assertEqual(calls, [urls[0], urls[2], urls[4], urls[1], urls[3]])
+        self.assertEqual([outcome.fetched_url for outcome in outcomes], urls)
+
+    def test_circuit_opens_after_consecutive_failures_and_persists(self):
+        records = [
+            {"_notion_page_id": f"dead-{index}", "Name": f"Dead Feed {index}", "URL": f"https://dead.example/feed-{index}.xml", "Source Type": "RSS", "Priority": "High", "Authority Score": 90, "Enabled": True}
+            for index in range(4)
+        ]
+        calls = []
+
+        def fetch(url: str) -> str:
+            calls.append(url)
+            raise TimeoutError("timed out")
+
+        circuits = collector.HostCircuitBreaker(failure_threshold=3)
+        first = collector.build_candidates(records, [], fetch=fetch, circuits=circuits)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = pathlib.Path(tmpdir) / collector.CIRCUITS_FILENAME
+            circuits.save(path)
+            reloaded = collector.HostCircuitBreaker.load(path, failure_threshold=3)
+        second = collector.build_candidates(records, [], fetch=fetch, circuits=reloaded)
+
+        self.assertEqual(len(calls), 3)
+        self.assertEqual([item["status"] for item in first["source_results"]], ["error", "error", "error", "skipped"])
+        self.assertEqual(first["source_results"][3]["reason"], "circuit_open")
+        self.assertEqual(first["source_results"][3]["circuit_open_hosts"], ["dead.example"])
+        self.assertEqual(first["sources_circuit_open"], 1)
+        self.assertEqual(first["open_circuit_hosts"], ["dead.example"])
+        self.assertEqual(second["sources_circuit_open"], 4)
+        self.assertEqual(second["sources_failed"], 0)
+
+    def test_per_source_errors_do_not_count_against_the_host_circuit(self):
+        records = [
+            {"_notion_page_id": f"gone-{index}", "Name": f"Gone Feed {index}", "URL": f"https://busy.example/gone-{index}.xml", "Source Type": "RSS", "Priority": "High", "Authority Score": 90, "Enabled": True}
+            for index in range(4)
+        ]
+        failures = {
+            records[0]["URL"]: collector.SourceCollectorError("source fetch failed: HTTP Error 404: Not Found"),
+            records[1]["URL"]: collector.SourceCollectorError("source fetch failed: unsupported Content-Encoding 'br'"),
+            records[2]["URL"]: collector.SourceTransportError("source fetch failed: HTTP Error 503: Service Unavailable"),
+            records[3]["URL"]: collector.SourceCollectorError("source fetch failed: HTTP Error 410: Gone"),
+        }
+
+        def fetch(url: str) -> str:
+            raise failures[url]
+
+        circuits = collector.HostCircuitBreaker(failure_threshold=2)
+        health = collector.EndpointHealth()
+        result = collector.build_candidates(records, [], fetch=fetch, circuits=circuits, endpoint_health=health)
+
+        self.assertEqual([item["status"] for item in result["source_results"]], ["error"] * 4)
+        self.assertEqual(circuits.entries["busy.example"]["consecutive_failures"], 1)
+        self.assertEqual(result["open_circuit_hosts"], [])
+        self.assertEqual(sorted(health.entries), ["gone-0", "gone-1", "gone-2", "gone-3"])
+
+    def test_http_status_errors_are_classified_by_host_impact(self):
+        for status, transport in ((404, False), (403, False), (429, True), (500, True), (503, True)):
+            with self.subTest(status=status):
+                error = collector.urllib.error.HTTPError("https://a.example/feed.xml", status, "error", {}, None)
+
+                def fetch(url: str, error=error) -> str:
+                    raise error
+
+                with self.assertRaises(collector.SourceCollectorError) as raised:
+                    collector.collect_from_url(collector.source_from_record({"Name": "A", "URL": "https://a.example/feed.xml", "Enabled": True}), "https://a.example/feed.xml", fetch=fetch)
+                self.assertEqual(isinstance(raised.exception, collector.SourceTransportError), transport)
+
+    def test_circuit_half_opens_after_cooldown_and_backs_off_on_failure(self):
+        now = collector.dt.datetime(2026, 7, 1, tzinfo=collector.dt.timezone.utc)
+        url = "https://flaky.example/feed.xml"
+        circuits = collector.HostCircuitBreaker(failure_threshold=2)
+        error = collector.SourceCollectorError("source fetch failed: HTTP Error 503")
+
+        circuits.record_failure(url, error, now=now)
+        self.assertEqual(circuits.open_until(url, now=now), "")
+        circuits.record_failure(url, error, now=now)
+        self.assertEqual(circuits.open_until(url, now=now), "2026-07-01T06:00:00Z")
+        later = now + collector.dt.timedelta(hours=6)
+        self.assertEqual(circuits.open_until(url, now=later), "")
+        circuits.record_failure(url, error, now=later)
+        self.assertEqual(circuits.open_until(url, now=later), "2026-07-01T18:00:00Z")
+
+        circuits.record_success(url)
+        self.assertEqual(circuits.entries, {})
+
+    def test_deadline_defers_sources_that_no_longer_fit_and_keeps_partial_results(self):
+        now = [0.0]
+        records = [
+            {"_notion_page_id": f"slow-{index}", "Name": f"Slow Feed {index}", "URL": f"https://slow-{index}.example/rss.xml", "Source Type": "RSS", "Priority": "High", "Authority Score": 90, "Enabled": True}
+            for index in range(3)
+        ]
+        timeouts = []
+
+        def fetch(url: str) -> str:
+            timeouts.append(collector.SOURCE_FETCH_TIMEOUT.get())
+            now[0] += 4.0
+            return (FIXTURES / "rss_feed_sample.xml").read_text(encoding="utf-8")
+
+        latency = collector.SourceLatency()
+        deadline = collector.RunDeadline(10.0, clock=lambda: now[0])
+        result = collector.build_candidates(records, [], fetch=fetch, latency=latency, deadline=deadline)
+
+        self.assertEqual([item["status"] for item in result["source_results"]], ["collected", "collected", "deferred_deadline"])
+        self.assertEqual(timeouts, [10.0, 6.0])
+        self.assertEqual(result["source_results"][0]["fetch_seconds"], 4.0)
+        self.assertEqual(result["source_results"][2]["deadline_remaining_seconds"], 2.0)
+        self.assertEqual(result["sources_deferred_deadline"], 1)
+        self.assertEqual(result["deadline"], {"deadline_seconds": 10.0, "remaining_seconds": 2.0})
+        self.assertGreater(result["candidate_count"], 0)
+        self.assertEqual(latency.p95(collector.source_from_record(records[0])), 4.0)
+        self.assertIsNone(latency.p95(collector.source_from_record(records[2])))
+
+    def test_source_timeouts_follow_historical_p95(self):
+        source = collector.SourceRecord("p1", "Feed", "https://feed.example/rss.xml", "RSS", "RSS", "High", 90, True)
+        latency = collector.SourceLatency()
+        self.assertEqual(latency.timeout_for(source), collector.FETCH_TIMEOUT_SECONDS)
+        for seconds in [1.0] * 18 + [3.0, 20.0]:
+            latency.record(source, seconds)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = pathlib.Path(tmpdir) / collector.LATENCY_FILENAME
+            latency.save(path)
+            latency = collector.SourceLatency.load(path)
+
+        self.assertEqual(latency.p95(source), 3.0)
+        self.assertEqual(latency.timeout_for(source), 6.0)
+        seen = []
+        now = [0.0]
+
+        def fetch(url: str) -> str:
+            seen.append(collector.SOURCE_FETCH_TIMEOUT.get())
+            return (FIXTURES / "rss_feed_sample.xml").read_text(encoding="utf-8")
+
+        deadline = collector.RunDeadline(4.5, clock=lambda: now[0])
+        outcome = collector.collect_source_outcome(source, fetch=fetch, latency=latency, deadline=deadline)
+        self.assertIsInstance(outcome, collector.CollectedSourceItems)
+        self.assertEqual(seen, [4.5])
+        now[0] = 2.0
+        deferred = collector.collect_source_outcome(source, fetch=fetch, latency=latency, deadline=deadline)
+        self.assertIsInstance(deferred, collector.SourceDeadlineDeferred)
+        self.assertEqual(deferred.expected_seconds, 3.0)
+        self.assertIsNone(collector.SOURCE_FETCH_TIMEOUT.get())
+
+    def test_connection_pool_applies_per_source_timeout(self):
+        with FeedServer() as server:
+            pool = collector.HostConnectionPool()
+            token = collector.SOURCE_FETCH_TIMEOUT.set(7.0)
+            try:
+                pool.fetch_url(f"{server.base_url}/rss.xml")
+                idle = [connection for connections in pool._idle.values() for connection in connections]
+            finally:
+                collector.SOURCE_FETCH_TIMEOUT.reset(token)
+                pool.close()
+
+        self.assertEqual([connection.timeout for connection in idle], [7.0])
+
+    def test_slow_drip_body_cannot_outlast_the_source_timeout_or_run_deadline(self):
+        with FeedServer() as server:
+            pool = collector.HostConnectionPool()
+            url = f"{server.base_url}/drip.xml"
+            try:
+                token = collector.SOURCE_FETCH_TIMEOUT.set(0.3)
+                started = time.monotonic()
+                try:
+                    with self.assertRaises(collector.SourceTransportError):
+                        pool.fetch_url(url)
+                finally:
+                    collector.SOURCE_FETCH_TIMEOUT.reset(token)
+                timed_out_after = time.monotonic() - started
+
+                deadline = collector.RunDeadline(0.3)
+                token = collector.SOURCE_RUN_DEADLINE.set(deadline)
+                started = time.monotonic()
+                try:
+                    with self.assertRaises(collector.SourceTransportError):
+                        pool.fetch_url(url)
+                finally:
+                    collector.SOURCE_RUN_DEADLINE.reset(token)
+                deadline_after = time.monotonic() - started
+            finally:
+                pool.close()
+
+        self.assertLess(timed_out_after, 1.0)
+        self.assertLess(deadline_after, 1.0)
+
+    def test_connection_pool_http_error_raises_collector_error(self):
+        with FeedServer() as server:
+            pool = collector.HostConnectionPool()
+            try:
+                with self.assertRaisesRegex(collector.SourceCollectorError, "HTTP Error 404"):
+                    pool.fetch_url(f"{server.base_url}/missing")
+            finally:
+                pool.close()
+
+    def test_source_results_report_wire_and_decoded_bytes(self):
+        with FeedServer() as server:
+            pool = collector.HostConnectionPool()
+            record = dict(load_records("source_registry_sample.json")[0], URL=f"{server.base_url}/rss.xml")
+            try:
+                result = collector.build_candidates([record], [], fetch=pool.fetch_url)
+            finally:
+                pool.close()
+
+        source_result = result["source_results"][0]
+        self.assertEqual(source_result["decoded_bytes"], len(server.feed))
+        self.assertLess(source_result["wire_bytes"], source_result["decoded_bytes"])
+        self.assertEqual(result["wire_bytes"], source_result["wire_bytes"])
+
+    def test_deflate_and_raw_deflate_bodies_are_decoded(self):
+        body = b"<rss><channel></channel></rss>"
+        raw_deflate = collector.zlib.compressobj(wbits=-collector.zlib.MAX_WBITS)
+
+        self.assertEqual(collector.decode_content(collector.zlib.compress(body), "deflate"), body)
+        self.assertEqual(collector.decode_content(raw_deflate.compress(body) + raw_deflate.flush(), "deflate"), body)
+
+    def test_signal_intake_schema_is_fetched_once_for_bulk_writes(self):
+        sources = load_records("source_registry_sample.json")[:3]
+        candidates = collector.build_candidates(sources, [], fetch=self.fixture_fetch)["candidates"]
+        calls = []
+        lock = threading.Lock()
+
+        def transport(url, headers, payload, method):
+            with lock:
+                calls.append((method, url))
+            if method == "GET":
+                return {"properties": {"Signal Title": {}, "Source Priority": {}}}
+            return {"id": "page"}
+
+        client = collector.NotionClient("token", "sources-db", "intake-db", transport=transport)
+        writes = client.create_signal_intake_rows(candidates)
+
+        self.assertEqual(sum(1 for method, _ in calls if method == "GET"), 1)
+        self.assertEqual(sum(1 for method, _ in calls if method == "POST"), len(candidates))
+        self.assertEqual([item["title"] for item in writes], [item["Signal Title"] for item in candidates])
+        self.assertTrue(all(item["status"] == "created" for item in writes))
+
+    def test_bulk_write_reports_row_failures_without_aborting(self):
+        candidates = collector.build_candidates(load_records("source_registry_sample.json")[:3], [], fetch=self.fixture_fetch)["candidates"]
+        failing_title = candidates[0]["Signal Title"]
+
+        def transport(url, headers, payload, method):
+            if method == "GET":
+                return {"properties": {}}
+            if payload["properties"]["Signal Title"]["title"][0]["text"]["content"] == failing_title:
+                raise collector.SourceCollectorError("Notion request failed: HTTP Error 400: Bad Request")
+            return {"id": "page"}
+
+        client = collector.NotionClient("token", "sources-db", "intake-db", transport=transport)
+        writes = client.create_signal_intake_rows(candidates, max_workers=2)
+
+        self.assertEqual(writes[0]["status"], "error")
+        self.assertIn("HTTP Error 400", writes[0]["error"])
+        self.assertTrue(all(item["status"] == "created" for item in writes[1:]))
+
+    def fake_notion(self, intake=None):
+        source = load_records("source_registry_sample.json")[0]
+        sources = [notion_page("src_high_rss", {key: value for key, value in source.items() if not key.startswith("_")})]
+        return FakeNotion(sources, intake if intake is not None else [])
+
+    def test_dedupe_index_refreshes_incrementally_after_first_full_read(self):
+        old_row = notion_page(
+            "old",
+            {"Signal Title": "Agent evaluation benchmark improves reliability scoring", "Source URL": "https://example.org/research/agent-evaluation-benchmark"},
+            last_edited_time="2026-06-01T00:00:00.000Z",
+        )
+        older_row = notion_page(
+            "older",
+            {"Signal Title": "Unrelated archived signal", "Source URL": "https://example.org/archive/unrelated"},
+            last_edited_time="2026-05-01T00:00:00.000Z",
+        )
+        fake = self.fake_notion([older_row, old_row])
+        client = collector.NotionClient("token", "sources-db", "intake-db", transport=fake)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_dir = pathlib.Path(tmpdir)
+            first = collector.run_notion_collection(client, self.fixture_fetch, state_dir=state_dir)
+            index = json.loads((state_dir / collector.DEDUPE_INDEX_FILENAME).read_text(encoding="utf-8"))
+            second = collector.run_notion_collection(client, self.fixture_fetch, state_dir=state_dir)
+
+        self.assertEqual(first["dedupe_index"]["mode"], "full")
+        self.assertEqual(first["signal_intake_rows_created"], 1)
+        self.assertIn("url:https://example.org/research/agent-evaluation-benchmark", index["keys"])
+        self.assertEqual(index["synced_through"], "2026-06-01T00:00:00.000Z")
+        self.assertNotIn("filter", fake.intake_queries()[0])
+        self.assertEqual(
+            fake.intake_queries()[1]["filter"],
+            {"timestamp": "last_edited_time", "last_edited_time": {"on_or_after": "2026-06-01T00:00:00.000Z"}},
+        )
+        self.assertEqual(second["dedupe_index"]["mode"], "incremental")
+        # The boundary row and the row created by the first run; the older row is not re-read.
+        self.assertEqual(first["dedupe_index"]["rows_read"], 2)
+        self.assertEqual(second["dedupe_index"]["rows_read"], 2)
+        self.assertEqual(second["candidate_count"], 0)
+        self.assertEqual(second["skipped_by_reason"]["duplicate_source_url"], 2)
+
+    def test_dedupe_index_reconcile_forces_full_read(self):
+        fake = self.fake_notion()
+        client = collector.NotionClient("token", "sources-db", "intake-db", transport=fake)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_dir = pathlib.Path(tmpdir)
+            collector.run_notion_collection(client, self.fixture_fetch, state_dir=state_dir)
+            result = collector.run_notion_collection(client, self.fixture_fetch, state_dir=state_dir, reconcile_dedupe_index=True)
+
+        self.assertEqual(result["dedupe_index"]["mode"], "full")
+        self.assertNotIn("filter", fake.intake_queries()[-1])
+
+    def test_source_status_writes_are_coalesced_and_skip_unchanged_sources(self):
+        fake = self.fake_notion()
+        fake.sources.append(
+            notion_page("src_broken", {"Name": "Broken Feed", "URL": "https://example.org/broken.xml", "Source Type": "RSS", "Priority": "High", "Authority Score": 90, "Enabled": True, "Fetch Frequency": "6 hours"})
+        )
+        client = collector.NotionClient("token", "sources-db", "intake-db", transport=fake)
+
+        def patches():
+            return [url.rsplit("/", 1)[1] for method, url, _ in fake.calls if method == "PATCH"]
+
+        collector.run_notion_collection(client, self.fixture_fetch, dry_run=True, write_source_status=True)
+        self.assertEqual(patches(), [])
+        first = collector.run_notion_collection(client, self.fixture_fetch, write_source_status=True)
+        self.assertEqual(collector.run_notion_collection(client, self.fixture_fetch, write_source_status=True)["source_status_writes"]["sources_recorded"], 0)
+        # Make both sources due again on the adaptive schedule while their recorded status is still fresh.
+        seven_hours_ago = collector.iso_timestamp(collector.dt.datetime.now(collector.dt.timezone.utc) - collector.dt.timedelta(hours=7))
+        scheduler = collector.FetchScheduler({key: {"last_fetched_at": seven_hours_ago} for key in ("src_high_rss", "src_broken")})
+        second = collector.run_notion_collection(client, self.fixture_fetch, scheduler=scheduler, write_source_status=True)
+        self.assertEqual(sorted(patches()), ["src_broken", "src_high_rss"])
+        # Without the schedule, Fetch Frequency reads Last Fetched At, so a due source always gets a fresh timestamp.
+        for page in fake.sources:
+            page["properties"]["Last Fetched At"] = {"type": "date", "date": {"start": seven_hours_ago}}
+        third = collector.run_notion_collection(client, self.fixture_fetch, write_source_status=True)
+
+        self.assertEqual(first["source_status_writes"]["patches_sent"], 2)
+        self.assertEqual(second["source_status_writes"], {"sources_recorded": 2, "patches_sent": 0, "patches_skipped_unchanged": 2, "patches_failed": 0, "errors": []})
+        self.assertEqual(third["source_status_writes"]["patches_sent"], 2)
+        self.assertEqual(collector.run_notion_collection(client, self.fixture_fetch, write_source_status=True)["source_status_writes"]["sources_recorded"], 0)
+        broken = collector.source_from_record(collector.notion_page_to_record(fake.sources[1]))
+        self.assertIn("missing fixture", broken.last_error)
+        self.assertEqual(broken.last_success_at, "")
+
+    def test_source_status_writer_refreshes_stale_timestamps_and_status_changes(self):
+        now = collector.dt.datetime(2026, 7, 2, 12, tzinfo=collector.dt.timezone.utc)
+        writer = collector.SourceStatusWriter(client=None, now=lambda: now)
+        recent = collector.SourceRecord("p", "Feed", "https://feed.example/rss.xml", "RSS", "RSS", "High", 90, True, "", "2026-07-02T06:00:00Z", "2026-07-02T06:00:00Z", "")
+
+        self.assertFalse(writer.changed(recent, True, "", now))
+        self.assertTrue(writer.changed(collector.replace(recent, last_fetched_at="2026-07-01T06:00:00Z"), True, "", now))
+        self.assertTrue(writer.changed(recent, False, "HTTP Error 503", now))
+        self.assertFalse(writer.changed(collector.replace(recent, last_error="HTTP Error 503"), False, "HTTP Error 503", now))
+        self.assertTrue(writer.changed(collector.replace(recent, last_error="HTTP Error 503"), True, "", now))
+        self.assertTrue(writer.changed(collector.replace(recent, last_success_at=""), True, "", now))
+
+    def test_source_status_writer_refreshes_sub_daily_sources_once_they_are_due(self):
+        now = collector.dt.datetime(2026, 7, 2, 12, tzinfo=collector.dt.timezone.utc)
+        writer = collector.SourceStatusWriter(client=None, now=lambda: now)
+        six_hourly = collector.SourceRecord("p", "Feed", "https://feed.example/rss.xml", "RSS", "RSS", "High", 90, True, "Every 6 hours", "2026-07-02T06:00:00Z", "2026-07-02T06:00:00Z", "")
+
+        self.assertTrue(writer.changed(six_hourly, True, "", now))
+        self.assertFalse(writer.changed(collector.replace(six_hourly, last_fetched_at="2026-07-02T07:00:00Z"), True, "", now))
+        self.assertFalse(collector.frequency_due(collector.replace(six_hourly, last_fetched_at=collector.iso_timestamp(now)), now))
+
+    def test_dry_run_does_not_persist_dedupe_index(self):
+        client = collector.NotionClient("token", "sources-db", "intake-db", transport=self.fake_notion())
+        with tempfile.TemporaryDirectory() as tmpdir:
+            collector.run_notion_collection(client, self.fixture_fetch, state_dir=pathlib.Path(tmpdir), dry_run=True)
+
+            self.assertFalse((pathlib.Path(tmpdir) / collector.DEDUPE_INDEX_FILENAME).exists())
+
+    def near_duplicate_candidates(self) -> list[dict]:
+        summary = "OpenAI announced GPT-5, a new model with stronger reasoning, longer context and built-in agent tooling for developers."
+        return [
+            {"Signal Title": "OpenAI releases GPT-5 with improved reasoning and agent tools", "Source Name": "Vendor Blog", "Source URL": "https://openai.example/gpt-5", "Summary": summary},
+            {"Signal Title": "OpenAI Releases GPT-5 With Improved Reasoning and Agent Tools (mirror)", "Source Name": "RSS Mirror", "Source URL": "https://mirror.example/gpt-5", "Summary": summary},
+            {"Signal Title": "Interpretability research maps circuits in language models", "Source Name": "Lab Blog", "Source URL": "https://lab.example/circuits", "Summary": "A new paper on circuits."},
+        ]
+
+    def test_near_duplicates_are_skipped_with_similarity_score(self):
+        emitted, skipped, skipped_candidates, skipped_by_reason = collector.dedupe_candidates(self.near_duplicate_candidates(), [])
+
+        self.assertEqual([item["Source Name"] for item in emitted], ["Vendor Blog", "Lab Blog"])
+        self.assertEqual(skipped, 1)
+        self.assertEqual(skipped_by_reason, {"duplicate_source_url": 0, "duplicate_title": 0, "near_duplicate": 1})
+        self.assertEqual(skipped_candidates[0]["reason"], "near_duplicate")
+        self.assertEqual(skipped_candidates[0]["matched_title"], "OpenAI releases GPT-5 with improved reasoning and agent tools")
+        self.assertGreaterEqual(skipped_candidates[0]["similarity"], collector.NEAR_DUPLICATE_THRESHOLD)
+
+    def test_near_duplicate_index_persists_and_is_not_mutated_by_dedupe(self):
+        vendor, mirror, unrelated = self.near_duplicate_candidates()
+        index = collector.DedupeIndex()
+        index.add_candidates([vendor])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = pathlib.Path(tmpdir) / collector.DEDUPE_INDEX_FILENAME
+            index.save(path)
+            loaded = collector.DedupeIndex.load(path)
+
+        emitted, _, skipped_candidates, _ = collector.dedupe_candidates([mirror, unrelated], [], loaded.keys, loaded.near_duplicates)
+
+        self.assertEqual(emitted, [unrelated])
+        self.assertEqual(skipped_candidates[0]["reason"], "near_duplicate")
+        self.assertEqual(len(loaded.near_duplicates), 1)
+
+    def test_near_duplicate_lookup_only_compares_bucket_members(self):
+        index = collector.NearDuplicateIndex()
+        for number in range(2000):
+            record = {"Signal Title": f"Archived signal {number} topic{number} keyword{number * 7}", "Summary": f"summary text {number}"}
+            index.add(record["Signal Title"], collector.minhash_signature(record))
+        vendor = self.near_duplicate_candidates()[0]
+        signature = collector.minhash_signature(vendor)
+
+        compared = {position for band in index.bands(signature) for position in index.buckets.get(band, ())}
+
+        self.assertLess(len(compared), 200)
+        self.assertIsNone(index.match(signature))
+        index.add(vendor["Signal Title"], signature)
+        self.assertEqual(index.match(signature), (vendor["Signal Title"], 1.0))
+
+    def test_dedupe_index_replaces_rows_instead_of_growing(self):
+        vendor, _, unrelated = self.near_duplicate_candidates()
+        row = {**vendor, "_notion_page_id": "row-1", "_last_edited_time": "2026-07-01T00:00:00.000Z"}
+        edited = {**row, "Signal Title": "OpenAI releases GPT-5 for developers", "_last_edited_time": "2026-07-02T00:00:00.000Z"}
+        index = collector.DedupeIndex()
+
+        index.add_candidates([vendor])
+        index.add_records([row])
+        # `edited_since` is inclusive, so the boundary row is read again by the next sync.
+        index.add_records([row, edited])
+        index.add_records([edited])
+
+        self.assertEqual(len(index.near_duplicates), 1)
+        self.assertEqual(index.near_duplicates.match(collector.minhash_signature(edited)), (edited["Signal Title"], 1.0))
+        self.assertEqual(sum(len(members) for members in index.near_duplicates.buckets.values()), len(index.near_duplicates.bands(collector.minhash_signature(edited))))
+        index.add_candidates([unrelated])
+        self.assertEqual(len(index.near_duplicates), 2)
+
+    def test_near_duplicate_index_is_bounded_in_memory(self):
+        index = collector.NearDuplicateIndex(max_entries=3)
+        records = [{"Signal Title": f"Signal {number} about topic{number}", "Source URL": f"https://a.example/{number}", "Summary": f"summary {number}"} for number in range(5)]
+
+        index.add_records(records)
+        index.add_records([records[2]])
+
+        self.assertEqual(list(index.entries), ["url:https://a.example/3", "url:https://a.example/4", "url:https://a.example/2"])
+        self.assertIsNone(index.match(collector.minhash_signature(records[0])))
+        self.assertTrue(all(key in index.entries for members in index.buckets.values() for key in members))
+        reloaded = collector.NearDuplicateIndex.from_json(index.to_json())
+        self.assertEqual(list(reloaded.entries), list(index.entries))
+
+    def test_outdated_dedupe_index_version_forces_full_read(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = pathlib.Path(tmpdir) / collector.DEDUPE_INDEX_FILENAME
+            path.write_text(json.dumps({"index_version": "collector_dedupe_index_v1", "synced_through": "2026-06-01", "keys": ["url:x"]}), encoding="utf-8")
+
+            index = collector.DedupeIndex.load(path)
+
+        self.assertEqual((index.keys, index.synced_through), (set(), ""))
+
+    def collector_daemon(self, server, tmpdir, fake=None, **kwargs):
+        fake = fake or FakeNotion(
+            [notion_page("live-source", {"Name": "Live AI Feed", "URL": f"{server.base_url}/rss.xml", "Source Type": "RSS", "Platform": "RSS", "Priority": "High", "Authority Score": 90, "Enabled": True})],
+            [notion_page("archived", {"Signal Title": "Archived signal", "Source URL": "https://example.org/archived"}, "2026-06-01T00:00:00.000Z")],
+        )
+        pool = collector.HostConnectionPool()
+        self.addCleanup(pool.close)
+        state = collector.CollectorState(pathlib.Path(tmpdir) / "state", adaptive_schedule=True)
+        daemon = collector.CollectorDaemon(
+            collector.NotionClient("token", "sources-db", "intake-db", transport=fake),
+            pool,
+            state,
+            heartbeat_path=pathlib.Path(tmpdir) / "heartbeat.json",
+            **kwargs,
+        )
+        return daemon, fake
+
+    def test_daemon_keeps_registry_warm_and_waits_for_schedule(self):
+        with FeedServer() as server, tempfile.TemporaryDirectory() as tmpdir, mock.patch("sys.stdout"):
+            daemon, fake = self.collector_daemon(server, tmpdir, tick_seconds=0, min_sleep_seconds=0)
+
+            self.assertEqual(daemon.run(max_cycles=2), 0)
+            heartbeat = json.loads((pathlib.Path(tmpdir) / "heartbeat.json").read_text(encoding="utf-8"))
+            saved_schedule = collector.FetchScheduler.load(pathlib.Path(tmpdir) / "state" / collector.SCHEDULE_FILENAME)
+
+        self.assertEqual(len(server.state["encodings"]), 1)
+        self.assertEqual(len(fake.intake), 3)
+        self.assertNotIn("filter", fake.source_queries()[0])
+        self.assertEqual(fake.source_queries()[1]["filter"]["last_edited_time"], {"on_or_after": "2026-07-01T00:00:00.000Z"})
+        self.assertEqual(fake.intake_queries()[1]["filter"]["timestamp"], "last_edited_time")
+        self.assertEqual((heartbeat["status"], heartbeat["cycles"]), ("stopped", 2))
+        self.assertEqual(heartbeat["last_cycle"]["sources_fetched"], 0)
+        self.assertIn("live-source", saved_schedule.entries)
+
+    def test_daemon_rolls_back_state_when_rows_fail(self):
+        with FeedServer() as server, tempfile.TemporaryDirectory() as tmpdir, mock.patch("sys.stdout"):
+            daemon, fake = self.collector_daemon(server, tmpdir, tick_seconds=0, min_sleep_seconds=0)
+            fake.fail_writes = True
+
+            daemon.run(max_cycles=1)
+
+        self.assertEqual(daemon.last_cycle["signal_intake_rows_failed"], 2)
+        self.assertEqual(daemon.state.http_cache.entries, {})
+        self.assertEqual(daemon.state.scheduler.entries, {})
+
+    def test_daemon_recollects_items_after_a_cycle_fails_past_collection(self):
+        with FeedServer() as server, tempfile.TemporaryDirectory() as tmpdir, mock.patch("sys.stdout"), mock.patch("sys.stderr"):
+            daemon, fake = self.collector_daemon(server, tmpdir, tick_seconds=0, min_sleep_seconds=0)
+            fake.fail_intake_queries = 1
+
+            daemon.run(max_cycles=2)
+            saved_cache = collector.HttpValidatorCache.load(pathlib.Path(tmpdir) / "state" / collector.HTTP_CACHE_FILENAME)
+
+        self.assertEqual(len(server.state["encodings"]), 2)
+        self.assertEqual(daemon.last_cycle["signal_intake_rows_created"], 2)
+        self.assertEqual(len(fake.intake), 3)
+        self.assertTrue(saved_cache.entries)
+
+    def test_daemon_stops_gracefully_while_sleeping(self):
+        with FeedServer() as server, tempfile.TemporaryDirectory() as tmpdir, mock.patch("sys.stdout"):
+            daemon, _ = self.collector_daemon(server, tmpdir, tick_seconds=60, min_sleep_seconds=60)
+            heartbeat_path = pathlib.Path(tmpdir) / "heartbeat.json"
+            thread = threading.Thread(target=daemon.run)
+            thread.start()
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline and not (heartbeat_path.exists() and '"running"' in heartbeat_path.read_text(encoding="utf-8")):
+                time.sleep(0.01)
+            daemon.stop()
+            thread.join(timeout=5)
+            heartbeat = json.loads(heartbeat_path.read_text(encoding="utf-8"))
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(heartbeat["status"], "stopped")
+
+    def test_daemon_requires_state_dir(self):
+        with mock.patch("sys.stderr"):
+            self.assertEqual(collector.main(["--daemon"]), 2)
+
     def test_source_collector_workflow_cron_is_offset_from_public_sync(self):
         collector_workflow = (ROOT / ".github" / "workflows" / "dysonx-source-collector-v1.yml").read_text(encoding="utf-8")
         public_sync_workflow = (ROOT / ".github" / "workflows" / "dysonx-notion-public-signals-sync.yml").read_text(encoding="utf-8")